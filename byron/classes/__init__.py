@@ -26,9 +26,13 @@
 # v1 / May 2023 / Squillero (GX)
 
 from .byron import *
+from .compact_genome import *
 from .dump import *
+from .fitness_cache import *
 from .fitness import *
+from .fitness_matrix import *
 from .frame import *
+from .genome import *
 from .identifiable import *
 from .individual import *
 from .macro import *
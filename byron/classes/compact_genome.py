@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# =[ HISTORY ]===============================================================
+# v1 / October 2026
+
+__all__ = ['CompactGenome']
+
+from array import array
+from typing import Any, Iterator
+
+import networkx as nx
+
+from byron.global_symbols import *
+from byron.user_messages import *
+from byron.classes.node import Node
+from byron.classes.node_reference import NodeReference
+from byron.classes.genome import Genome
+from byron.classes.parameter import ParameterABC, ParameterStructuralABC
+
+# what a node attribute holds, in the per-node schemas
+_SELEMENT, _TYPE, _PARAMETER, _OTHER = range(4)
+
+# how a parameter value is stored
+_NONE, _INT, _FLOAT, _OBJECT, _STATE = range(5)
+_STANDARD_STATES = ({'_key', '_value'}, {'_key', '_value', '_node_reference'})
+
+
+class CompactGenome:
+    r"""A compact, read-only snapshot of a genome
+
+    The genome is stored in flat typed arrays instead of a NetworkX `MultiDiGraph` with a dictionary for each node and
+    edge: node labels; edges as source/target/key/type arrays (in the original order, thus the order of successors is
+    preserved); the SElement instances; parameters as interned classes, keys, and values in typed columns (integers,
+    floats, and other objects). Node attributes are described by interned schemas, one for each kind of macro or frame.
+
+    The snapshot is lossless: `to_graph()` returns a new `MultiDiGraph` equal to the original one (same labels, same
+    order of nodes, edges, and attributes), where parameters are new objects and SElement instances are shared (they
+    are never modified, see `clone_genome`). The structure tree and the message used for the entropy can be computed
+    without rebuilding the whole graph.
+    """
+
+    __slots__ = [
+        '_graph_attributes',
+        '_labels',
+        '_selements',
+        '_node_schema',
+        '_schemas',
+        '_node_types',
+        '_node_type',
+        '_node_others',
+        '_edge_source',
+        '_edge_target',
+        '_edge_key',
+        '_edge_type',
+        '_edge_types',
+        '_edge_others',
+        '_parameter_class',
+        '_classes',
+        '_parameter_key',
+        '_value_kind',
+        '_int_values',
+        '_float_values',
+        '_object_values',
+    ]
+
+    def __init__(self, G: nx.MultiDiGraph) -> None:
+        assert check_valid_type(G, nx.MultiDiGraph)
+        self._graph_attributes = dict(G.graph)
+        self._labels = array('q')
+        self._selements = list()
+        self._node_schema = array('H')
+        self._node_type = array('B')
+        self._node_others = dict()
+        self._edge_source = array('l')
+        self._edge_target = array('l')
+        self._edge_key = array('q')
+        self._edge_type = array('B')
+        self._edge_others = dict()
+        self._parameter_class = array('H')
+        self._parameter_key = array('q')
+        self._value_kind = array('B')
+        self._int_values = array('q')
+        self._float_values = array('d')
+        self._object_values = list()
+
+        schemas, node_types, edge_types, classes = dict(), dict(), dict(), dict()
+        index = {n: i for i, n in enumerate(G)}
+        for i, (n, d) in enumerate(G.nodes(data=True)):
+            self._labels.append(n)
+            schema = list()
+            others = dict()
+            for k, v in d.items():
+                if k == '_selement':
+                    schema.append((k, _SELEMENT))
+                    self._selements.append(v)
+                elif k == '_type':
+                    schema.append((k, _TYPE))
+                    self._node_type.append(node_types.setdefault(v, len(node_types)))
+                elif isinstance(v, ParameterABC):
+                    schema.append((k, _PARAMETER))
+                    self._parameter_class.append(classes.setdefault(v.__class__, len(classes)))
+                    self._store_parameter(v)
+                else:
+                    schema.append((k, _OTHER))
+                    others[k] = v
+            if others:
+                self._node_others[i] = others
+            self._node_schema.append(schemas.setdefault(tuple(schema), len(schemas)))
+        for e, (u, v, k, d) in enumerate(G.edges(keys=True, data=True)):
+            self._edge_source.append(index[u])
+            self._edge_target.append(index[v])
+            self._edge_key.append(k)
+            self._edge_type.append(edge_types.setdefault(d.get('_type'), len(edge_types)))
+            if len(d) > 1 or '_type' not in d:
+                self._edge_others[e] = {a: x for a, x in d.items() if a != '_type'}
+
+        self._schemas = tuple(schemas)
+        self._node_types = tuple(node_types)
+        self._edge_types = tuple(edge_types)
+        self._classes = tuple(classes)
+        self._selements = tuple(self._selements)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __str__(self) -> str:
+        return f"CompactGenome ({len(self._labels)} nodes, {len(self._edge_source)} edges)"
+
+    @property
+    def top_frame(self) -> type:
+        return self._graph_attributes['top_frame']
+
+    @property
+    def nodes(self) -> tuple[Node]:
+        r"""All nodes, in the order of the original graph"""
+        return tuple(Node(n) for n in self._labels)
+
+    @property
+    def dfs_nodes(self) -> tuple[Node]:
+        r"""All nodes in depth-first preorder of the structure tree (ie. as `Individual.nodes`)"""
+        children = self._children()
+        order = list()
+        visited = bytearray(len(self._labels))
+        for root in range(len(self._labels)):
+            stack = [root]
+            while stack:
+                i = stack.pop()
+                if visited[i]:
+                    continue
+                visited[i] = 1
+                order.append(i)
+                stack.extend(reversed(children[i]))
+        return tuple(Node(self._labels[i]) for i in order)
+
+    @property
+    def structure_tree(self) -> nx.DiGraph:
+        r"""The structure tree (ie. only edges of `kind=FRAMEWORK`), for drawing and debugging"""
+        tree = nx.DiGraph()
+        tree.add_nodes_from(Node(n) for n in self._labels)
+        framework = self._edge_types.index(FRAMEWORK) if FRAMEWORK in self._edge_types else None
+        tree.add_edges_from(
+            (Node(self._labels[u]), Node(self._labels[v]))
+            for u, v, t in zip(self._edge_source, self._edge_target, self._edge_type)
+            if t == framework
+        )
+        return tree
+
+    @property
+    def as_message(self) -> list[int]:
+        r"""The same message as `Individual.as_message`, computed on the compact form"""
+        targets = dict()
+        for u, v, k in zip(self._edge_source, self._edge_target, self._edge_key):
+            targets.setdefault((u, k), self._labels[v])
+        parameters = self._parameter_states()
+        message = list()
+        for i, n in enumerate(self._labels):
+            others = self._node_others.get(i)
+            for k, kind in self._schemas[self._node_schema[i]]:
+                if kind == _SELEMENT:
+                    message.extend(self._selements[i].shannon)
+                elif kind == _PARAMETER:
+                    cls, key, value_kind, value = next(parameters)
+                    if not k.isalnum():
+                        continue
+                    if issubclass(cls, ParameterStructuralABC):
+                        value = targets.get((i, self._new_parameter(cls, key, value_kind, value).key))
+                    elif value_kind == _STATE:
+                        value = self._new_parameter(cls, key, value_kind, value).value
+                    message.append(hash((n, value)))
+                elif kind == _OTHER and k.isalnum():
+                    message.append(hash((n, others[k].value)))
+        return message
+
+    def to_graph(self) -> nx.MultiDiGraph:
+        r"""A new `Genome` (ie. a `MultiDiGraph`) with the genome"""
+        G = Genome()
+        G.graph.update(self._graph_attributes)
+        labels = [Node(n) for n in self._labels]
+        parameters = iter(self._load_parameters())
+        structural = list()
+        for i, n in enumerate(labels):
+            attributes = dict()
+            others = self._node_others.get(i)
+            for k, kind in self._schemas[self._node_schema[i]]:
+                if kind == _SELEMENT:
+                    attributes[k] = self._selements[i]
+                elif kind == _TYPE:
+                    attributes[k] = self._node_types[self._node_type[i]]
+                elif kind == _PARAMETER:
+                    attributes[k] = p = next(parameters)
+                    if isinstance(p, ParameterStructuralABC):
+                        structural.append((p, n))
+                else:
+                    attributes[k] = others[k]
+            G.add_node(n, **attributes)
+        G.add_edges_from(
+            (labels[u], labels[v], k, self._edge_data(e, t))
+            for e, (u, v, k, t) in enumerate(zip(self._edge_source, self._edge_target, self._edge_key, self._edge_type))
+        )
+        for p, n in structural:
+            p.fasten(NodeReference(G, n), rekey=False)
+        return G
+
+    # =[PRIVATE METHODS]================================================================================================
+
+    def _store_parameter(self, parameter: ParameterABC) -> None:
+        state = vars(parameter)
+        slots = parameter._slot_state
+        if slots or set(state) not in _STANDARD_STATES or type(state['_key']) is not int:
+            # the whole state, both `__dict__` and `__slots__` (eg. the `_target_frame` of global references)
+            self._value_kind.append(_STATE)
+            self._parameter_key.append(0)
+            self._object_values.append(
+                (
+                    {k: v for k, v in state.items() if k != '_node_reference'},
+                    {k: v for k, v in slots.items() if k != '_node_reference'},
+                )
+            )
+            return
+        self._parameter_key.append(state['_key'])
+        value = state['_value']
+        if value is None:
+            self._value_kind.append(_NONE)
+        elif type(value) is int and -(2**63) <= value < 2**63:
+            self._value_kind.append(_INT)
+            self._int_values.append(value)
+        elif type(value) is float:
+            self._value_kind.append(_FLOAT)
+            self._float_values.append(value)
+        else:
+            self._value_kind.append(_OBJECT)
+            self._object_values.append(value)
+
+    def _parameter_states(self) -> Iterator[tuple[type, int, int, Any]]:
+        r"""The class, key, kind, and value (or whole state, for `_STATE`) of all parameters, in order"""
+        ints, floats, objects = iter(self._int_values), iter(self._float_values), iter(self._object_values)
+        for c, key, kind in zip(self._parameter_class, self._parameter_key, self._value_kind):
+            if kind == _NONE:
+                value = None
+            elif kind == _INT:
+                value = next(ints)
+            elif kind == _FLOAT:
+                value = next(floats)
+            else:
+                value = next(objects)
+            yield self._classes[c], key, kind, value
+
+    @staticmethod
+    def _new_parameter(cls: type, key: int, kind: int, value: Any) -> ParameterABC:
+        r"""A new parameter with the stored state (structural parameters are not fastened)"""
+        p = object.__new__(cls)
+        if kind == _STATE:
+            state, slots = value
+            vars(p).update(state)
+            for k, v in slots.items():
+                setattr(p, k, v)
+        else:
+            vars(p).update(_key=key, _value=value)
+        if isinstance(p, ParameterStructuralABC):
+            p._node_reference = None
+        return p
+
+    def _load_parameters(self) -> list[ParameterABC]:
+        return [self._new_parameter(*state) for state in self._parameter_states()]
+
+    def _edge_data(self, edge: int, edge_type: int) -> dict[str, Any]:
+        data = dict()
+        if self._edge_types[edge_type] is not None:
+            data['_type'] = self._edge_types[edge_type]
+        if edge in self._edge_others:
+            data |= self._edge_others[edge]
+        return data
+
+    def _children(self) -> list[list[int]]:
+        children = [list() for _ in self._labels]
+        framework = self._edge_types.index(FRAMEWORK) if FRAMEWORK in self._edge_types else None
+        for u, v, t in zip(self._edge_source, self._edge_target, self._edge_type):
+            if t == framework:
+                children[u].append(v)
+        return children
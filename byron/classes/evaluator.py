@@ -31,33 +31,67 @@ __all__ = [
     'MakefileEvaluator',
     'ParallelScriptEvaluator',
     'ScriptEvaluator',
+    'PersistentWorkerEvaluator',
 ]
 
-from typing import Callable, Sequence
+from typing import Any, Callable, Iterator, Sequence
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from dataclasses import dataclass
-from itertools import zip_longest
+from itertools import chain, zip_longest
+from hashlib import blake2b
+from inspect import unwrap
+import marshal
 
 import os
+import queue
+import select
+import shutil
 import subprocess
 import tempfile
-from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from threading import BoundedSemaphore, Event, Lock, Thread, Timer
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 from byron.global_symbols import *
 from byron.classes.node import NODE_ZERO
 
 if joblib_available:
     import joblib
+    from joblib.externals.loky import ProcessPoolExecutor as LokyProcessPoolExecutor
 
 from byron.user_messages import *
 from byron.classes.fitness import FitnessABC
+from byron.classes.fitness_cache import FitnessCache, FitnessDatabase
 from byron.fitness import make_fitness
+from byron.classes.individual import Individual
 from byron.classes.population import Population
 from byron.registry import *
+from byron.registry import FITNESS_LOG_FILENAME
 from byron.global_symbols import *
 from byron.classes.node import NODE_ZERO
 
 
+# Fitness function of the current worker process (see `PythonEvaluator`)
+_worker_fitness_function = None
+
+
+def _initialize_worker(fitness_function: Callable[[str], FitnessABC]) -> None:
+    global _worker_fitness_function
+    _worker_fitness_function = fitness_function
+
+
+def _evaluate_in_worker(phenotype: str) -> FitnessABC:
+    return _worker_fitness_function(phenotype)
+
+
+def _frame_records(records: Sequence[str], separator: str | None) -> str:
+    r"""Concatenate `records` for a stream, either terminating each one with `separator` or prefixing its length"""
+    if separator is None:
+        return ''.join(f"{len(r.encode('utf-8'))}\n{r}" for r in records)
+    return ''.join(r + separator for r in records)
+
+
 @dataclass(kw_only=True, slots=True)
 class DebugInfo:
     cmdline: str
@@ -80,6 +114,12 @@ class EvaluatorABC(ABC):
     >>> evaluator(population)
     >>> print(evaluator.fitness_calls)
 
+    Method `evaluate_as_completed` is a generator that yields individuals as soon as they get a fitness value.
+    Parallel evaluators assign fitness values in completion order, thus a slow individual does not delay the others:
+
+    >>> for individual in evaluator.evaluate_as_completed(population):
+    ...     print(individual.fitness)
+
     *   **strip_phenotypes**: In all Evaluators, set option `strip_phenotypes` to convert the phenotype into a
         single-line string: the header is removed; leading and trailing spaces in each line are removed; empty lines
         are ignored; the final newline is removed; newlines are converted into spaces. Eg.:
@@ -97,17 +137,43 @@ class EvaluatorABC(ABC):
         then a *reasonable* number is used, usually chosen considering the CPU cores or other characteristics of the
         system.
 
+    *   **cache_size**: If set, the Evaluator remembers the fitness of the last `cache_size` (cooked) phenotypes and
+        does not evaluate them again (see :py:class:`byron.classes.fitness_cache.FitnessCache`). Individuals with
+        identical phenotypes in the same population are evaluated only once. Cache hits are not counted as fitness
+        calls.
+
+    *   **persistent_cache**: If set, the Evaluator also stores fitness values in a SQLite database that survives
+        restarts (see :py:class:`byron.classes.fitness_cache.FitnessDatabase`). Use ``True`` for the default file
+        name (``'fitness.db'``), or specify one. Values are tagged with the `identity` of the Evaluator, and are only
+        reused by an Evaluator with the same identity.
+
     Attributes
     ----------
     fitness_calls
         Number of fitness calls required so far.
+    cache
+        The fitness cache (``None`` if disabled)
+    database
+        The persistent fitness cache (``None`` if disabled)
+    identity
+        A string identifying the Evaluator and the files it relies on
     """
 
     _fitness_calls: int = 0
     _max_workers: int | None = None
+    _cache: FitnessCache | None = None
+    _database: FitnessDatabase | None = None
+    _identity: str | None = None
+    _lock: Lock
     cook: Callable[[str], str]
 
-    def __init__(self, strip_phenotypes: bool = False, max_workers: int | None = None):
+    def __init__(
+        self,
+        strip_phenotypes: bool = False,
+        max_workers: int | None = None,
+        cache_size: int | None = None,
+        persistent_cache: bool | str = False,
+    ):
         r"""
         Parameters
         ----------
@@ -115,6 +181,10 @@ class EvaluatorABC(ABC):
             ``True`` to transform into single-line strings
         max_workers
             Maximum number of concurrent workers (``None`` for a *reasonable* number)
+        cache_size
+            Maximum number of phenotypes in the fitness cache (``None`` to disable caching)
+        persistent_cache
+            Name of the fitness database, or ``True`` for the default one (``False`` to disable it)
         """
         if strip_phenotypes:
             self.cook = lambda g: EvaluatorABC.strip_phenotypes(g)
@@ -122,6 +192,18 @@ class EvaluatorABC(ABC):
             self.cook = lambda g: g
         assert max_workers is None or check_value_range(max_workers, 1)
         self._max_workers = max_workers
+        if cache_size:
+            self._cache = FitnessCache(cache_size)
+        else:
+            self._cache = None
+        if persistent_cache is True:
+            self._database = FitnessDatabase(FITNESS_LOG_FILENAME)
+        elif persistent_cache:
+            self._database = FitnessDatabase(persistent_cache)
+        else:
+            self._database = None
+        self._identity = None
+        self._lock = Lock()
 
     @abstractmethod
     def evaluate_population(self, population: Population) -> None:
@@ -133,9 +215,212 @@ class EvaluatorABC(ABC):
         r"""Number of fitness evaluations so far"""
         return self._fitness_calls
 
+    @property
+    def max_workers(self) -> int | None:
+        r"""Maximum number of concurrent evaluations (``None`` for the default, ie. the number of CPUs)"""
+        return self._max_workers
+
+    @property
+    def cache(self) -> FitnessCache | None:
+        r"""The fitness cache (``None`` if disabled)"""
+        return self._cache
+
+    @property
+    def database(self) -> FitnessDatabase | None:
+        r"""The persistent fitness cache (``None`` if disabled)"""
+        return self._database
+
+    @property
+    def identity(self) -> str:
+        r"""A string identifying the evaluator (calculated once)"""
+        if self._identity is None:
+            self._identity = self._get_identity()
+        return self._identity
+
+    def _get_identity(self) -> str:
+        r"""Calculate the identity of the evaluator (should be overridden by subclasses)"""
+        return self.__class__.__qualname__
+
+    @staticmethod
+    def _digest_files(files: Sequence[str]) -> str:
+        r"""A digest of the content of `files` (missing files are ignored)"""
+        digest = blake2b(digest_size=16)
+        for f in files:
+            digest.update(f.encode('utf-8') + b'\0')
+            if os.path.isfile(f):
+                with open(f, 'rb') as content:
+                    digest.update(content.read())
+        return digest.hexdigest()
+
+    def _pending_phenotypes(self, population: Population) -> list[tuple[str, str, list[Individual]]]:
+        r"""Dump individuals without a fitness and returns the phenotypes that actually need an evaluation
+
+        Individuals whose phenotype is found in the cache, or in the persistent cache, get their fitness immediately.
+        If caching is enabled, individuals sharing the same phenotype are grouped together. Each element of the
+        returned list is a tuple `(key, phenotype, individuals)`.
+        """
+        pending = dict()
+        for i, I in population.not_finalized_individuals:
+            phenotype = self.cook(population.dump_individual(i))
+            if self._cache is None and self._database is None:
+                pending[i] = (None, phenotype, [I])
+                continue
+            key = FitnessCache.key(phenotype)
+            if key in pending:
+                pending[key][2].append(I)
+            elif self._cache is not None and (fitness := self._cache.get(key)) is not None:
+                logger.debug(f"{self.__class__.__name__}: Found fitness of {I} in cache")
+                I.fitness = fitness
+            else:
+                pending[key] = (key, phenotype, [I])
+
+        if self._database is not None and pending:
+            for key, fitness in self._database.get_many(self.identity, pending.keys()).items():
+                logger.debug(f"{self.__class__.__name__}: Found fitness of {pending[key][2][0]} in database")
+                if self._cache is not None:
+                    self._cache.put(key, fitness)
+                for I in pending.pop(key)[2]:
+                    I.fitness = fitness
+        return list(pending.values())
+
+    def evaluate_as_completed(self, population: Population) -> Iterator[Individual]:
+        r"""Evaluate individuals without a fitness value, yielding each one as soon as its fitness is set
+
+        The default implementation evaluates the whole population with `evaluate_population`, and then yields the
+        individuals.
+        """
+        individuals = [I for _, I in population.not_finalized_individuals]
+        self(population)
+        yield from individuals
+
+    def _stream_evaluation(
+        self,
+        population: Population,
+        pool: Executor,
+        evaluate: Callable[[str], Any],
+        make_fitness: Callable[[Any, list[Individual]], FitnessABC],
+    ) -> Iterator[Individual]:
+        r"""Submit pending phenotypes to `pool` and set the fitness of individuals in completion order
+
+        Individuals are dumped by a producer thread, and each phenotype is submitted to the pool as soon as it is
+        available, thus the workers start evaluating while the rest of the population is still being dumped. At most
+        `2 * max_workers` phenotypes are in flight (ie. dumped but not yet evaluated): a slot is freed only when an
+        evaluation completes, thus memory does not grow with the size of the population. Each phenotype is passed to
+        `evaluate` in the pool, then the result is converted into a fitness by `make_fitness` in the calling thread.
+        Individuals whose fitness is found in the caches are yielded as soon as they are dumped.
+        """
+        events = queue.SimpleQueue()
+        # producer stage: a bounded number of dumped phenotypes not yet evaluated
+        slots = BoundedSemaphore(2 * (self._max_workers or os.cpu_count() or 1))
+        stop = Event()
+        producer = Thread(
+            target=self._dump_phenotypes, args=(population, events, slots, stop), name="byron$dump", daemon=True
+        )
+        producer.start()
+
+        futures = dict()
+        in_flight = dict()
+        dumping = True
+        try:
+            while dumping or futures:
+                event, payload = events.get()
+                if event == 'error':
+                    raise payload
+                elif event == 'done':
+                    dumping = False
+                elif event == 'phenotype':
+                    I, P = payload
+                    key = None if self._cache is None and self._database is None else FitnessCache.key(P)
+                    if key in in_flight:
+                        slots.release()
+                        in_flight[key].append(I)
+                    elif (fitness := self._cached_fitness(key)) is not None:
+                        slots.release()
+                        logger.debug(f"{self.__class__.__name__}: Found fitness of {I} in cache")
+                        I.fitness = fitness
+                        yield I
+                    else:
+                        group = [I]
+                        if key is not None:
+                            in_flight[key] = group
+                        future = pool.submit(evaluate, P)
+                        futures[future] = (key, group)
+                        future.add_done_callback(lambda f: (slots.release(), events.put(('result', f))))
+                elif event == 'result':
+                    key, group = futures.pop(payload)
+                    in_flight.pop(key, None)
+                    self._set_fitness(key, group, make_fitness(payload.result(), group))
+                    yield from group
+        finally:
+            stop.set()
+            for future in futures:
+                future.cancel()
+            producer.join()
+            if self._database is not None:
+                self._database.commit()
+
+    def _dump_phenotypes(
+        self, population: Population, events: queue.SimpleQueue, slots: BoundedSemaphore, stop: Event
+    ) -> None:
+        r"""Producer stage of `_stream_evaluation`: put the phenotypes of individuals without a fitness in `events`"""
+        try:
+            for i, I in population.not_finalized_individuals:
+                # NOTE: slots are freed by the evaluations, the producer must not wait forever if the consumer stops
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                events.put(('phenotype', (I, self.cook(population.dump_individual(i)))))
+            events.put(('done', None))
+        except Exception as exception:
+            events.put(('error', exception))
+
+    def _cached_fitness(self, key: str | None) -> FitnessABC | None:
+        r"""The fitness of the phenotype with the given `key` from the cache or the persistent cache (if any)"""
+        if key is None:
+            return None
+        if self._cache is not None and (fitness := self._cache.get(key)) is not None:
+            return fitness
+        if (
+            self._database is not None
+            and (fitness := self._database.get_many(self.identity, [key]).get(key)) is not None
+        ):
+            if self._cache is not None:
+                self._cache.put(key, fitness)
+            return fitness
+        return None
+
+    def _set_fitness(self, key: str | None, individuals: Sequence[Individual], fitness: FitnessABC) -> None:
+        r"""Count a fitness call, update the caches, and set the fitness of `individuals`"""
+        with self._lock:
+            self._fitness_calls += 1
+        if key is not None and self._cache is not None:
+            self._cache.put(key, fitness)
+        if key is not None and self._database is not None:
+            self._database.put(self.identity, key, fitness)
+        for I in individuals:
+            I.fitness = fitness
+
     def __call__(self, population: Population) -> None:
         r"""Call `evaluate_population`: evaluate individuals without a fitness value"""
         self.evaluate_population(population)
+        if self._database is not None:
+            self._database.commit()
+
+    def close(self) -> None:
+        r"""Release all resources held by the evaluator (eg. pools of workers, databases)
+
+        The evaluator can still be used after `close`, resources are acquired again when needed.
+        """
+        if self._database is not None:
+            self._database.close()
+
+    def __enter__(self) -> 'EvaluatorABC':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     @staticmethod
     def strip_phenotypes(raw_dump: str) -> str:
@@ -175,13 +460,20 @@ class PythonEvaluator(EvaluatorABC):
         resources (eg. files, REST APIs, databases, external tools).
 
     *   process-based (based on `joblib` [2]_): Multiple functions are evaluated in different processes.
-        Processes-based paralelism does not suffer from the GIL limitation [1]_, but starting/stopping them
-        introduces considerable overhead, thus this method is likely to be useful only when the fitness function
-        is computationally intensive.
+        Processes-based paralelism does not suffer from the GIL limitation [1]_, but each phenotype and each result
+        must be serialized, thus this method is likely to be useful only when the fitness function is
+        computationally intensive.
 
     The `backend` parameters select the type of parallelism: ``None`` for sequential evaluation, ```thread_pool```
     for threads, ``'joblib'`` for processes.
 
+    The pool of threads or processes is created on the first evaluation and then reused for the whole run; worker
+    processes receive the fitness function only once, when they are started. Call `close`, or use the evaluator as a
+    context manager, to shut the pool down:
+
+    >>> with byron.evaluator.PythonEvaluator(fitness, backend='joblib') as evaluator:
+    ...     byron.ea.vanilla_ea(top_frame, evaluator)
+
     Use option `strip_phenotypes` (see :py:class:`byron.classes.evaluator.EvaluatorABC`) to convert the phenotype into a
     single-line string.
 
@@ -206,6 +498,7 @@ class PythonEvaluator(EvaluatorABC):
 
     _function: Callable
     _function_name: str
+    _pool: Executor | None = None
 
     def __init__(self, fitness_function: Callable[[str], FitnessABC], backend: str | None = None, **kwargs) -> None:
         r"""
@@ -235,6 +528,50 @@ class PythonEvaluator(EvaluatorABC):
         self._fitness_function = fitness_function
         self._backend = backend
         self._fitness_function_name = fitness_function.__qualname__
+        self._pool = None
+
+    def __del__(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+    @property
+    def pool(self) -> Executor | None:
+        r"""The pool of workers (created on first access, ``None`` for sequential evaluators)"""
+        if self._pool is not None or not self._backend:
+            return self._pool
+        # NOTE: the evaluator may be called from different threads (eg. by `steady_state_ea`)
+        with self._lock:
+            if self._pool is not None:
+                pass
+            elif self._backend == 'thread_pool':
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix=self._fitness_function_name
+                )
+            elif self._backend == 'joblib':
+                self._pool = LokyProcessPoolExecutor(
+                    max_workers=self._max_workers if self._max_workers else joblib.cpu_count(),
+                    initializer=_initialize_worker,
+                    initargs=(self._fitness_function,),
+                )
+            else:
+                raise NotImplementedError(self._backend)
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        super().close()
+
+    def evaluate_as_completed(self, population: Population) -> Iterator[Individual]:
+        if self._backend == 'thread_pool':
+            yield from self._stream_evaluation(population, self.pool, self._fitness_function, lambda f, _: f)
+        elif self._backend == 'joblib':
+            yield from self._stream_evaluation(population, self.pool, _evaluate_in_worker, lambda f, _: f)
+        elif not self._backend:
+            yield from super().evaluate_as_completed(population)
+        else:
+            raise NotImplementedError(self._backend)
 
     def __str__(self):
         if not self._backend:
@@ -246,45 +583,90 @@ class PythonEvaluator(EvaluatorABC):
         else:
             raise NotImplementedError
 
+    def _get_identity(self) -> str:
+        digest = blake2b(marshal.dumps(unwrap(self._fitness_function).__code__), digest_size=16).hexdigest()
+        return f"{self.__class__.__qualname__}❬{self._fitness_function_name}❭/{digest}"
+
     def evaluate_population(self, population: Population) -> None:
-        individuals = [
-            (i, I, self.cook(population.dump_individual(i))) for i, I in population.not_finalized_individuals
-        ]
+        if self._backend and self._max_workers != 1:
+            # dumping is overlapped with the evaluation (see `EvaluatorABC._stream_evaluation`)
+            for _ in self.evaluate_as_completed(population):
+                pass
+            return
+
+        individuals = self._pending_phenotypes(population)
         if not individuals:
             logger.debug(f"PythonEvaluator: All individuals in the population have already been finalized")
             return
 
-        if self._max_workers == 1 or not self._backend:
-            # Simple, sequential, Python evaluator
-            for _, I, P in individuals:
-                self._fitness_calls += 1
-                I.fitness = self._fitness_function(P)
-        elif self._backend == 'thread_pool':
-            with ThreadPoolExecutor(
-                max_workers=self._max_workers, thread_name_prefix=self._fitness_function_name
-            ) as pool:
-                for I, f in zip(
-                    (I for _, I, _ in individuals), pool.map(self._fitness_function, (P for _, _, P in individuals))
-                ):
-                    self._fitness_calls += 1
-                    I.fitness = f
-        elif self._backend == 'joblib':
-            jobs = list(joblib.delayed(self._fitness_function)(P) for _, _, P in individuals)
-            values = joblib.Parallel(n_jobs=self._max_workers if self._max_workers else -1, return_as="generator")(jobs)
-            for I, f in zip((I for _, I, _ in individuals), values):
-                self._fitness_calls += 1
-                I.fitness = f
-        else:
-            raise NotImplementedError(self._backend)
+        # Simple, sequential, Python evaluator
+        for key, P, I in individuals:
+            self._set_fitness(key, I, self._fitness_function(P))
+
+
+class _SandboxPool:
+    r"""A pool of working directories, each one prepared with symlinks to a fixed set of files
+
+    Sandboxes are created on demand, thus there are as many sandboxes as concurrent evaluations. When a sandbox is
+    released, everything but the prepared symlinks is removed from it.
+    """
+
+    def __init__(self, files: Sequence[str], *, base_dir: str, root: str | None = None) -> None:
+        self._files = tuple(files)
+        self._base_dir = base_dir
+        self._root = root
+        self._idle = queue.SimpleQueue()
+        self._sandboxes = list()
+        self._lock = Lock()
+
+    def __del__(self) -> None:
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._sandboxes)
+
+    def acquire(self) -> str:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        sandbox = tempfile.mkdtemp(prefix="byron_", dir=self._root)
+        for f in self._files:
+            assert os.path.exists(
+                f
+            ), f"FileNotFoundError (paranoia check): No such file or directory: '{f}' (cwd was '{self._base_dir}')"
+            os.symlink(os.path.join(self._base_dir, f), os.path.join(sandbox, f))
+        with self._lock:
+            self._sandboxes.append(sandbox)
+        logger.debug(f"_SandboxPool: Created sandbox {sandbox!r}")
+        return sandbox
+
+    def release(self, sandbox: str) -> None:
+        for entry in os.scandir(sandbox):
+            if entry.name in self._files:
+                pass
+            elif entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                os.unlink(entry.path)
+        self._idle.put(sandbox)
+
+    def clear(self) -> None:
+        with self._lock:
+            for sandbox in self._sandboxes:
+                shutil.rmtree(sandbox, ignore_errors=True)
+            self._sandboxes.clear()
+            self._idle = queue.SimpleQueue()
 
 
 class MakefileEvaluator(EvaluatorABC):
     r"""A parallel `Evaluator` exploiting the good old `make` [1]_.
 
     The `MakefileEvaluator` simplify the use of an external `make` command. For each individual to be evaluated: it
-    creates a temporary directory; puts in the directory the `Makefile` and all other necessary files; dumps the
+    takes a working directory (a *sandbox*) containing the `Makefile` and all other necessary files; dumps the
     phenotype of the individual; enters the directory (chdir) and calls `make`; gets the result from the standard
-    output; and eventually destroys the temporary directory.
+    output; and eventually cleans the sandbox. Sandboxes are prepared once and reused, between two evaluations only
+    the files created by `make` are removed.
 
     Different individuals are evaluated in parallel by different threads. The GIL [2]_ creates no problem as each
     thread calls a `subprocess.run` and then waits for its completion.
@@ -299,6 +681,13 @@ class MakefileEvaluator(EvaluatorABC):
     *   `make_flags`: Flags for make. Default is just ``'-s'`` (be quiet)
     *   `makefile`: Name of the Makefile itself
     *   `timeout`: Number of seconds to wait for make completion (default: 60, use ``None`` to wait indefinitely)
+    *   `sandbox_root`: Directory where sandboxes are created (eg. ``'/dev/shm'``, default: the system temporary
+        directory). Sandboxes are deleted by `close`
+    *   `build_target`, `build_products`, `build_cache`: If `build_target` is specified, the files `build_products`
+        generated by ``make build_target`` are stored in the directory `build_cache`, keyed by a hash of the phenotype
+        and of the content of the `makefile` and of the `required_files`. When the same phenotype is seen again, the
+        cached products are copied in the sandbox (with a fresh timestamp), so `make` skips the build and only runs
+        the measurement step. Much like `ccache` [4]_.
 
     Use option `strip_phenotypes` (see :py:class:`byron.classes.evaluator.EvaluatorABC`) to convert the phenotype into a
     single-line string.
@@ -311,6 +700,7 @@ class MakefileEvaluator(EvaluatorABC):
     .. [1] https://en.wikipedia.org/wiki/Make_%28software%29
     .. [2] https://docs.python.org/3/glossary.html#term-global-interpreter-lock
     .. [3] https://en.wikipedia.org/wiki/Symbolic_link
+    .. [4] https://ccache.dev/
 
     """
 
@@ -321,6 +711,11 @@ class MakefileEvaluator(EvaluatorABC):
     _required_files: tuple[str]
     _byron_base_dir: str
     _timeout: int | None
+    _sandboxes: _SandboxPool
+    _build_target: str | None
+    _build_products: tuple[str]
+    _build_cache: str
+    _build_digest: str | None = None
 
     def __init__(
         self,
@@ -331,6 +726,10 @@ class MakefileEvaluator(EvaluatorABC):
         make_flags: Sequence[str] = ('-s',),
         makefile='Makefile',
         timeout: int | None = 60,
+        sandbox_root: str | None = None,
+        build_target: str | None = None,
+        build_products: Sequence[str] = (),
+        build_cache: str = 'byron_build_cache',
         **kwargs,
     ) -> None:
         r"""
@@ -348,6 +747,14 @@ class MakefileEvaluator(EvaluatorABC):
             Files that need to be present for the makefile to work in addition to `makefile` and `filename`
         timeout
             Seconds to wait for make completion (``None`` indefinitely)
+        sandbox_root
+            Directory where sandboxes are created (``None`` for the default temporary directory)
+        build_target
+            Make target generating the `build_products` (``None`` to disable the build cache)
+        build_products
+            Files generated by `build_target` that are cached
+        build_cache
+            Directory of the build cache
         kwargs
             Extra parameters for :class:`byron.classes.evaluator.EvaluatorABC` (ie. `strip_phenotypes`, `max_workers`)
         """
@@ -359,6 +766,14 @@ class MakefileEvaluator(EvaluatorABC):
         self._required_files = tuple(required_files)
         self._timeout = timeout
         self._byron_base_dir = os.getcwd()
+        self._sandboxes = _SandboxPool(
+            [self._makefile, *self._required_files], base_dir=self._byron_base_dir, root=sandbox_root
+        )
+        assert build_target is None or build_products, f"ValueError: No build products for target '{build_target}'"
+        self._build_target = build_target
+        self._build_products = tuple(build_products)
+        self._build_cache = os.path.join(self._byron_base_dir, build_cache)
+        self._build_digest = None
 
         for f in self._required_files:
             if not os.path.exists(f):
@@ -375,15 +790,56 @@ class MakefileEvaluator(EvaluatorABC):
     def __str__(self):
         return f"{self.__class__.__name__}❬{self._filename}❭"
 
+    def _get_identity(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}❬{self._filename}❭/{' '.join([self._make_command, *self._make_flags])}/"
+            + EvaluatorABC._digest_files([self._makefile, *self._required_files])
+        )
+
+    def close(self) -> None:
+        self._sandboxes.clear()
+        super().close()
+
+    def _build(self, phenotype: str, tmp_dir: str) -> None:
+        r"""Get the build products from the cache, or make them and store them in the cache"""
+        if self._build_digest is None:
+            self._build_digest = EvaluatorABC._digest_files([self._makefile, *self._required_files])
+        key = blake2b((self._build_digest + '\0' + phenotype).encode('utf-8'), digest_size=20).hexdigest()
+        entry = os.path.join(self._build_cache, key)
+
+        if os.path.isdir(entry):
+            logger.debug(f"MakefileEvaluator: Found build products in {entry!r}")
+            for f in self._build_products:
+                shutil.copy(os.path.join(entry, f), os.path.join(tmp_dir, f))
+            return
+
+        subprocess.run(
+            [self._make_command, *self._make_flags, self._build_target],
+            cwd=tmp_dir,
+            universal_newlines=True,
+            shell=False,
+            check=True,
+            text=True,
+            timeout=self._timeout,
+            capture_output=True,
+        )
+        os.makedirs(self._build_cache, exist_ok=True)
+        scratch = tempfile.mkdtemp(prefix=f"{key}_", dir=self._build_cache)
+        for f in self._build_products:
+            shutil.copy(os.path.join(tmp_dir, f), os.path.join(scratch, f))
+        try:
+            os.rename(scratch, entry)
+        except OSError:
+            # someone else stored the very same products in the meantime
+            shutil.rmtree(scratch, ignore_errors=True)
+
     def _evaluate(self, phenotype: str):
-        with tempfile.TemporaryDirectory(prefix="byron_", ignore_cleanup_errors=True) as tmp_dir:
-            for f in [self._makefile, *self._required_files]:
-                assert os.path.exists(
-                    f
-                ), f"FileNotFoundError (paranoia check): No such file or directory: '{f}' (cwd was '{self._byron_base_dir}')"
-                os.symlink(os.path.join(self._byron_base_dir, f), os.path.join(tmp_dir, f))
+        tmp_dir = self._sandboxes.acquire()
+        try:
             with open(os.path.join(tmp_dir, self._filename), "w") as dump:
                 dump.write(phenotype)
+            if self._build_target:
+                self._build(phenotype, tmp_dir)
             result = subprocess.run(
                 [self._make_command, *self._make_flags],
                 cwd=tmp_dir,
@@ -400,38 +856,36 @@ class MakefileEvaluator(EvaluatorABC):
                     f"MakefileEvaluator:evaluate: Command '{' '.join([self._make_command, *self._make_flags])}' in {tmp_dir} returned empty stdout"
                     + (f" and stderr '{result.stderr}')" if result.stderr else "")
                 )
+        finally:
+            self._sandboxes.release(tmp_dir)
         return result
 
-    def evaluate_population(self, population: Population) -> None:
-        indexes = list()
-        phenotypes = list()
-        for i, g in population:
-            if not g.finalized:
-                indexes.append(i)
-                phenotypes.append(self.cook(population.dump_individual(i)))
-        if not indexes:
-            logger.debug(f"MakefileEvaluator: All individuals in the population have already been finalized")
-            return
+    @staticmethod
+    def _make_fitness(result: subprocess.CompletedProcess, individuals: list[Individual]) -> FitnessABC:
+        if result is None:
+            raise RuntimeError(f"Thread failed (returned None)")
+        value = [float(r) for r in result.stdout.split()]
+        if len(value) == 1:
+            value = value[0]
+        return make_fitness(value)
 
+    def evaluate_as_completed(self, population: Population) -> Iterator[Individual]:
         with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="byron$") as pool:
-            for i, result in zip(indexes, pool.map(self._evaluate, phenotypes)):
-                self._fitness_calls += 1
-                if result is None:
-                    raise RuntimeError(f"Thread failed (returned None)")
-                else:
-                    value = [float(r) for r in result.stdout.split()]
-                    if len(value) == 1:
-                        value = value[0]
-                    fitness = make_fitness(value)
-                    population[i].fitness = fitness
+            yield from self._stream_evaluation(population, pool, self._evaluate, self._make_fitness)
+
+    def evaluate_population(self, population: Population) -> None:
+        for _ in self.evaluate_as_completed(population):
+            pass
 
 
 class ScriptEvaluator(EvaluatorABC):
     r"""An `Evaluator` calling a shell script.
 
     The `ScriptEvaluator` allows using an external script as an external evaluator.
-    All individual phenotypes requiring evaluation are dumped in the current directory, then the script
-    is called passing the filenames as arguments.
+    All individual phenotypes requiring evaluation are dumped in a private temporary directory inside the current
+    one, then the script is called passing the filenames as arguments. Alternatively, phenotypes can be streamed to
+    the script over its standard input, and no file is written at all. In both cases, the script is expected to
+    print one line with the fitness for each phenotype, in order.
 
     *   `script_name`: The name of the script. Must be *executable* by a shell, thus it may require the ``+x``
         permission on un*x/macos systems, and it may require the specification of the path (eg. ``./fitness.sh``).
@@ -439,6 +893,12 @@ class ScriptEvaluator(EvaluatorABC):
     *   `filename_format`: F-string [1]_ with the filenames of the phenotypes. Variable ``i`` is number of the
         individual. Default is "phenotype_{i:x}.txt"
     *   `timeout`: Maximum number of seconds to wait for the script. Use ``None`` to disable timeout.
+    *   `chunk_size`: Maximum number of phenotypes passed to a single invocation of the script. If set, the
+        population is split into chunks that are evaluated concurrently by different invocations of the script. Use
+        ``None`` to call the script once with all phenotypes.
+    *   `stdin`: Send the phenotypes to the standard input of the script instead of passing filenames.
+    *   `record_separator`: String terminating each phenotype sent over the standard input (default: ``'\0'``). Use
+        ``None`` to prefix each phenotype with its length in bytes followed by a newline instead.
 
     Use option `strip_phenotypes` (see :py:class:`byron.classes.evaluator.EvaluatorABC`) to convert the phenotype into a
     single-line string.
@@ -454,6 +914,9 @@ class ScriptEvaluator(EvaluatorABC):
 
     _file_name: str
     _script_name: str
+    _chunk_size: int | None
+    _stdin: bool
+    _record_separator: str | None
 
     def __init__(
         self,
@@ -462,6 +925,9 @@ class ScriptEvaluator(EvaluatorABC):
         *,
         filename_format: str = 'phenotype_{i:x}.txt',
         timeout: int | None = 60,
+        chunk_size: int | None = None,
+        stdin: bool = False,
+        record_separator: str | None = '\0',
         **kwargs,
     ) -> None:
         r"""
@@ -473,57 +939,151 @@ class ScriptEvaluator(EvaluatorABC):
             Optional arguments before the list of files with phenotypes
         filename_format
             F-string for building phenotype file names
+        chunk_size
+            Maximum number of phenotypes per invocation of the script (``None`` for no limit)
+        stdin
+            Stream phenotypes over the standard input of the script instead of writing files
+        record_separator
+            Terminator of each phenotype on the standard input (``None`` for length-prefix framing)
         kwargs
             Extra parameters for :class:`byron.classes.evaluator.EvaluatorABC` (ie. `strip_phenotypes`, `max_workers`)
         """
         super().__init__(**kwargs)
+        assert chunk_size is None or check_value_range(chunk_size, 1)
         self._script_name = script_name
         self._script_options = args if args else list()
         self._file_name = filename_format
         self._timeout = timeout
+        self._chunk_size = chunk_size
+        self._stdin = stdin
+        self._record_separator = record_separator
 
     def __str__(self):
         return f"{self.__class__.__name__}❬{self._script_name}❭"
 
+    def _get_identity(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}❬{self._script_name}❭/{' '.join(self._script_options)}/"
+            + EvaluatorABC._digest_files([self._script_name])
+        )
+
+    def _run_script(self, phenotypes: list[str]) -> Iterator[str]:
+        r"""Call the script on `phenotypes` and yield the non-empty lines of its output as soon as they are read
+
+        `phenotypes` are either file names passed as arguments, or the phenotypes themselves streamed over stdin.
+        """
+        command = [self._script_name, *self._script_options, *([] if self._stdin else phenotypes)]
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE if self._stdin else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding='utf-8',
+        )
+        stderr = list()
+        helpers = [Thread(target=lambda: stderr.append(process.stderr.read()), daemon=True)]
+        if self._stdin:
+            helpers.append(
+                Thread(
+                    target=ScriptEvaluator._feed,
+                    args=(process.stdin, _frame_records(phenotypes, self._record_separator)),
+                    daemon=True,
+                )
+            )
+        expired = Event()
+        watchdog = None
+        if self._timeout is not None:
+            watchdog = Timer(self._timeout, lambda: (expired.set(), process.kill()))
+            watchdog.start()
+        for t in helpers:
+            t.start()
+
+        results = 0
+        try:
+            for line in process.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                results += 1
+                assert results <= len(phenotypes), (
+                    f"{PARANOIA_VALUE_ERROR}: Number of results and number of individual mismatch: "
+                    + f"found more than {len(phenotypes)}"
+                )
+                yield line
+            process.wait()
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            for t in helpers:
+                t.join()
+            process.stdout.close()
+            process.stderr.close()
+
+        if expired.is_set():
+            raise subprocess.TimeoutExpired(command, self._timeout, stderr=''.join(stderr))
+        elif process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, command, stderr=''.join(stderr))
+        elif not results:
+            raise RuntimeError(f"Process returned empty stdout (stderr: '{''.join(stderr)}')")
+        assert results == len(phenotypes), (
+            f"{PARANOIA_VALUE_ERROR}: Number of results and number of individual mismatch: "
+            + f"found {results} expected {len(phenotypes)}"
+        )
+
+    @staticmethod
+    def _feed(stream, data: str) -> None:
+        try:
+            stream.write(data)
+            stream.close()
+        except (BrokenPipeError, ValueError):
+            # the script exited without reading all its input: its exit status tells the rest of the story
+            pass
+
+    def _set_fitness_from_lines(self, individuals: list[tuple[str, str, list[Individual]]], lines: Iterator[str]):
+        for (key, _, I), line in zip(individuals, lines):
+            value = [float(r) for r in line.split()]
+            if len(value) == 1:
+                value = value[0]
+            fitness = make_fitness(value)
+            self._set_fitness(key, I, fitness)
+        for _ in lines:
+            # exhaust the generator to check for errors
+            pass
+
     def evaluate_population(self, population: Population) -> None:
-        individuals = population.not_finalized_individuals
+        individuals = self._pending_phenotypes(population)
         if not individuals:
             logger.debug(f"ScriptEvaluator: All individuals in the population have already been finalized")
             return
-        files = list()
-        for idx, ind in individuals:
-            self._fitness_calls += 1
-            files.append(self._file_name.format(i=population.individuals[idx].id))
-            with open(files[-1], "w") as dump:
-                dump.write(self.cook(population.dump_individual(idx)))
-
-        result = subprocess.run(
-            [self._script_name, *self._script_options, *files],
-            universal_newlines=True,
-            check=True,
-            text=True,
-            timeout=self._timeout,
-            capture_output=True,
-        )
 
-        if result is None:
-            raise RuntimeError("Process failed (returned None)")
-        elif not result.stdout:
-            raise RuntimeError(f"Process returned empty stdout (stderr: '{result.stderr}')")
+        chunk_size = self._chunk_size if self._chunk_size else len(individuals)
+        chunks = [individuals[i : i + chunk_size] for i in range(0, len(individuals), chunk_size)]
+        if self._stdin:
+            run_dir = nullcontext()
         else:
-            results = list(filter(lambda s: bool(s), result.stdout.split("\n")))
-            assert len(results) == len(
-                individuals
-            ), f"{PARANOIA_VALUE_ERROR}: Number of results and number of individual mismatch: found {len(results)} expected {len(individuals)}"
-            for ind, line in zip_longest(individuals, results):
-                value = [float(r) for r in line.split()]
-                if len(value) == 1:
-                    value = value[0]
-                fitness = make_fitness(value)
-                ind[1].fitness = fitness
-
-        for f in files:
-            os.unlink(f)
+            run_dir = tempfile.TemporaryDirectory(prefix="byron_", dir=os.curdir, ignore_cleanup_errors=True)
+        with run_dir as run_dir:
+            if self._stdin:
+                phenotypes = [[P for _, P, _ in c] for c in chunks]
+            else:
+                phenotypes = list()
+                for chunk in chunks:
+                    phenotypes.append(list())
+                    for _, P, I in chunk:
+                        phenotypes[-1].append(os.path.join(run_dir, self._file_name.format(i=I[0].id)))
+                        with open(phenotypes[-1][-1], "w") as dump:
+                            dump.write(P)
+
+            if len(chunks) == 1:
+                # results are processed while the script is still running
+                self._set_fitness_from_lines(individuals, self._run_script(phenotypes[0]))
+            else:
+                with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="byron$") as pool:
+                    results = pool.map(lambda p: list(self._run_script(p)), phenotypes)
+                    self._set_fitness_from_lines(individuals, chain.from_iterable(results))
 
 
 class ParallelScriptEvaluator(EvaluatorABC):
@@ -547,6 +1107,10 @@ class ParallelScriptEvaluator(EvaluatorABC):
     *   `make_flags`: Flags for make. Default is just ``'-s'`` (be quiet)
     *   `makefile`: Name of the Makefile itself
     *   `timeout`: Number of seconds to wait for make completion (default: 60, use ``None`` to wait indefinitely)
+    *   `stdin`: Send the phenotype to the standard input of the script instead of dumping it in `filename`. If no
+        other file is required, the script is run in the current directory and nothing is written on disk
+    *   `record_separator`: String terminating the phenotype sent over the standard input (default: ``'\0'``). Use
+        ``None`` to prefix the phenotype with its length in bytes followed by a newline instead
 
     Use option `strip_phenotypes` (see :py:class:`byron.classes.evaluator.EvaluatorABC`) to convert the phenotype into a
     single-line string.
@@ -572,12 +1136,14 @@ class ParallelScriptEvaluator(EvaluatorABC):
     def __init__(
         self,
         script: str,
-        filename: str,
+        filename: str | None,
         *,
         other_required_files: Sequence[str] = (),
         flags: Sequence[str] = tuple(),
         timeout: int | None = 60,
         default_result: str = '',
+        stdin: bool = False,
+        record_separator: str | None = '\0',
         **kwargs,
     ) -> None:
         r"""
@@ -597,83 +1163,289 @@ class ParallelScriptEvaluator(EvaluatorABC):
             Seconds to wait for make completion (``None`` indefinitely)
         default_result
             Default result if the script returns non-zero exit status
+        stdin
+            Stream the phenotype over the standard input of the script instead of writing `filename`
+        record_separator
+            Terminator of the phenotype on the standard input (``None`` for length-prefix framing)
         kwargs
             Extra parameters for :class:`byron.classes.evaluator.EvaluatorABC` (ie. `strip_phenotypes`, `max_workers`)
         """
         super().__init__(**kwargs)
+        assert stdin or filename, f"{PARANOIA_VALUE_ERROR}: 'filename' must be specified unless 'stdin' is used"
         self._script = script
         self._filename = filename
         self._flags = tuple(flags)
         self._other_required_files = tuple(other_required_files)
         self._timeout = timeout
         self._default_result = default_result
+        self._stdin = stdin
+        self._record_separator = record_separator
         self._byron_base_dir = os.getcwd()
 
     def __str__(self):
-        return f"{self.__class__.__name__}❬{self._filename}❭"
+        return f"{self.__class__.__name__}❬{self._filename or self._script}❭"
+
+    def _get_identity(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}❬{self._script}❭/{' '.join([*self._flags, *self._command_filename])}/"
+            + f"{self._stdin and repr(self._record_separator)}/"
+            + EvaluatorABC._digest_files([self._script, *self._other_required_files])
+        )
+
+    @property
+    def _command_filename(self) -> list[str]:
+        return [] if self._stdin else [self._filename]
 
     def _evaluate(self, phenotype: str) -> DebugInfo:
+        if self._stdin and not self._other_required_files:
+            return self._run(phenotype, self._byron_base_dir)
         with tempfile.TemporaryDirectory(prefix="byron_", ignore_cleanup_errors=True) as tmp_dir:
             for f in [*self._other_required_files]:
                 assert os.path.exists(
                     f
                 ), f"FileNotFoundError (paranoia check): No such file or directory: '{f}' (cwd was '{self._byron_base_dir}')"
                 os.symlink(os.path.join(self._byron_base_dir, f), os.path.join(tmp_dir, f))
-            with open(os.path.join(tmp_dir, self._filename), "w") as dump:
-                dump.write(phenotype)
-            result = subprocess.run(
-                [self._script, *self._flags, self._filename, *self._other_required_files],
-                cwd=tmp_dir,
-                universal_newlines=True,
-                shell=False,
-                check=False,
-                text=True,
-                timeout=self._timeout,
-                capture_output=True,
-            )
+            if not self._stdin:
+                with open(os.path.join(tmp_dir, self._filename), "w") as dump:
+                    dump.write(phenotype)
+            return self._run(phenotype, tmp_dir)
 
+    def _run(self, phenotype: str, cwd: str) -> DebugInfo:
+        command = [self._script, *self._flags, *self._command_filename, *self._other_required_files]
+        result = subprocess.run(
+            command,
+            cwd=cwd,
+            input=_frame_records([phenotype], self._record_separator) if self._stdin else None,
+            encoding='utf-8',
+            shell=False,
+            check=False,
+            timeout=self._timeout,
+            capture_output=True,
+        )
         return DebugInfo(
-            cmdline=' '.join([self._script, *self._flags, self._filename, *self._other_required_files]),
+            cmdline=' '.join(command),
             stdout=result.stdout,
             stderr=result.stderr,
             returncode=result.returncode,
-            cwd=tmp_dir,
+            cwd=cwd,
         )
 
+    def _make_fitness(self, result: DebugInfo, individuals: list[Individual]) -> FitnessABC:
+        if result.returncode and self._default_result:
+            logger.info(
+                f"ParallelScriptEvaluator: failed to evaluate {individuals[0]}"
+                + f" (exit status: [red]{result.returncode}[/red])"
+            )
+            logger.debug(
+                f"ParallelScriptEvaluator: command \"{result.cmdline}\" exit status: {result.returncode}"
+                + f"\n[red]---[/red]\n{result.stderr}\n[red]---[/red]"
+            )
+            result.stdout = self._default_result + '\n'
+        elif result.returncode:
+            logger.error(f"ParallelScriptEvaluator: failed to evaluate {individuals[0]}")
+            logger.error(
+                f"command \"{result.cmdline}\" exit status: {result.returncode}"
+                + f"\n[red]---[/red]\n{result.stderr}\n[red]---[/red]"
+            )
+            raise ValueError(
+                f"ParallelScriptEvaluator: {individuals[0]}: ParallelScriptEvaluator:"
+                + " script returned non-zero exit status"
+            )
+        value = [float(r) for r in result.stdout.split()]
+        if len(value) == 1:
+            value = value[0]
+        return make_fitness(value)
+
+    def evaluate_as_completed(self, population: Population) -> Iterator[Individual]:
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="byron$") as pool:
+            yield from self._stream_evaluation(population, pool, self._evaluate, self._make_fitness)
+
     def evaluate_population(self, population: Population) -> None:
-        indexes = list()
-        phenotypes = list()
-        for i, g in population:
-            if not g.finalized:
-                indexes.append(i)
-                phenotypes.append(self.cook(population.dump_individual(i)))
-        if not indexes:
-            logger.debug(f"ParallelScriptEvaluator: All individuals in the population have already been finalized")
+        for _ in self.evaluate_as_completed(population):
+            pass
+
+
+class _Worker:
+    r"""A long-lived worker process exchanging length-prefixed messages over its stdin/stdout"""
+
+    def __init__(self, command: Sequence[str]) -> None:
+        self._command = tuple(command)
+        self._process = None
+        self._buffer = b''
+
+    def __del__(self) -> None:
+        self.stop()
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        self._process = subprocess.Popen(self._command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0)
+        self._buffer = b''
+        logger.debug(f"_Worker: Started \"{' '.join(self._command)}\" (pid: {self._process.pid})")
+
+    def stop(self) -> None:
+        if self._process is None:
             return
+        try:
+            self._process.stdin.close()
+            self._process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+            self._process.wait()
+        self._process.stdout.close()
+        self._process = None
+
+    def request(self, message: str, timeout: float | None) -> str:
+        r"""Send `message` and wait for the reply (start the process if needed)"""
+        if not self.alive:
+            self.start()
+        data = message.encode('utf-8')
+        self._process.stdin.write(f"{len(data)}\n".encode('ascii') + data)
+        deadline = None if timeout is None else monotonic() + timeout
+        while b'\n' not in self._buffer:
+            self._read(deadline)
+        header, self._buffer = self._buffer.split(b'\n', 1)
+        size = int(header)
+        while len(self._buffer) < size:
+            self._read(deadline)
+        reply, self._buffer = self._buffer[:size], self._buffer[size:]
+        return reply.decode('utf-8')
+
+    def _read(self, deadline: float | None) -> None:
+        fd = self._process.stdout.fileno()
+        if deadline is not None and not select.select([fd], [], [], max(0, deadline - monotonic()))[0]:
+            raise TimeoutError(f"Worker \"{' '.join(self._command)}\" did not reply in time")
+        chunk = os.read(fd, 2**16)
+        if not chunk:
+            raise ChildProcessError(
+                f"Worker \"{' '.join(self._command)}\" closed its stdout (exit status: {self._process.wait()})"
+            )
+        self._buffer += chunk
 
-        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="byron$") as pool:
-            for i, result in zip(indexes, pool.map(self._evaluate, phenotypes)):
-                self._fitness_calls += 1
-                if result.returncode and self._default_result:
-                    logger.info(
-                        f"ParallelScriptEvaluator: failed to evaluate {population[i]} (exit status: [red]{result.returncode}[/red])"
-                    )
-                    logger.debug(
-                        f"ParallelScriptEvaluator: command \"{result.cmdline}\" exit status: {result.returncode}"
-                        + f"\n[red]---[/red]\n{result.stderr}\n[red]---[/red]"
-                    )
-                    result.stdout = self._default_result + '\n'
-                elif not self._default_result:
-                    logger.error(f"ParallelScriptEvaluator: failed to evaluate {population[i]}")
-                    logger.error(
-                        f"command \"{result.cmdline}\" exit status: {result.returncode}"
-                        + f"\n[red]---[/red]\n{result.stderr}\n[red]---[/red]"
-                    )
-                    raise ValueError(
-                        "ParallelScriptEvaluator: {population[i]}: ParallelScriptEvaluator: script returned non-zero exit status"
-                    )
-                value = [float(r) for r in result.stdout.split()]
-                if len(value) == 1:
-                    value = value[0]
-                fitness = make_fitness(value)
-                population[i].fitness = fitness
+
+class PersistentWorkerEvaluator(EvaluatorABC):
+    r"""A parallel `Evaluator` based on long-lived worker processes.
+
+    The `PersistentWorkerEvaluator` starts a pool of worker processes only once, and then streams the phenotypes to
+    them through their standard input, reading the fitness values from their standard output. It avoids the overhead
+    of spawning a process and creating a temporary directory for each individual, thus it is convenient when the
+    evaluation itself is fast.
+
+    Messages in both directions are *length-prefixed*: the length in bytes of the UTF-8 payload as a decimal number,
+    a newline, then the payload itself. The worker reads a phenotype, writes the fitness values separated by spaces,
+    flushes its output, and waits for the next phenotype; it should terminate when its standard input is closed. Eg.
+    in Python:
+
+    >>> while header := sys.stdin.buffer.readline():
+    ...     phenotype = sys.stdin.buffer.read(int(header)).decode('utf-8')
+    ...     reply = str(phenotype.count('1')).encode('utf-8')
+    ...     sys.stdout.buffer.write(f"{len(reply)}\n".encode('ascii') + reply)
+    ...     sys.stdout.buffer.flush()
+
+    A worker that crashes, or does not reply within `timeout` seconds, is killed and restarted for the next
+    phenotype; the individual gets the `default_result`, or an exception is raised if no default is specified. Workers
+    are started on the first evaluation; call `close` to terminate them (**note**: POSIX systems only).
+
+    Use option `strip_phenotypes` (see :py:class:`byron.classes.evaluator.EvaluatorABC`) to convert the phenotype into a
+    single-line string.
+
+    Use option `max_workers` (see :py:class:`byron.classes.evaluator.EvaluatorABC`) to set the number of worker
+    processes.
+    """
+
+    _script: str
+    _args: tuple[str]
+    _timeout: float | None
+    _default_result: str
+    _workers: list[_Worker] | None = None
+    _idle: queue.SimpleQueue | None = None
+
+    def __init__(
+        self,
+        script: str,
+        args: Sequence[str] = (),
+        *,
+        timeout: float | None = 60,
+        default_result: str = '',
+        **kwargs,
+    ) -> None:
+        r"""
+        Parameters
+        ----------
+        script
+            Name of the worker executable (eg. ``'./fitness.py'``)
+        args
+            Arguments of the worker
+        timeout
+            Seconds to wait for the reply of a worker (``None`` indefinitely)
+        default_result
+            Default result if a worker crashes or times out
+        kwargs
+            Extra parameters for :class:`byron.classes.evaluator.EvaluatorABC` (ie. `strip_phenotypes`, `max_workers`)
+        """
+        super().__init__(**kwargs)
+        self._script = script
+        self._args = tuple(args)
+        self._timeout = timeout
+        self._default_result = default_result
+        self._workers = None
+        self._idle = None
+
+    def __str__(self):
+        return f"{self.__class__.__name__}❬{self._script}❭"
+
+    def _get_identity(self) -> str:
+        return f"{self.__class__.__qualname__}❬{self._script}❭/{' '.join(self._args)}/" + EvaluatorABC._digest_files(
+            [self._script]
+        )
+
+    @property
+    def workers(self) -> list[_Worker]:
+        r"""The worker processes (created on first access)"""
+        with self._lock:
+            if self._workers is None:
+                workers = [_Worker([self._script, *self._args]) for _ in range(self._max_workers or os.cpu_count())]
+                self._idle = queue.SimpleQueue()
+                for worker in workers:
+                    self._idle.put(worker)
+                self._workers = workers
+        return self._workers
+
+    def close(self) -> None:
+        if self._workers is not None:
+            for worker in self._workers:
+                worker.stop()
+            self._workers, self._idle = None, None
+        super().close()
+
+    def _evaluate(self, phenotype: str) -> str | Exception:
+        worker = self._idle.get()
+        try:
+            return worker.request(phenotype, self._timeout)
+        except (OSError, ValueError, ChildProcessError, TimeoutError) as problem:
+            worker.stop()
+            return problem
+        finally:
+            self._idle.put(worker)
+
+    def _make_fitness(self, result: str | Exception, individuals: list[Individual]) -> FitnessABC:
+        if isinstance(result, Exception) and self._default_result:
+            logger.info(f"PersistentWorkerEvaluator: failed to evaluate {individuals[0]} ([red]{result}[/red])")
+            result = self._default_result
+        elif isinstance(result, Exception):
+            logger.error(f"PersistentWorkerEvaluator: failed to evaluate {individuals[0]}")
+            raise ValueError(f"PersistentWorkerEvaluator: {individuals[0]}: {result}") from result
+        value = [float(r) for r in result.split()]
+        if len(value) == 1:
+            value = value[0]
+        return make_fitness(value)
+
+    def evaluate_as_completed(self, population: Population) -> Iterator[Individual]:
+        with ThreadPoolExecutor(max_workers=len(self.workers), thread_name_prefix="byron$") as pool:
+            yield from self._stream_evaluation(population, pool, self._evaluate, self._make_fitness)
+
+    def evaluate_population(self, population: Population) -> None:
+        for _ in self.evaluate_as_completed(population):
+            pass
@@ -29,6 +29,7 @@ __all__ = ["FitnessABC"]
 
 from abc import ABC, abstractmethod
 from functools import wraps, cache
+from typing import Any
 
 # from byron.classes.paranoid import Paranoid
 from byron.global_symbols import *
@@ -58,8 +59,15 @@ class FitnessABC(ABC):
     Additional sanity checks should be added to `check_comparable
     `. Subclasses may redefine the `decorate` method to
     change the value appearance.
+
+    Subclasses where all values are comparable should set `TOTAL_ORDER`, and may provide a `sort_key`: both are
+    ignored in subclasses redefining the relational methods (see `is_totally_ordered`). Subclasses where it depends on
+    the value (eg. `Vector`) should also redefine `in_total_order`. Similarly, subclasses may
+    provide their `objectives`, allowing populations to compare fitness values in bulk (see `FitnessMatrix`).
     """
 
+    TOTAL_ORDER: bool = False
+
     @abstractmethod
     def is_fitter(self, other: "FitnessABC") -> bool:
         """Check whether fitter than the other (result may be accidental)."""
@@ -75,6 +83,51 @@ class FitnessABC(ABC):
         assert self.check_comparable(other)
         return super().__ne__(other)
 
+    def sort_key(self) -> Any:
+        """A key such that fitter values have larger keys, or ``None`` if not available.
+
+        Values with equal keys must be indistinguishable, while values with different keys may still be
+        indistinguishable (eg. with a tolerance).
+        """
+        return None
+
+    def objectives(self) -> tuple[tuple[float, float, float], ...] | None:
+        """The objectives as `(value, rel_tol, abs_tol)`, or ``None`` if not available.
+
+        Values must compare as their objectives: lexicographically, where two objectives are indistinguishable if close
+        (see `math.isclose`), otherwise the larger is fitter; `is_dominant` must be the same as `is_fitter`.
+        """
+        return None
+
+    @classmethod
+    def has_objectives(cls) -> bool:
+        """Check whether `objectives` is consistent with the relational methods."""
+        return cls._is_trusted('objectives')
+
+    @classmethod
+    def is_totally_ordered(cls) -> bool:
+        """Check whether `is_dominant` defines a total order."""
+        return cls.TOTAL_ORDER and cls._is_trusted('TOTAL_ORDER')
+
+    def in_total_order(self) -> bool:
+        """Check whether the value belongs to a totally ordered set (by default, if its class is totally ordered)."""
+        return self.is_totally_ordered()
+
+    @classmethod
+    def has_sort_key(cls) -> bool:
+        """Check whether `sort_key` is consistent with `is_dominant` (only meaningful for total orders)."""
+        return cls.is_totally_ordered() and cls._is_trusted('sort_key')
+
+    @classmethod
+    @cache
+    def _is_trusted(cls, attribute: str) -> bool:
+        # NOTE: an attribute is trusted if no relational method is redefined below the class defining it
+        owner = next(c for c in cls.__mro__ if attribute in vars(c))
+        return all(
+            issubclass(owner, next(c for c in cls.__mro__ if method in vars(c)))
+            for method in ('is_fitter', 'is_dominant', 'is_distinguishable')
+        )
+
     def check_comparable(self, other: "FitnessABC"):
         assert (
             self.__class__ == other.__class__
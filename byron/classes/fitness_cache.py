@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# =[ HISTORY ]===============================================================
+# v1 / October 2026
+
+__all__ = ["FitnessCache", "FitnessDatabase"]
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from hashlib import blake2b
+from threading import Lock
+from time import time
+import pickle
+import sqlite3
+
+from byron.user_messages import *
+from byron.classes.fitness import FitnessABC
+from byron.classes.readymade_macros import MacroZero
+
+_HEADER_TAIL = MacroZero.TEXT[len('{_comment}') :]
+
+
+class FitnessCache:
+    r"""A bounded memory of already-calculated fitness values, indexed by phenotype.
+
+    Entries are indexed by a digest of the phenotype, thus two individuals with byte-identical phenotypes share the
+    same entry. When the cache is full, the least recently used entry is discarded. The object is thread-safe.
+
+    Attributes
+    ----------
+    hits
+        Number of successful lookups
+    misses
+        Number of unsuccessful lookups
+    """
+
+    _max_size: int
+    _data: OrderedDict
+    _hits: int
+    _misses: int
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        r"""
+        Parameters
+        ----------
+        max_size
+            Maximum number of entries
+        """
+        assert check_valid_type(max_size, int)
+        assert check_value_range(max_size, 1)
+        self._max_size = max_size
+        self._data = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    def __str__(self):
+        return f"{self.__class__.__name__}❬{len(self._data):,}/{self._max_size:,}; hits: {self._hits:,}; misses: {self._misses:,}❭"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    @staticmethod
+    def key(phenotype: str) -> str:
+        r"""The index of a phenotype (ie. a digest of its UTF-8 encoding)
+
+        The header line written by `MacroZero` is ignored, as it contains the time the run started.
+        """
+        header, _, body = phenotype.partition('\n')
+        if header.endswith(_HEADER_TAIL):
+            phenotype = body
+        return blake2b(phenotype.encode('utf-8'), digest_size=20).hexdigest()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, key: str) -> FitnessABC | None:
+        r"""Returns the fitness stored under `key`, or ``None`` (updates the hit/miss counters)"""
+        with self._lock:
+            fitness = self._data.get(key)
+            if fitness is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._data.move_to_end(key)
+        return fitness
+
+    def put(self, key: str, fitness: FitnessABC) -> None:
+        r"""Stores `fitness` under `key`, possibly discarding the least recently used entry"""
+        assert check_valid_type(fitness, FitnessABC)
+        with self._lock:
+            self._data[key] = fitness
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        r"""Discards all entries (counters are not reset)"""
+        with self._lock:
+            self._data.clear()
+
+
+class FitnessDatabase:
+    r"""A persistent store of already-calculated fitness values, indexed by phenotype.
+
+    Values are stored in a SQLite [1]_ database and survive restarts. Each entry is tagged with the *identity* of the
+    evaluator that calculated it (eg. the name of the script and a digest of the required files), and lookups only
+    consider entries with the very same identity: modifying the evaluator implicitly invalidates old values.
+
+    New values are buffered and written in a single transaction by `commit`. The database is opened in WAL mode, so
+    that different runs can read it and write it concurrently.
+
+    Fitness values that cannot be pickled (eg. reversed fitness classes) are silently not stored.
+
+    References
+    ----------
+    .. [1] https://www.sqlite.org/
+    """
+
+    _filename: str
+    _connection: sqlite3.Connection | None
+    _buffer: dict[tuple[str, str], bytes]
+    _hits: int
+    _misses: int
+
+    SQL_CHUNK = 500
+
+    def __init__(self, filename: str, *, timeout: float = 60) -> None:
+        r"""
+        Parameters
+        ----------
+        filename
+            Name of the SQLite file
+        timeout
+            Seconds to wait when the database is locked by another writer
+        """
+        self._filename = filename
+        self._timeout = timeout
+        self._connection = None
+        self._buffer = dict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    def __str__(self):
+        return f"{self.__class__.__name__}❬{self._filename}; hits: {self._hits:,}; misses: {self._misses:,}❭"
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        r"""The connection to the database (opened on first access)"""
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self._filename, timeout=self._timeout, isolation_level=None, check_same_thread=False
+            )
+            try:
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.execute("PRAGMA synchronous=NORMAL")
+            except sqlite3.OperationalError as e:
+                logger.debug(f"FitnessDatabase: Can't enable WAL on {self._filename!r}: {e}")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS fitness ("
+                + "evaluator TEXT NOT NULL, phenotype TEXT NOT NULL, fitness BLOB NOT NULL, timestamp REAL, "
+                + "PRIMARY KEY (evaluator, phenotype))"
+            )
+        return self._connection
+
+    def get_many(self, evaluator: str, keys: Iterable[str]) -> dict[str, FitnessABC]:
+        r"""Returns the fitness values stored for `keys` by `evaluator` (updates the hit/miss counters)"""
+        keys = list(keys)
+        found = dict()
+        with self._lock:
+            for k in keys:
+                if (evaluator, k) in self._buffer:
+                    found[k] = self._buffer[(evaluator, k)]
+            missing = [k for k in keys if k not in found]
+            for i in range(0, len(missing), FitnessDatabase.SQL_CHUNK):
+                chunk = missing[i : i + FitnessDatabase.SQL_CHUNK]
+                cursor = self.connection.execute(
+                    "SELECT phenotype, fitness FROM fitness WHERE evaluator = ? AND phenotype IN ("
+                    + ", ".join('?' * len(chunk))
+                    + ")",
+                    [evaluator, *chunk],
+                )
+                found |= dict(cursor.fetchall())
+
+        result = dict()
+        for k, blob in found.items():
+            try:
+                result[k] = pickle.loads(blob)
+            except Exception as e:
+                logger.debug(f"FitnessDatabase: Can't unpickle stored fitness: {e}")
+        self._hits += len(result)
+        self._misses += len(keys) - len(result)
+        return result
+
+    def put(self, evaluator: str, key: str, fitness: FitnessABC) -> None:
+        r"""Buffers `fitness` under `key` for `evaluator` (see `commit`)"""
+        assert check_valid_type(fitness, FitnessABC)
+        try:
+            blob = pickle.dumps(fitness)
+        except Exception as e:
+            logger.debug(f"FitnessDatabase: Can't pickle {fitness}: {e}")
+            return
+        with self._lock:
+            self._buffer[(evaluator, key)] = blob
+
+    def commit(self) -> None:
+        r"""Writes all buffered values in a single transaction"""
+        with self._lock:
+            if not self._buffer:
+                return
+            now = time()
+            connection = self.connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO fitness (evaluator, phenotype, fitness, timestamp) VALUES (?, ?, ?, ?)",
+                    ((e, k, b, now) for (e, k), b in self._buffer.items()),
+                )
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            logger.debug(f"FitnessDatabase: Stored {len(self._buffer):,} new fitness values in {self._filename!r}")
+            self._buffer.clear()
+
+    def invalidate(self, evaluator: str) -> None:
+        r"""Discards all values calculated by `evaluator`"""
+        with self._lock:
+            self._buffer = {(e, k): b for (e, k), b in self._buffer.items() if e != evaluator}
+            self.connection.execute("DELETE FROM fitness WHERE evaluator = ?", (evaluator,))
+
+    def close(self) -> None:
+        r"""Commits buffered values and closes the connection"""
+        self.commit()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
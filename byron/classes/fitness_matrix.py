@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# =[ HISTORY ]===============================================================
+# v1 / October 2026
+
+__all__ = ['FitnessMatrix']
+
+from collections.abc import Sequence
+from typing import Optional
+
+import numpy as np
+
+from byron.user_messages import *
+from byron.classes.fitness import FitnessABC
+
+# maximum number of elements in the temporary arrays used to compare all pairs of rows
+_CHUNK_ELEMENTS = 2**22
+
+
+class FitnessMatrix:
+    r"""The fitness values of a group of individuals as a NumPy matrix
+
+    Each row holds the `objectives` of a fitness value, each column has its own relative and absolute tolerance. Rows
+    are compared exactly as the `FitnessABC` objects they come from (ie. lexicographically, where objectives are
+    indistinguishable if close), but all at once. Indexes may be integers or NumPy arrays, and are broadcast.
+
+    Use `from_fitness` to create the matrix, as not all fitness types can be represented.
+    """
+
+    __slots__ = ['_values', '_rel_tol', '_abs_tol']
+
+    def __init__(self, values: np.ndarray, rel_tol: np.ndarray, abs_tol: np.ndarray) -> None:
+        assert values.ndim == 2 and rel_tol.shape == abs_tol.shape == values.shape[1:]
+        self._values = values
+        self._rel_tol = rel_tol
+        self._abs_tol = abs_tol
+
+    @staticmethod
+    def from_fitness(fitness: Sequence[FitnessABC]) -> Optional['FitnessMatrix']:
+        r"""The matrix of a sequence of fitness values of the same type, or ``None`` if not possible"""
+        if not fitness or len({type(f) for f in fitness}) != 1 or not type(fitness[0]).has_objectives():
+            return None
+        objectives = [f.objectives() for f in fitness]
+        if any(o is None for o in objectives) or len({len(o) for o in objectives}) != 1:
+            return None
+        data = np.array(objectives, dtype=np.float64)
+        tolerances = data[0, :, 1:]
+        if not (data[:, :, 1:] == tolerances).all():
+            # NOTE: fitness values with different tolerances are not comparable anyway
+            return None
+        return FitnessMatrix(data[:, :, 0], tolerances[:, 0].copy(), tolerances[:, 1].copy())
+
+    def __len__(self) -> int:
+        return self._values.shape[0]
+
+    def __str__(self) -> str:
+        return f"FitnessMatrix ({self._values.shape[0]} values, {self._values.shape[1]} objectives)"
+
+    @property
+    def values(self) -> np.ndarray:
+        r"""The objectives, one row per fitness value (read-only)"""
+        view = self._values.view()
+        view.flags.writeable = False
+        return view
+
+    def is_fitter(self, a, b) -> np.ndarray:
+        r"""Check whether values `a` are fitter than values `b` (as `FitnessABC.is_fitter` and `is_dominant`)"""
+        return self._fitter(self._values[a], self._values[b])
+
+    def dominance(self) -> np.ndarray:
+        r"""A square boolean matrix, where element `[i, j]` is ``True`` if value `i` dominates value `j`"""
+        n, k = self._values.shape
+        result = np.empty((n, n), dtype=bool)
+        step = max(1, _CHUNK_ELEMENTS // max(1, n * k))
+        for start in range(0, n, step):
+            rows = self._values[start : start + step, None, :]
+            result[start : start + step] = self._fitter(rows, self._values[None, :, :])
+        return result
+
+    def fronts(self) -> list[np.ndarray]:
+        r"""Indexes of the Pareto fronts, from the best one
+
+        If, in all columns, distinct values are distinguishable, fronts are groups of equal rows, sorted
+        lexicographically in O(n log n); otherwise, fronts are computed from the `dominance` matrix with the fast
+        non-dominated sort by Deb et al. (10.1109/4235.996017).
+        """
+        if all(self._is_separable(c) for c in range(self._values.shape[1])):
+            order = np.lexsort(self._values.T[::-1])[::-1]
+            rows = self._values[order]
+            boundaries = np.flatnonzero((rows[1:] != rows[:-1]).any(axis=1)) + 1
+            return np.split(order, boundaries)
+
+        dominance = self.dominance()
+        counts = dominance.sum(axis=0)
+        remaining = np.ones(len(self), dtype=bool)
+        fronts = list()
+        while remaining.any():
+            front = np.flatnonzero(remaining & (counts == 0))
+            if not front.size:
+                # NOTE: tolerances may create cycles (eg. a >> b >> c >> a), the last values are a single front
+                front = np.flatnonzero(remaining)
+            fronts.append(front)
+            remaining[front] = False
+            counts -= dominance[front].sum(axis=0)
+        return fronts
+
+    # =[PRIVATE METHODS]================================================================================================
+
+    def _is_separable(self, column: int) -> bool:
+        # NOTE: if consecutive distinct values are distinguishable, all distinct values are (tolerances only grow
+        # with magnitude), and the tolerance can be ignored
+        values = np.unique(self._values[:, column])
+        if np.isnan(values).any():
+            return False
+        return bool(self._distinguishable(values[:-1], values[1:], column).all())
+
+    def _distinguishable(self, a: np.ndarray, b: np.ndarray, column: int) -> np.ndarray:
+        # NOTE: same as `not math.isclose(a, b, rel_tol, abs_tol)`, including infinities and NaNs
+        rel_tol, abs_tol = self._rel_tol[column], self._abs_tol[column]
+        if rel_tol == 0 and abs_tol == 0:
+            return a != b
+        with np.errstate(invalid='ignore', over='ignore'):
+            tolerance = np.maximum(rel_tol * np.maximum(np.abs(a), np.abs(b)), abs_tol)
+            close = (a == b) | (np.isfinite(a) & np.isfinite(b) & (np.abs(a - b) <= tolerance))
+        return ~close
+
+    def _fitter(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        # NOTE: lexicographic, the first distinguishable objective decides
+        fitter = None
+        for column in range(a.shape[-1]):
+            va, vb = a[..., column], b[..., column]
+            distinguishable = self._distinguishable(va, vb, column)
+            if fitter is None:
+                fitter = distinguishable & (va > vb)
+                undecided = ~distinguishable
+            else:
+                fitter |= undecided & distinguishable & (va > vb)
+                undecided &= ~distinguishable
+        return fitter
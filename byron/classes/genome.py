@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# =[ HISTORY ]===============================================================
+# v1 / October 2026
+
+__all__ = ['Genome']
+
+import networkx as nx
+
+from byron.global_symbols import *
+from byron.classes.node import NODE_ZERO
+
+
+class Genome(nx.MultiDiGraph):
+    r"""The MultiDiGraph storing the genome of an individual
+
+    A standard NetworkX `MultiDiGraph` that keeps track of changes to its structure, that is, to the set of nodes and
+    to the edges of `kind=FRAMEWORK`. Each of these changes increments `framework_version`, and invalidates the data
+    derived from the structure tree (the tree itself, the parent of each node, the depth-first order, and the path of
+    frames leading to each node). Changes to parameters and to edges of `kind=LINK` do not invalidate anything, thus
+    repeated queries between two structural changes cost O(1).
+
+    Cached data are shared by all callers and must be treated as read-only. The class assumes that the attribute
+    `_type` of an edge, and `_selement` of a node, are never modified after they have been set.
+    """
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        self._framework_version = 0
+        self._structure = dict()
+        super().__init__(incoming_graph_data, **attr)
+
+    @property
+    def framework_version(self) -> int:
+        r"""Counter of the changes to the structure of the genome"""
+        return self._framework_version
+
+    @property
+    def structure_tree(self) -> nx.DiGraph:
+        r"""The tree with all nodes and only edges of `kind=FRAMEWORK` (possibly not a valid tree)"""
+        if 'tree' not in self._structure:
+            tree = nx.DiGraph()
+            tree.add_nodes_from(self._node)
+            tree.add_edges_from(
+                (u, v)
+                for u, nbrs in self._adj.items()
+                for v, keys in nbrs.items()
+                for d in keys.values()
+                if d.get('_type') == FRAMEWORK
+            )
+            self._structure['tree'] = tree
+        return self._structure['tree']
+
+    @property
+    def valid_structure(self) -> bool:
+        r"""Whether the structure tree is a proper tree"""
+        if 'valid' not in self._structure:
+            tree = self.structure_tree
+            self._structure['valid'] = len(tree) > 0 and nx.is_branching(tree) and nx.is_weakly_connected(tree)
+        return self._structure['valid']
+
+    @property
+    def parents(self) -> dict:
+        r"""The parent of each node in the structure tree (roots are not included)"""
+        if 'parents' not in self._structure:
+            self._structure['parents'] = {v: u for u, v in self.structure_tree.edges}
+        return self._structure['parents']
+
+    @property
+    def dfs_nodes(self) -> tuple:
+        r"""All nodes in depth-first preorder of the structure tree"""
+        if 'dfs' not in self._structure:
+            self._structure['dfs'] = tuple(nx.dfs_preorder_nodes(self.structure_tree))
+        return self._structure['dfs']
+
+    @property
+    def frame_paths(self) -> dict:
+        r"""The classes of the SElements on the path from `NODE_ZERO` to each node of the structure tree"""
+        if 'paths' not in self._structure:
+            paths = {NODE_ZERO: (self._node[NODE_ZERO]['_selement'].__class__,)}
+            for node in self.dfs_nodes:
+                if node in self.parents and self.parents[node] in paths:
+                    paths[node] = paths[self.parents[node]] + (self._node[node]['_selement'].__class__,)
+            self._structure['paths'] = paths
+        return self._structure['paths']
+
+    # =[STRUCTURAL CHANGES]=============================================================================================
+
+    def add_node(self, node_for_adding, **attr):
+        if node_for_adding not in self._node:
+            self._structure_changed()
+        super().add_node(node_for_adding, **attr)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        self._structure_changed()
+        super().add_nodes_from(nodes_for_adding, **attr)
+
+    def remove_node(self, n):
+        self._structure_changed()
+        super().remove_node(n)
+
+    def remove_nodes_from(self, nodes):
+        self._structure_changed()
+        super().remove_nodes_from(nodes)
+
+    def add_edge(self, u_for_edge, v_for_edge, key=None, **attr):
+        if attr.get('_type') == FRAMEWORK or u_for_edge not in self._node or v_for_edge not in self._node:
+            self._structure_changed()
+        return super().add_edge(u_for_edge, v_for_edge, key, **attr)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        # NOTE: edges are added first, and their attributes are set later
+        result = super().add_edges_from(ebunch_to_add, **attr)
+        self._structure_changed()
+        return result
+
+    def remove_edge(self, u, v, key=None):
+        keys = self._adj.get(u, dict()).get(v, dict())
+        if key is None or key not in keys:
+            framework = any(d.get('_type') == FRAMEWORK for d in keys.values())
+        else:
+            framework = keys[key].get('_type') == FRAMEWORK
+        super().remove_edge(u, v, key)
+        if framework:
+            self._structure_changed()
+
+    def clear(self):
+        super().clear()
+        self._structure_changed()
+
+    def clear_edges(self):
+        super().clear_edges()
+        self._structure_changed()
+
+    def _structure_changed(self) -> None:
+        self._framework_version += 1
+        self._structure = dict()
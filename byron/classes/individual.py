@@ -29,9 +29,11 @@
 
 __all__ = ['Individual', 'Lineage', 'Age']
 
-from typing import Any, Callable
+from typing import Any, Callable, TextIO
+from io import StringIO
+from functools import cache
 from itertools import chain
-from copy import deepcopy, copy
+from copy import copy
 import operator
 
 import networkx as nx
@@ -48,6 +50,8 @@ if matplotlib_available:
 from byron.global_symbols import *
 from byron.classes.node import NODE_ZERO
 from byron.classes.byron import Byron
+from byron.classes.compact_genome import CompactGenome
+from byron.classes.genome import Genome
 from byron.classes.dump import *
 from byron.classes.fitness import FitnessABC
 from byron.classes.frame import FrameABC
@@ -59,6 +63,7 @@ from byron.classes.parameter import ParameterABC, ParameterStructuralABC
 from byron.classes.paranoid import Paranoid
 from byron.classes.readymade_macros import MacroZero
 from byron.classes.value_bag import ValueBag
+from byron.tools.template import compile_template
 
 
 @dataclass(frozen=True, slots=True)
@@ -112,13 +117,16 @@ class Individual(Paranoid):
 
     __LAST_BYRON_INDIVIDUAL: int = 0
 
-    _genome: nx.classes.MultiDiGraph
+    _graph: nx.classes.MultiDiGraph | None
+    _compact: CompactGenome | None
     _fitness: FitnessABC | None
     _lineage: Lineage | None
     _age: Age
     _str: str
+    _dump_cache: dict
 
     BYRON: Byron = Byron()
+    DUMP_CACHE_SIZE: int = 100_000
 
     from ._individual_as import as_forest, as_lgp, _draw_forest, _draw_multipartite
 
@@ -128,15 +136,17 @@ class Individual(Paranoid):
         if genome:
             self._genome = genome
         else:
-            self._genome = nx.MultiDiGraph(top_frame=top_frame)
+            self._genome = Genome(top_frame=top_frame)
             self._genome.add_node(NODE_ZERO, _selement=MacroZero(), _type=MACRO_NODE)
         self._fitness = None
         self._str = ''
         self._lineage = None
         self._age = Age()
+        self._dump_cache = dict()
 
     def __del__(self) -> None:
-        self._genome.clear()  # NOTE[GX]: I guess it's useless...
+        if self._graph is not None:
+            self._graph.clear()  # NOTE[GX]: I guess it's useless...
 
     def __str__(self):
         # return f"𝕚{self._id}" + " | " + str(hash(self.as_message)) + ' | ' + str(self.structure_tree)
@@ -147,7 +157,7 @@ class Individual(Paranoid):
             type(self) == type(other)
             and self._fitness == other._fitness
             and nx.isomorphism.is_isomorphic(
-                self._genome, other._genome, node_match=operator.eq, edge_match=operator.eq
+                self._genome_view, other._genome_view, node_match=operator.eq, edge_match=operator.eq
             )
         )
 
@@ -166,21 +176,19 @@ class Individual(Paranoid):
 
     @property
     def valid(self) -> bool:
-        return all(
-            self.genome.nodes[n]['_selement'].is_valid(NodeView(NodeReference(self._genome, n))) for n in self._genome
-        )
+        G = self._genome_view
+        return all(G.nodes[n]['_selement'].is_valid(NodeView(NodeReference(G, n))) for n in G)
 
     @property
     def clone(self) -> 'Individual':
-        scratch = self._fitness, self._lineage
-        self._fitness, self._lineage = None, None
-        I = deepcopy(self)
-        Individual.__LAST_BYRON_INDIVIDUAL += 1  # TODO: [GX] Use a custom baseclass!
-        I._id = Individual.__LAST_BYRON_INDIVIDUAL
-        self._fitness, self._lineage = scratch
-        I._age = Age()
+        r"""A new individual with the same genome (node labels and SElements are shared, see `clone_genome`)"""
+        if self._compact is not None:
+            I = Individual(self.top_frame, self._compact.to_graph())
+        else:
+            I = Individual(self.top_frame, clone_genome(self._graph))
+        # the dump cache is keyed by the content of the nodes, thus it can be safely shared
+        I._dump_cache = self._dump_cache
         I._lineage = Lineage(None, (self,))
-        Node.reset_labels(I.genome)
         return I
 
     @property
@@ -192,6 +200,10 @@ class Individual(Paranoid):
     @property
     def nodes(self) -> tuple[int]:
         """Return all node indexes in reliable order."""
+        if self._compact is not None:
+            return self._compact.dfs_nodes
+        if isinstance(self._genome, Genome):
+            return self._genome.dfs_nodes
         return tuple(nx.dfs_preorder_nodes(self.structure_tree))
 
     @property
@@ -201,6 +213,8 @@ class Individual(Paranoid):
 
     @property
     def top_frame(self) -> type[FrameABC]:
+        if self._compact is not None:
+            return self._compact.top_frame
         return self._genome.graph['top_frame']
 
     @property
@@ -221,6 +235,31 @@ class Individual(Paranoid):
         self._genome = new_genome
         self._fitness = None
 
+    @property
+    def _genome_view(self) -> nx.classes.MultiDiGraph:
+        # read-only access: a compact genome is rebuilt into a temporary graph, and stays compact
+        if self._graph is None:
+            return self._compact.to_graph()
+        return self._graph
+
+    @property
+    def _genome(self) -> nx.classes.MultiDiGraph:
+        # a compact genome is turned back into a graph as soon as it may be modified
+        if self._graph is None:
+            self._graph = self._compact.to_graph()
+            self._compact = None
+        return self._graph
+
+    @_genome.setter
+    def _genome(self, new_genome: nx.classes.MultiDiGraph):
+        self._graph = new_genome
+        self._compact = None
+
+    @property
+    def compacted(self) -> bool:
+        """Whether the genome is currently stored in compact form (see `compact`)."""
+        return self._compact is not None
+
     @property
     def lineage(self):
         return self._lineage
@@ -265,6 +304,8 @@ class Individual(Paranoid):
 
     @property
     def as_message(self) -> list[int]:
+        if self._compact is not None:
+            return self._compact.as_message
         message = list()
         for node, data in [(n, e) for n, e in self._genome.nodes(data=True)]:
             message.extend(data['_selement'].shannon)
@@ -278,25 +319,26 @@ class Individual(Paranoid):
     @property
     def macros(self) -> tuple[Macro]:
         """Return all macro instances in unreliable order."""
-        return tuple(
-            self._genome.nodes[n]["_selement"] for n in self._genome if self._genome.nodes[n]["_type"] == MACRO_NODE
-        )
+        G = self._genome_view
+        return tuple(G.nodes[n]["_selement"] for n in G if G.nodes[n]["_type"] == MACRO_NODE)
 
     @property
     def frames(self) -> tuple[FrameABC]:
         """Return all frame instances in unreliable order."""
-        return tuple(
-            self._genome.nodes[n]["_selement"] for n in self._genome if self._genome.nodes[n]["_type"] == FRAME_NODE
-        )
+        G = self._genome_view
+        return tuple(G.nodes[n]["_selement"] for n in G if G.nodes[n]["_type"] == FRAME_NODE)
 
     @property
     def parameters(self) -> tuple[ParameterABC]:
         """Return all parameter instances in unreliable order."""
-        return tuple(p for n in self._genome for p in self._genome.nodes[n].values() if isinstance(p, ParameterABC))
+        G = self._genome_view
+        return tuple(p for n in G for p in G.nodes[n].values() if isinstance(p, ParameterABC))
 
     @property
     def structure_tree(self) -> nx.classes.DiGraph:
         """A tree with the structure tree of the individual (ie. only edges of `kind=FRAMEWORK`)."""
+        if self._compact is not None:
+            return self._compact.structure_tree
         tree = get_structure_tree(self._genome)
         assert tree, f"{PARANOIA_VALUE_ERROR}: Structure of {self!r} is not a valid tree"
         return tree
@@ -307,6 +349,17 @@ class Individual(Paranoid):
     def aging(self, step: int = 1):
         self.age += step
 
+    def compact(self) -> None:
+        """Store the genome in compact form, to save memory.
+
+        The NetworkX graph is rebuilt as soon as the genome is accessed through `genome` (or `G`), as it may be
+        modified. Read-only accesses (eg. `clone`, `nodes`, `as_message`, `dump`) leave the genome compact, either
+        working directly on the compact form or on a temporary graph (see `CompactGenome`).
+        """
+        if self._compact is None:
+            self._compact = CompactGenome(self._graph)
+            self._graph = None
+
     def run_paranoia_checks(self) -> bool:
         # ==[check genome (structural)]======================================
         assert self.genome == self._genome, f"{PARANOIA_VALUE_ERROR}: Panic!"
@@ -423,17 +476,16 @@ class Individual(Paranoid):
         if include_fitness:
             delem.append(f"fitness: {self.fitness}")
         if include_structure:
-            node_types = list(t for n, t in self.G.nodes(data="_type"))
-            n_nodes = len(self.G)
+            G = self._genome_view
+            node_types = list(t for n, t in G.nodes(data="_type"))
+            n_nodes = len(G)
             n_macros = node_types.count(MACRO_NODE) - 1
             n_frames = node_types.count(FRAME_NODE)
-            n_links = sum(True for _, _, k in self.G.edges(data="_type") if k != FRAMEWORK)
+            n_links = sum(True for _, _, k in G.edges(data="_type") if k != FRAMEWORK)
             n_params = sum(
                 True
                 for p in chain.from_iterable(
-                    self.G.nodes[n]["_selement"].parameter_types.items()
-                    for n in self.G
-                    if self.G.nodes[n]["_type"] == MACRO_NODE
+                    G.nodes[n]["_selement"].parameter_types.items() for n in G if G.nodes[n]["_type"] == MACRO_NODE
                 )
             )
             delem.append(
@@ -472,79 +524,191 @@ class Individual(Paranoid):
             if NODE_ZERO not in ccomp:
                 self.G.remove_nodes_from(ccomp)
 
-    def dump(self, extra_parameters: dict | None = None) -> str:
+    def dump(self, extra_parameters: dict | None = None, *, canonic: bool = False) -> str:
+        r"""The phenotype of the individual
+
+        If `canonic` is ``True``, node labels are rendered in their canonic form (see `canonic_representation`)
+        through a translation table, thus the genome is neither cloned nor relabeled.
+        """
+        phenotype = StringIO()
+        self.dump_to(phenotype, extra_parameters, canonic=canonic)
+        return phenotype.getvalue()
+
+    def dump_to(self, stream: TextIO, extra_parameters: dict | None = None, *, canonic: bool = False) -> None:
+        r"""Write the phenotype of the individual into `stream`, node by node
+
+        `stream` is any text stream, eg. an open file, a pipe, or an `io.StringIO`. See `dump` for `canonic`.
+        """
+        G = self._genome_view
+        if canonic:
+            with Node.translated_labels(Node.canonic_labels(G)):
+                return self._dump_graph(G, stream, extra_parameters)
+        return self._dump_graph(G, stream, extra_parameters)
+
+    def _dump_graph(self, G: nx.MultiDiGraph, stream: TextIO, extra_parameters: dict | None) -> None:
+        r"""Write the phenotype of the genome `G` (ie. the genome of the individual, or a temporary copy) into `stream`"""
         if extra_parameters is None:
             extra_parameters = DEFAULT_EXTRA_PARAMETERS | DEFAULT_OPTIONS
 
         # =[Flatten the graph into a list of nodes]==========================
-        tree = make_digraph(
-            tuple(self._genome.nodes), tuple((u, v) for u, v, k in self._genome.edges(data="_type") if k == FRAMEWORK)
-        )
-        tree = tree.copy()
+        tree = get_framework_tree(G).copy()
 
-        for node in list(v for _, v in tree.edges(NODE_ZERO) if self.genome.nodes[v]['_selement'].FORCED_PARENT):
-            target = self.genome.nodes[node]['_selement'].FORCED_PARENT
+        for node in list(v for _, v in tree.edges(NODE_ZERO) if G.nodes[v]['_selement'].FORCED_PARENT):
+            target = G.nodes[node]['_selement'].FORCED_PARENT
             tree.remove_edge(NODE_ZERO, node)
-            parent = next(n for n, f in self.genome.nodes(data='_selement') if f.__class__ == target)
+            parent = next(n for n, f in G.nodes(data='_selement') if f.__class__ == target)
             tree.add_edge(parent, node)
 
         frame_list = Individual._recursive_flatten_frames(
-            NodeReference(self.genome, NODE_ZERO), tree, extra_parameters, tuple(), list()
+            NodeReference(G, NODE_ZERO), tree, ValueBag(extra_parameters), tuple(), list()
         )
 
+        try:
+            extra_key = frozenset(extra_parameters.items())
+        except TypeError:
+            # unhashable extra parameters, no way to cache anything
+            extra_key = None
+        if len(self._dump_cache) > Individual.DUMP_CACHE_SIZE:
+            self._dump_cache.clear()
+        contexts = dict()
+
         # =[Let's dump it]===================================================
-        phenotype = ''
-        for nr, path in frame_list:
-            local_parameters = copy(extra_parameters)
-            for p in path:
-                local_parameters |= p.EXTRA_PARAMETERS
-            local_parameters |= {'_node': NodeView(nr)}
-            local_parameters |= {'_byron': Individual.BYRON}
+        for nr, path, frame_parameters in frame_list:
+            key = None
+            if extra_key is not None:
+                key = Individual._node_dump_key(nr, path, extra_parameters, extra_key, contexts)
+            if key is not None and (node_str := self._dump_cache.get(key)) is not None:
+                stream.write(node_str)
+                continue
+
+            local_parameters = dict(path[-1].EXTRA_PARAMETERS)
+            local_parameters['_node'] = NodeView(nr)
+            local_parameters['_byron'] = Individual.BYRON
             local_parameters |= nr.graph.nodes[nr.node]
 
             # --[node]-------------------------------------------------------
-            bag = ValueBag(local_parameters)
-            node_str = '{_text_before_node}'.format(**bag)
+            bag = ValueBag.layered(frame_parameters, local_parameters)
+            node_str = _TEMPLATES['_text_before_node'].render(bag)
             if nr.graph.in_degree(nr.node) > 1:
-                node_str += bag['_label'].format(**bag)
+                node_str += compile_template(bag['_label']).render(bag)
             if nr.graph.nodes[nr.node]['_type'] == MACRO_NODE:
-                node_str += '{_text_before_macro}'.format(**bag)
+                node_str += _TEMPLATES['_text_before_macro'].render(bag)
                 node_str += nr.graph.nodes[nr.node]['_selement'].dump(bag)
                 if bag['$dump_node_info'] and nr.node != NODE_ZERO:
                     if node_str:
                         node_str += '  '
-                    node_str += '{_comment} 🖋 {_node.path_string} ➜ {_node.type_}'.format(**bag)
-                node_str += '{_text_after_macro}'.format(**bag)
+                    node_str += _NODE_INFO.render(bag)
+                node_str += _TEMPLATES['_text_after_macro'].render(bag)
             elif nr.graph.nodes[nr.node]["_type"] == FRAME_NODE:
-                node_str += '{_text_before_frame}'.format(**bag)
+                node_str += _TEMPLATES['_text_before_frame'].render(bag)
                 if bag['$dump_node_info']:
-                    node_str += '{_comment} 🖋 {_node.path_string} ➜ {_node.type_}{_text_after_macro}'.format(**bag)
-                node_str += '{_text_after_frame}'.format(**bag)
-            node_str += '{_text_after_node}'.format(**bag)
+                    node_str += _FRAME_INFO.render(bag)
+                node_str += _TEMPLATES['_text_after_frame'].render(bag)
+            node_str += _TEMPLATES['_text_after_node'].render(bag)
             # ---------------------------------------------------------------
 
-            if not bag['$omit_from_dump']:
-                phenotype += node_str
+            if bag['$omit_from_dump']:
+                node_str = ''
+            if key is not None:
+                self._dump_cache[key] = node_str
+            stream.write(node_str)
         # ===================================================================
 
-        return phenotype
+    @staticmethod
+    def _node_dump_key(
+        nr: NodeReference, path: tuple, extra_parameters: dict, extra_key: frozenset, contexts: dict
+    ) -> tuple | None:
+        r"""The key of a node in the dump cache (``None`` if its dump can't be cached)
+
+        The key includes everything the dump of the node depends on: the extra parameters, the classes along its
+        path, the values of its parameters, and the labels of the nodes it refers to. Labels are included only if
+        actually used, so that unchanged nodes hit the cache even if some other node has been added or removed.
+        """
+        attributes = nr.graph.nodes[nr.node]
+        classes = tuple(type(s) for s in path)
+        if classes not in contexts:
+            contexts[classes] = Individual._dump_context(path, attributes, extra_parameters)
+        if (context := contexts[classes]) is None:
+            return None
+        uses_node, uses_label, uses_path = context
+
+        in_degree = nr.graph.in_degree(nr.node)
+        values = list()
+        for k, p in attributes.items():
+            if isinstance(p, ParameterABC):
+                value = p.value
+                values.append((k, value.label if isinstance(value, Node) else value))
+        key = (
+            extra_key,
+            classes,
+            tuple(values),
+            in_degree > 1,
+            nr.node.label if uses_node or (uses_label and in_degree > 1) else None,
+            NodeView(nr).path_string if uses_path else None,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
     @staticmethod
-    def _recursive_flatten_frames(
-        nr: NodeReference, T: nx.DiGraph, extra_parameters: dict, path: tuple, dump: list
-    ) -> list:
+    def _dump_context(path: tuple, attributes: dict, extra_parameters: dict) -> tuple[bool, bool, bool] | None:
+        r"""Check what the dump of nodes with the given path may depend on
+
+        Returns whether the dump uses the label of the node, uses it only in `_label`, uses the path of the node, or
+        ``None`` if it may depend on anything else (eg. `_byron`, or other attributes of `_node`)."""
+        selement = path[-1]
         local_parameters = copy(extra_parameters)
-        local_parameters |= nr.graph.nodes[nr.node]['_selement'].EXTRA_PARAMETERS
+        for p in path:
+            local_parameters |= p.EXTRA_PARAMETERS
+        texts = [local_parameters.get(t, '') for t in _DUMP_TEXTS]
+        if isinstance(selement, Macro):
+            if type(selement).dump is not Macro.dump:
+                return None
+            texts.append(selement.text)
+        if local_parameters.get('$dump_node_info', False):
+            texts.append(_FRAME_INFO.text)
+        if not all(isinstance(t, str) for t in texts):
+            return None
+
+        names = {k for k in local_parameters if k[0] != '$'} | {k for k in attributes if isinstance(k, str)}
+        names -= {'_node', '_byron', '_selement', '_type'}
+        uses = set()
+        for i, text in enumerate(texts):
+            fields = _format_fields(text)
+            if fields is None:
+                return None
+            for root, attribute in fields:
+                if root == '_node' and attribute in (None, 'path_string', 'type_'):
+                    uses.add((attribute, _DUMP_TEXTS[i] == '_label' if i < len(_DUMP_TEXTS) else False))
+                elif root not in names or attribute is not None:
+                    return None
+        uses_label = (None, True) in uses
+        uses_node = (None, False) in uses
+        uses_path = any(a == 'path_string' for a, _ in uses)
+        return uses_node, uses_label, uses_path
 
-        path = tuple(list(path) + [nr.graph.nodes[nr.node]['_selement']])
-        dump.append((NodeReference(nr.graph, nr.node), path))
+    @staticmethod
+    def _recursive_flatten_frames(
+        nr: NodeReference, T: nx.DiGraph, extra_parameters: ValueBag, path: tuple, dump: list
+    ) -> list:
+        r"""Append `(node_reference, path, extra_parameters)` for all nodes in the subtree in dump order
+
+        Extra parameters of the frames are merged only once per frame, and shared by all its descendants.
+        """
+        selement = nr.graph.nodes[nr.node]['_selement']
+        path = path + (selement,)
+        dump.append((NodeReference(nr.graph, nr.node), path, extra_parameters))
+        if selement.EXTRA_PARAMETERS:
+            extra_parameters = extra_parameters | selement.EXTRA_PARAMETERS
         for n in [v for u, v in T.out_edges(nr.node)]:
-            Individual._recursive_flatten_frames(NodeReference(nr.graph, n), T, local_parameters, path, dump)
+            Individual._recursive_flatten_frames(NodeReference(nr.graph, n), T, extra_parameters, path, dump)
 
         return dump
 
     @staticmethod
-    def _dump_node_recursive(nr: NodeReference, T: nx.DiGraph, extra_parameters: dict, dump: str):
+    def _dump_node_recursive(nr: NodeReference, T: nx.DiGraph, extra_parameters: dict, stream: TextIO) -> None:
         local_parameters = extra_parameters | nr.graph.nodes[nr.node]
         local_parameters |= {'_node': NodeView(nr)}
         local_parameters |= {'_byron': Individual.BYRON}
@@ -569,7 +733,32 @@ class Individual(Paranoid):
         node_str += '{_text_after_node}'.format(**bag)
         # ====================================================================
 
-        dump += node_str
+        stream.write(node_str)
         for n in [v for u, v in T.out_edges(nr.node)]:
-            dump = Individual._dump_node_recursive(NodeReference(nr.graph, n), T, local_parameters, dump)
-        return dump
+            Individual._dump_node_recursive(NodeReference(nr.graph, n), T, local_parameters, stream)
+
+
+# =[PRIVATE FUNCTIONS]==================================================================================================
+
+# Extra parameters formatted while dumping each node (see `Individual.dump_to`)
+_DUMP_TEXTS = (
+    '_text_before_node',
+    '_label',
+    '_text_before_macro',
+    '_text_after_macro',
+    '_text_before_frame',
+    '_text_after_frame',
+    '_text_after_node',
+)
+_TEMPLATES = {t: compile_template('{' + t + '}') for t in _DUMP_TEXTS}
+_NODE_INFO = compile_template('{_comment} 🖋 {_node.path_string} ➜ {_node.type_}')
+_FRAME_INFO = compile_template('{_comment} 🖋 {_node.path_string} ➜ {_node.type_}{_text_after_macro}')
+
+
+@cache
+def _format_fields(text: str) -> frozenset[tuple[str, str | None]] | None:
+    r"""The fields of a format string as pairs `(name, attribute)` (``None`` if some field is not that simple)"""
+    references = compile_template(text).references
+    if references is None or any(len(a) > 1 or (a and not a[0][0]) for _, a in references):
+        return None
+    return frozenset((n, a[0][1] if a else None) for n, a in references)
@@ -39,6 +39,7 @@ from byron.classes.value_bag import USER_PARAMETER
 from byron.classes.value_bag import ValueBag
 from byron.classes.node_view import NodeView
 from byron.classes.parameter import ParameterABC
+from byron.tools.template import Template, compile_template
 
 
 class Macro(SElement, Paranoid):
@@ -62,6 +63,11 @@ class Macro(SElement, Paranoid):
     def text(self) -> str:
         return self.TEXT
 
+    @property
+    def template(self) -> Template:
+        r"""The `text` of the macro, compiled"""
+        return compile_template(self.text)
+
     @property
     def parameter_types(self) -> dict[str, type[ParameterABC]]:
         return self.PARAMETERS
@@ -72,7 +78,7 @@ class Macro(SElement, Paranoid):
 
     def dump(self, parameters: ValueBag) -> str:
         assert check_valid_type(parameters, ValueBag)
-        return self.text.format(**parameters)
+        return self.template.render(parameters)
 
     @staticmethod
     def is_name_valid(name: str) -> bool:
@@ -27,8 +27,14 @@
 
 __all__ = ['Node', 'NODE_ZERO']
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 import networkx as nx
 
+# Translation table used when node labels are rendered (see `Node.translated_labels`)
+_label_translation: ContextVar[dict | None] = ContextVar('label_translation', default=None)
+
 
 class Node(int):
     r"""Simple helper to guarantee Node ids uniqueness"""
@@ -42,7 +48,35 @@ class Node(int):
         return int.__new__(cls, Node.__LAST_BYRON_NODE)
 
     def __repr__(self):
-        return f'n{int(self)}'
+        return f'n{self.label}'
+
+    def __format__(self, format_spec):
+        if not format_spec:
+            return repr(self)
+        return format(self.label, format_spec)
+
+    @property
+    def label(self) -> int:
+        r"""The label of the node when rendered (ie. its id, unless a translation is in effect)"""
+        translation = _label_translation.get()
+        if translation is None:
+            return int(self)
+        return int(translation.get(self, self))
+
+    @staticmethod
+    @contextmanager
+    def translated_labels(translation: dict[int, int]):
+        r"""Render node labels through `translation` in the current context, without touching any graph"""
+        token = _label_translation.set(translation)
+        try:
+            yield
+        finally:
+            _label_translation.reset(token)
+
+    @staticmethod
+    def canonic_labels(G: nx.MultiDiGraph) -> dict['Node', 'Node']:
+        """The "canonic" labels of Graph nodes (ie. their position in the graph)"""
+        return {k: Node(i) for i, k in enumerate(G.nodes)}
 
     @staticmethod
     def reset_labels(G: nx.MultiDiGraph) -> None:
@@ -62,7 +96,7 @@ class Node(int):
         from byron.tools.graph import fasten_subtree_parameters
         from byron.classes.node_reference import NodeReference
 
-        new_labels = {k: Node(i) for i, k in enumerate(G.nodes)}
+        new_labels = Node.canonic_labels(G)
         G = nx.relabel_nodes(G, new_labels, copy=True)
         for k, v in new_labels.items():
             G.nodes[v]['%old_label'] = k
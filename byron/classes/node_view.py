@@ -112,16 +112,12 @@ class NodeView:
 
     @cached_property
     def tree(self) -> nx.DiGraph:
-        return make_digraph(
-            tuple(self.ref.graph.nodes),
-            tuple((u, v) for u, v, k in self.ref.graph.edges(data="_type") if k == FRAMEWORK),
-        )
+        return get_framework_tree(self.ref.graph)
 
     @cached_property
     def parent(self) -> 'NodeView':
         """NodeView of the parent in the structure tree"""
-        parent = next((u for u, v, k in self.ref.graph.in_edges(self.ref.node, data="_type") if k == FRAMEWORK), 0)
-        return NodeView(NodeReference(self.ref.graph, parent))
+        return NodeView(NodeReference(self.ref.graph, get_predecessor(self.ref)))
 
     @property
     def children(self) -> list['NodeView']:
@@ -139,7 +135,7 @@ class NodeView:
         node = self.ref.node
         while node > 0:
             path.append(NodeView(NodeReference(self.ref.graph, node)))
-            node = next(u for u, v, k in self.ref.graph.in_edges(node, data="_type") if k == FRAMEWORK)
+            node = get_predecessor(NodeReference(self.ref.graph, node))
         path.append(NodeView(NodeReference(self.ref.graph, node)))
         return tuple(reversed(path))
 
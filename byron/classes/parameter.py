@@ -73,6 +73,19 @@ class ParameterABC(SElement, Paranoid):
     def __format__(self, format_spec):
         return format(self.value, format_spec)
 
+    def __copy__(self):
+        # NOTE: way faster than the generic `copy` protocol, and parameters are cloned *a lot*
+        clone = object.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        for name, value in self._slot_state.items():
+            setattr(clone, name, value)
+        return clone
+
+    @property
+    def _slot_state(self) -> dict[str, Any]:
+        r"""The attributes stored in `__slots__` (eg. `_target_frame` of global references), not in `__dict__`"""
+        return {n: getattr(self, n) for n in _slot_names(self.__class__) if hasattr(self, n)}
+
     @property
     def key(self):
         return self._key
@@ -114,12 +127,15 @@ class ParameterStructuralABC(ParameterABC):
         super().__init__()
         self._node_reference = None
 
-    def fasten(self, node_reference):
+    def fasten(self, node_reference, *, rekey: bool = True):
+        r"""Binds the parameter to a node, optionally re-keying the link (not needed if the key is already unique)"""
         assert check_valid_type(node_reference, NodeReference)
         assert check_valid_type(node_reference.graph, MultiDiGraph)
         assert check_valid_type(node_reference.node, int)
         assert node_reference.node in node_reference.graph
         self._node_reference = node_reference
+        if not rekey:
+            return
         old_value = self.value
         if old_value:
             self.value = None
@@ -187,3 +203,18 @@ class ParameterStructuralABC(ParameterABC):
         assert check_valid_type(obj, int)
         # TODO: Da fare?
         return True
+
+
+# =[PRIVATE FUNCTIONS]==================================================================================================
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> tuple[str, ...]:
+    r"""The names of the attributes declared in the `__slots__` of `cls` and of its ancestors"""
+    names = list()
+    for c in cls.__mro__:
+        slots = c.__dict__.get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ('__dict__', '__weakref__') and name not in names:
+                names.append(name)
+    return tuple(names)
@@ -29,14 +29,18 @@ __all__ = ["Population"]
 
 import logging
 from collections.abc import Sequence
-from typing import Callable, Any
+from typing import Callable, Any, TextIO
 from copy import copy
+from functools import cmp_to_key
+
+import numpy as np
 
 from byron.global_symbols import *
 from byron.classes.node import NODE_ZERO
 from byron.user_messages import *
 from byron.classes.selement import SElement
 from byron.classes.fitness import FitnessABC
+from byron.classes.fitness_matrix import FitnessMatrix
 from byron.classes.individual import Individual
 from byron.tools.entropy import *
 
@@ -47,6 +51,10 @@ class Population:
     _individuals: list[Individual]
     _memory: set | None
     _generation: int
+    _fitness_matrix: FitnessMatrix | None
+    _fitness_matrix_state: tuple | None
+    _ranks: np.ndarray | None
+    _ranks_state: tuple | None
 
     def __init__(self, top_frame: type[SElement], extra_parameters: dict | None = None, *, memory: bool = False):
         assert check_valid_types(top_frame, SElement, subclass=True)
@@ -55,8 +63,12 @@ class Population:
         if extra_parameters is None:
             extra_parameters = dict()
         self._population_extra_parameters = DEFAULT_EXTRA_PARAMETERS | DEFAULT_OPTIONS | extra_parameters
-        self._individuals = list()
+        self._individuals = _IndividualList()
         self._generation = -1
+        self._fitness_matrix = None
+        self._fitness_matrix_state = None
+        self._ranks = None
+        self._ranks_state = None
         if memory:
             self._memory = set()
         else:
@@ -70,6 +82,41 @@ class Population:
     def individuals(self) -> list[Individual]:
         return self._individuals
 
+    @property
+    def fitness_matrix(self) -> FitnessMatrix | None:
+        r"""The fitness values of all individuals as a `FitnessMatrix`, in the same order (``None`` if not available)
+
+        The matrix is rebuilt only when individuals are added, evaluated, removed, or reordered. It is not available
+        if some individuals are not evaluated, or if their fitness type cannot be represented.
+        """
+        state = self._state()
+        if state[1] is None or state != self._fitness_matrix_state:
+            self._fitness_matrix_state = None
+            if all(i.finalized for i in self._individuals):
+                self._fitness_matrix = FitnessMatrix.from_fitness([i.fitness for i in self._individuals])
+                self._fitness_matrix_state = state
+            else:
+                self._fitness_matrix = None
+        return self._fitness_matrix
+
+    @property
+    def ranks(self) -> np.ndarray:
+        r"""The index of the Pareto front of each individual, from 0 (the best front)
+
+        Ranks are the ones used by `sort`, and are recomputed only when individuals are added, evaluated, removed, or
+        reordered; removing the last individuals (eg. the worst ones, after `sort`) does not change the ranks of the
+        others. All individuals must be evaluated.
+        """
+        state = self._state()
+        if self._is_truncation_of(self._ranks_state):
+            self._ranks = self._ranks[: state[2]]
+            self._ranks_state = state
+        elif state[1] is None or state != self._ranks_state:
+            rank = {id(i): r for r, front in enumerate(self._fronts()) for i in front}
+            self._ranks = np.array([rank[id(i)] for i in self._individuals], dtype=np.int64)
+            self._ranks_state = state
+        return self._ranks
+
     @property
     def population_extra_parameters(self) -> dict:
         return copy(self._population_extra_parameters)
@@ -150,9 +197,18 @@ class Population:
         if extra_parameters is None:
             extra_parameters = dict()
         assert extra_parameters is None or check_valid_type(extra_parameters, dict)
-        return ind.canonic_representation.dump(self.population_extra_parameters | extra_parameters)
+        return ind.dump(self.population_extra_parameters | extra_parameters, canonic=True)
         # return ind.dump(self.population_extra_parameters | extra_parameters)
 
+    def dump_individual_to(self, ind: int | Individual, stream: TextIO, extra_parameters: dict | None = None) -> None:
+        r"""Write the canonic phenotype of an individual into `stream` (see `dump_individual`)"""
+        if isinstance(ind, int):
+            ind = self.individuals[ind]
+        if extra_parameters is None:
+            extra_parameters = dict()
+        assert check_valid_type(extra_parameters, dict)
+        ind.dump_to(stream, self.population_extra_parameters | extra_parameters, canonic=True)
+
     def evaluate(self):
         raise NotImplementedError
         whole_pop = [self.dump_individual(i) for i in self.individuals]
@@ -164,21 +220,25 @@ class Population:
             i.fitness = f
 
     def sort(self):
-        fronts = list()
-        sorted_ = list()
-        individuals = set(self._individuals)
-
-        while individuals:
-            pareto = set(
-                i1
-                for i1 in individuals
-                if all(i1.fitness == i2.fitness or i1.fitness >> i2.fitness for i2 in individuals)
-            )
-            fronts.append(pareto)
-            individuals -= pareto
-            sorted_ += sorted(pareto, key=lambda i: (i.fitness, -i.id))
-
-        self._individuals = sorted_
+        r"""Sort individuals by Pareto fronts, from the best one; inside a front, newer individuals come first
+
+        Fitness types with a `sort_key` are sorted in O(n log n); types with `objectives` are split into fronts with the
+        fast non-dominated sort by Deb et al., comparing all values at once in the `fitness_matrix`; other totally
+        ordered types are sorted in O(n log n) comparisons; generic partial orders with the fast non-dominated sort.
+        """
+        fronts = self._fronts()
+        if self._is_totally_ordered():
+            self._individuals[:] = [i for front in fronts for i in sorted(front, key=lambda i: -i.id)]
+        else:
+            self._individuals[:] = [i for front in fronts for i in sorted(front, key=lambda i: (i.fitness, -i.id))]
+        self._ranks = np.repeat(np.arange(len(fronts)), [len(f) for f in fronts])
+        self._ranks_state = self._state()
+
+    def compact(self) -> None:
+        """Store the genomes of all finalized individuals in compact form (see `Individual.compact`)."""
+        for i in self._individuals:
+            if i.finalized:
+                i.compact()
 
     def aging(self, step: int = 1, top_n: int = None):
         for i in self._individuals[top_n:]:
@@ -190,3 +250,148 @@ class Population:
     def life_cycle(self, lifespan: int, step: int = 1, top_n: int = None):
         self.aging(step, top_n)
         self -= self.get_elders(lifespan, top_n)
+
+    # =[PRIVATE METHODS]================================================================================================
+
+    def _state(self) -> tuple:
+        # NOTE: the version is None if `_individuals` has been replaced with a plain list
+        return id(self._individuals), getattr(self._individuals, 'version', None), len(self._individuals)
+
+    def _is_truncation_of(self, state: tuple | None) -> bool:
+        r"""Whether the individuals are the ones of `state`, at most without some of the last ones"""
+        current = self._state()
+        return (
+            state is not None
+            and current[1] is not None
+            and state[0] == current[0]
+            and state[1] >= self._individuals.prefix_version
+            and state[2] >= current[2]
+        )
+
+    def _is_totally_ordered(self) -> bool:
+        # NOTE: the fitness values must be of the same type, and some types are totally ordered only for some values
+        return len({type(i.fitness) for i in self._individuals}) == 1 and all(
+            i.fitness.in_total_order() for i in self._individuals
+        )
+
+    def _fronts(self) -> list[list[Individual]]:
+        fitness_types = {type(i.fitness) for i in self._individuals}
+        fitness_type = next(iter(fitness_types)) if len(fitness_types) == 1 else None
+        if fitness_type is not None and fitness_type.has_sort_key():
+            return _total_order_fronts(self._individuals, True)
+        elif (matrix := self.fitness_matrix) is not None:
+            return [[self._individuals[r] for r in front] for front in matrix.fronts()]
+        elif self._is_totally_ordered():
+            return _total_order_fronts(self._individuals, False)
+        else:
+            return _non_dominated_fronts(self._individuals)
+
+
+# =[PRIVATE FUNCTIONS]==================================================================================================
+
+
+class _IndividualList(list):
+    """A list of individuals counting its modifications (see `Population.fitness_matrix`)
+
+    `prefix_version` is the oldest version the list is still a prefix of, ie. since then individuals have only been
+    removed from the tail (see `Population.ranks`).
+    """
+
+    version: int = 0
+    prefix_version: int = 0
+
+    def __setitem__(self, key, value):
+        self._modified(isinstance(value, list) and not value and self._is_tail(key))
+        return super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._modified(self._is_tail(key))
+        return super().__delitem__(key)
+
+    def pop(self, index=-1):
+        self._modified(index in (-1, len(self) - 1))
+        return super().pop(index)
+
+    def clear(self):
+        self._modified(True)
+        return super().clear()
+
+    def _modified(self, truncation: bool = False) -> None:
+        self.version += 1
+        if not truncation:
+            self.prefix_version = self.version
+
+    def _is_tail(self, key) -> bool:
+        return isinstance(key, slice) and key.step in (None, 1) and (key.stop is None or key.stop >= len(self))
+
+
+def _tracked(method: Callable) -> Callable:
+    def tracked_method(self, *args, **kwargs):
+        self._modified()
+        return method(self, *args, **kwargs)
+
+    tracked_method.__name__ = method.__name__
+    return tracked_method
+
+
+for _name in (
+    '__iadd__',
+    '__imul__',
+    'append',
+    'extend',
+    'insert',
+    'remove',
+    'sort',
+    'reverse',
+):
+    setattr(_IndividualList, _name, _tracked(getattr(list, _name)))
+
+
+def _compare_fitness(i1: Individual, i2: Individual) -> int:
+    if i1.fitness == i2.fitness:
+        return 0
+    return 1 if i1.fitness >> i2.fitness else -1
+
+
+def _total_order_fronts(individuals: Sequence[Individual], use_key: bool) -> list[list[Individual]]:
+    """Groups of indistinguishable individuals, from the best one"""
+    if use_key:
+        ranked = sorted(individuals, key=lambda i: i.fitness.sort_key(), reverse=True)
+    else:
+        ranked = sorted(individuals, key=cmp_to_key(_compare_fitness), reverse=True)
+    fronts = list()
+    for i in ranked:
+        # NOTE: the fitness of the first individual of a front is fitter than, or equal to, all the following ones
+        if fronts and i.fitness == fronts[-1][0].fitness:
+            fronts[-1].append(i)
+        else:
+            fronts.append([i])
+    return fronts
+
+
+def _non_dominated_fronts(individuals: Sequence[Individual]) -> list[list[Individual]]:
+    """Pareto fronts, from the best one (fast non-dominated sort, see Deb et al., 10.1109/4235.996017)"""
+    individuals = list(individuals)
+    dominated = [list() for _ in individuals]
+    domination_count = [0] * len(individuals)
+    for p, i1 in enumerate(individuals):
+        for q in range(p + 1, len(individuals)):
+            i2 = individuals[q]
+            if i1.fitness >> i2.fitness:
+                dominated[p].append(q)
+                domination_count[q] += 1
+            elif i2.fitness >> i1.fitness:
+                dominated[q].append(p)
+                domination_count[p] += 1
+    fronts = list()
+    front = [p for p, c in enumerate(domination_count) if c == 0]
+    while front:
+        fronts.append([individuals[p] for p in front])
+        next_front = list()
+        for p in front:
+            for q in dominated[p]:
+                domination_count[q] -= 1
+                if domination_count[q] == 0:
+                    next_front.append(q)
+        front = next_front
+    return fronts
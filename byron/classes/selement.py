@@ -30,6 +30,7 @@ __all__ = ['SElement', 'SElementMeta']
 from typing import Callable, Sequence, Optional
 from collections import defaultdict
 import re
+import weakref
 from uuid import uuid1 as generate_uuid
 
 from byron.global_symbols import *
@@ -46,6 +47,7 @@ class SElementMeta(type):
     FORCED_PARENT: type | str | None
 
     _counters = defaultdict(int)
+    _classes = weakref.WeakValueDictionary()  # all SElement classes, by BYRON_CLASS_ID
 
     def __new__(cls, name, *args, **kwargs):
         # new_cls = super(SElementMeta, cls).__new__(cls, name, *args, **kwargs)
@@ -54,8 +56,14 @@ class SElementMeta(type):
         new_cls.BYRON_CLASS_ID = f'⎨{name}${generate_uuid()}⎬'
         new_cls.BYRON_CLASS_TAGS = tuple()
         new_cls.FORCED_PARENT = None
+        SElementMeta._classes[new_cls.BYRON_CLASS_ID] = new_cls
         return new_cls
 
+    @staticmethod
+    def get_class(class_id: str) -> Optional[type['SElement']]:
+        r"""Returns the SElement class with the given `BYRON_CLASS_ID` (``None`` if not found)"""
+        return SElementMeta._classes.get(class_id)
+
     def __eq__(self, other):
         # print(f"SElementMeta.__eq__:: self: {self} ({self!r}) =?= other: {other} ({other!r})")
         if isinstance(other, str):
@@ -92,7 +100,9 @@ class SElementMeta(type):
         from byron.classes.parameter import ParameterABC
 
         if custom_class_id:
+            SElementMeta._classes.pop(cls.BYRON_CLASS_ID, None)
             cls.BYRON_CLASS_ID = custom_class_id
+            SElementMeta._classes[custom_class_id] = cls
             B = '❰❱'
             assert not name, f"{PARANOIA_VALUE_ERROR}: Cannot specify 'name' if 'custom_class_id'"
             name = custom_class_id
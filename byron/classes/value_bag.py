@@ -28,6 +28,8 @@
 __all__ = ["ValueBag", "USER_PARAMETER"]
 
 import re
+from functools import cache
+from collections.abc import Mapping
 
 from byron.user_messages import *
 
@@ -47,6 +49,8 @@ class ValueBag(dict):
     * Only safe keys appear when using standard iterator (`for k in value_bag`) or parameter expansion (`**value_bag`).
     * Safe keys can be accessed as attributes (`value_bag.foo`).
     * The default value for missing keys is None
+
+    A ValueBag may also be a read-only layer on top of a parent ValueBag (see `layered`).
     """
 
     FLAG_KEY = re.compile(r"\$[a-z_0-9]*", re.IGNORECASE)
@@ -61,8 +65,26 @@ class ValueBag(dict):
         else:
             super().__init__(**items)
 
+    @staticmethod
+    def layered(parent: "ValueBag", layer: Mapping) -> "ValueBag":
+        """A ValueBag with the items of `layer` on top of the ones of `parent`, which is not copied."""
+        assert check_valid_type(parent, ValueBag)
+        return _LayeredValueBag(parent, layer)
+
+    @staticmethod
+    @cache
+    def is_safe_key(key: str) -> bool:
+        """Check whether a key is a safe key (the result is cached)."""
+        return isinstance(key, str) and bool(ValueBag.SAFE_KEY.fullmatch(key))
+
+    @staticmethod
+    @cache
+    def is_flag_key(key: str) -> bool:
+        """Check whether a key is a reserved key (the result is cached)."""
+        return isinstance(key, str) and bool(ValueBag.FLAG_KEY.fullmatch(key))
+
     def __str__(self):
-        return "{{" + ", ".join(f"{k!r}: {self[k]!r}" for k in sorted(super().keys())) + "}}"
+        return "{{" + ", ".join(f"{k!r}: {self[k]!r}" for k in sorted(self._keys())) + "}}"
 
     def __repr__(self):
         return f"<{self.__class__.__module__}.{self.__class__.__name__} @ {hex(id(self))}>"
@@ -86,7 +108,7 @@ class ValueBag(dict):
         raise NotImplementedError(f"ValueBag is read-only: can't delete {key!r}")
 
     def __missing__(self, key):
-        if ValueBag.FLAG_KEY.fullmatch(key):
+        if ValueBag.is_flag_key(key):
             return False
         else:
             return None
@@ -102,7 +124,7 @@ class ValueBag(dict):
 
     def __getattr__(self, key: str):
         assert check_valid_type(key, str)
-        assert ValueBag.SAFE_KEY.fullmatch(key), f"KeyError (paranoia check): invalid key: {key!r}"
+        assert ValueBag.is_safe_key(key), f"KeyError (paranoia check): invalid key: {key!r}"
         return self[key]
 
     def __iter__(self):
@@ -125,15 +147,15 @@ class ValueBag(dict):
 
     def keys(self):
         """Same as dict.keys(), but for safe keys only."""
-        return [k for k in super().keys() if ValueBag.SAFE_KEY.fullmatch(k)]
+        return [k for k in self._keys() if ValueBag.is_safe_key(k)]
 
     def values(self):
         """Same as dict.values(), but for safe keys only."""
-        return [v for k, v in super().items() if ValueBag.SAFE_KEY.fullmatch(k)]
+        return [v for k, v in self._items() if ValueBag.is_safe_key(k)]
 
     def items(self):
         """Same as dict.items(), but for safe keys only."""
-        return [(k, v) for k, v in super().items() if ValueBag.SAFE_KEY.fullmatch(k)]
+        return [(k, v) for k, v in self._items() if ValueBag.is_safe_key(k)]
 
     def _keys(self):
         """Same as dict.keys()."""
@@ -150,3 +172,46 @@ class ValueBag(dict):
     # todo
     def __hash__(self):
         return hash(tuple(sorted(self.items())))
+
+
+class _LayeredValueBag(ValueBag):
+    """A ValueBag whose missing keys are looked up in a parent ValueBag (see `ValueBag.layered`)."""
+
+    def __init__(self, parent: ValueBag, layer: Mapping):
+        super().__init__(layer)
+        object.__setattr__(self, '_parent', parent)
+
+    def __missing__(self, key):
+        return self._parent[key]
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._parent
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __eq__(self, other):
+        return dict(self._items()) == (dict(other._items()) if isinstance(other, ValueBag) else other)
+
+    def __hash__(self):
+        return super().__hash__()
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def _keys(self):
+        return self._flatten().keys()
+
+    def _values(self):
+        return self._flatten().values()
+
+    def _items(self):
+        return self._flatten().items()
+
+    def _flatten(self) -> dict:
+        flat = dict(self._parent._items())
+        flat.update(dict.items(self))
+        return flat
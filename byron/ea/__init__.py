@@ -26,6 +26,8 @@
 
 from .vanilla import *
 from .adaptive import *
+from .steady_state import *
+from .islands import *
 from .selection import *
 from .check import *
 from .common import *
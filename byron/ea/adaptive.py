@@ -65,6 +65,8 @@ def adaptive_ea(
     temperature: float = 0.85,
     entropy: bool = False,
     population_extra_parameters: dict = None,
+    population: Population | None = None,
+    on_generation: Callable[[Population], None] | None = None,
 ) -> Population:
     r"""A configurable self-adaptive evolutionary algorithm
 
@@ -96,6 +98,10 @@ def adaptive_ea(
         A all round value to tune exploration vs exploitation
     entropy
         Use population entropy parameter to promote diversity in population. Set True only if you understand how population entropy is computed!
+    population
+        An initialized population to keep evolving (eg. to run a few generations at a time)
+    on_generation
+        Called with the population at the end of each generation, after the survivors have been selected
     Returns
     -------
     Population
@@ -111,19 +117,23 @@ def adaptive_ea(
         max_fitness = make_fitness(max_fitness)
         stopping_conditions.append(lambda: best.fitness == max_fitness or best.fitness >> max_fitness)
 
-
     # initialize population
-    population = Population(top_frame, extra_parameters=population_extra_parameters, memory=False)
-    
+    if population is None:
+        population = Population(top_frame, extra_parameters=population_extra_parameters, memory=False)
+        initialize = True
+    else:
+        initialize = False
+
     ext = Estimator(population, max_generation, rewards, operators, max_fitness, temperature)
-    
-    ops0 = take_operators(True, operators)
-
-    gen0 = list()
-    while len(gen0) < mu:
-        o = rrandom.choice(ops0)
-        gen0 += o(top_frame=top_frame)
-    population += gen0
+
+    if initialize:
+        ops0 = take_operators(True, operators)
+
+        gen0 = list()
+        while len(gen0) < mu:
+            o = rrandom.choice(ops0)
+            gen0 += o(top_frame=top_frame)
+        population += gen0
     evaluator(population)
     population.sort()
     best = population[0]
@@ -135,11 +145,10 @@ def adaptive_ea(
     while not any(s() for s in stopping_conditions):
         new_individuals = list()
         sigma = ext.sigma(entropy)
-        for _ in range(lambda_):
-            op = ext.take()
-            parents = list()
-            for _ in range(op.num_parents):
-                parents.append(tournament_selection(population, 1))
+        selected_ops = ext.take_many(lambda_)
+        all_parents = iter(batch_tournament_selection(population, sum(op.num_parents for op in selected_ops), 1))
+        for op in selected_ops:
+            parents = [next(all_parents) for _ in range(op.num_parents)]
             if 'strength' in signature(op).parameters:
                 new_individuals += op(*parents, strength=sigma)
             else:
@@ -155,7 +164,10 @@ def adaptive_ea(
         all_individuals |= set(population)
 
         population.individuals[mu:] = []
-        
+        if on_generation is not None:
+            on_generation(population)
+        population.compact()
+
         if best.fitness << population[0].fitness:
             best = population[0]
             _new_best(population, evaluator)
@@ -30,7 +30,7 @@ from typing import Callable, Sequence
 from math import sqrt, log, ceil
 
 from byron.fitness import make_fitness
-from byron.randy import rrandom
+from byron.randy import rrandom, WeightedSampler
 from byron.classes import Population
 from byron.classes.fitness import FitnessABC
 from byron.ea.common import take_operators
@@ -43,6 +43,7 @@ class Estimator:
     _operators: dict
     _rewards: list[float]
     _probabilities: list[tuple]
+    _sampler: WeightedSampler
     _near: FitnessABC | None
     _best: FitnessABC | None
     _temperature: float
@@ -76,6 +77,7 @@ class Estimator:
         assert len(rewards) == 2, f"must specify two value for reward"
         self._rewards = rewards
         self._probabilities = [(o, 1 / len(self._operators.keys())) for o in self._operators]
+        self._sampler = WeightedSampler(*zip(*self._probabilities))
         self._exploit = False
         assert temperature > 0, f"temperature must be greater then 0"
         self._temperature = temperature
@@ -138,11 +140,14 @@ class Estimator:
             # every quarter of the run check again also discarded operators
             if self._time % ceil(self._horizon / 4) == 0:
                 self._probabilities = [(o, 1 / len(self._operators.keys())) for o in self._operators]
-        
+            self._sampler = WeightedSampler(*zip(*self._probabilities))
+
     def take(self) -> Callable:
-        return self._operators[
-            rrandom.weighted_choice([p[0] for p in self._probabilities], [p[1] for p in self._probabilities])
-        ].operator
+        return self._operators[rrandom.weighted_choice(self._sampler)].operator
+
+    def take_many(self, n: int) -> list[Callable]:
+        r"""`n` operators, drawn at once (eg. for a whole generation)"""
+        return [self._operators[o].operator for o in rrandom.weighted_choices(self._sampler, n)]
 
     # TODO: Remove use_entropy when entropy will be fully implemented
     def sigma(self, use_entropy) -> float:
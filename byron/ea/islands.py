@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# =[ HISTORY ]===============================================================
+# v1 / October 2026
+
+__all__ = ["island_model"]
+
+from typing import Any, Callable
+import multiprocessing
+import queue
+import traceback
+
+import numpy as np
+
+from byron.global_symbols import *
+from byron.classes.node import NODE_ZERO, Node
+from byron.classes.node_reference import NodeReference
+from byron.classes.selement import SElementMeta
+from byron.classes.frame import FrameABC
+from byron.classes.macro import Macro
+from byron.classes.parameter import ParameterSharedABC, ParameterStructuralABC
+from byron.classes.individual import Individual, Lineage
+from byron.classes.population import Population
+from byron.classes.evaluator import EvaluatorABC
+from byron.randy import rrandom
+from byron.tools.graph import fasten_subtree_parameters
+from byron.user_messages import *
+from .vanilla import vanilla_ea
+
+# A genome is serialized as a pair `(nodes, tree)`. Nodes (NODE_ZERO excluded) are listed in the same order as in the
+# graph, each one as a tuple `(class, values)`: the index of its SElement class in the class table of the message, and
+# the values of its parameters sorted by name. Structural parameters store the index of their target node, shared
+# parameters are not stored at all. The tree is the list of framework edges `(parent, child)`, in the same order as in
+# the graph, as the order of siblings is relevant.
+
+
+def _migration():
+    r"""Pseudo genetic operator used in the lineage of migrants"""
+    pass
+
+
+def _encode(individuals: list[Individual]) -> tuple[tuple[str], list[tuple[tuple, Any]]]:
+    r"""Serialize individuals and their fitness as a class table plus a list of `(genome, fitness)`"""
+    classes = dict()
+    genomes = list()
+    for individual in individuals:
+        G = individual.genome
+        index = {n: i for i, n in enumerate(G.nodes)}
+        assert index[NODE_ZERO] == 0, f"{PARANOIA_VALUE_ERROR}: NODE_ZERO is not the first node"
+        nodes = list()
+        for node, selement in list(G.nodes(data='_selement'))[1:]:
+            values = list()
+            if isinstance(selement, Macro):
+                for name in sorted(selement.parameter_types):
+                    parameter = G.nodes[node][name]
+                    if isinstance(parameter, ParameterStructuralABC):
+                        values.append(index[parameter.value] if parameter.value is not None else None)
+                    elif isinstance(parameter, ParameterSharedABC):
+                        values.append(None)
+                    else:
+                        values.append(parameter.value)
+            nodes.append((classes.setdefault(selement.__class__.BYRON_CLASS_ID, len(classes)), tuple(values)))
+        tree = tuple((index[u], index[v]) for u, v, t in G.edges(data='_type') if t == FRAMEWORK)
+        genomes.append(((tuple(nodes), tree), individual.fitness))
+    return tuple(classes), genomes
+
+
+def _decode(top_frame: type[FrameABC], message: tuple[tuple[str], list[tuple[tuple, Any]]]) -> list[Individual]:
+    r"""Rebuild the individuals serialized by `_encode` (fitness values are set as well)"""
+    class_ids, genomes = message
+    classes = [SElementMeta.get_class(c) for c in class_ids]
+    assert all(c is not None for c in classes), f"{PARANOIA_VALUE_ERROR}: Unknown SElement in serialized genome"
+
+    individuals = list()
+    for (nodes, tree), fitness in genomes:
+        individual = Individual(top_frame)
+        G = individual.genome
+        labels = [NODE_ZERO]
+        links = list()
+        for class_index, values in nodes:
+            node = Node()
+            selement = classes[class_index]()
+            if isinstance(selement, Macro):
+                G.add_node(node, _type=MACRO_NODE, _selement=selement)
+                for (name, parameter_type), value in zip(sorted(selement.parameter_types.items()), values):
+                    parameter = parameter_type()
+                    G.nodes[node][name] = parameter
+                    if isinstance(parameter, ParameterStructuralABC):
+                        links.append((parameter, value))
+                    elif not isinstance(parameter, ParameterSharedABC):
+                        parameter.value = value
+            else:
+                G.add_node(node, _type=FRAME_NODE, _selement=selement)
+            labels.append(node)
+        for u, v in tree:
+            G.add_edge(labels[u], labels[v], _type=FRAMEWORK)
+        fasten_subtree_parameters(NodeReference(G, NODE_ZERO))
+        for parameter, target in links:
+            if target is not None:
+                parameter.value = labels[target]
+        individual._lineage = Lineage(_migration, tuple())
+        individual.fitness = fitness
+        individuals.append(individual)
+    return individuals
+
+
+def _island(
+    index: int,
+    algorithm: Callable,
+    top_frame: type[FrameABC],
+    evaluator: EvaluatorABC,
+    kwargs: dict,
+    seed: np.random.SeedSequence,
+    schedule: list[int],
+    plan: list[list[int]],
+    migrants: int,
+    inboxes: list,
+    results,
+) -> None:
+    r"""Evolve one island, exchanging migrants after each epoch but the last"""
+    mailbox = list()
+    epochs = {generation: epoch for epoch, generation in enumerate(schedule[:-1])}
+
+    def migrate(population: Population) -> None:
+        # NOTE: a single run of `algorithm` lasts for all the epochs, thus its internal state (eg. the operator
+        # statistics of `adaptive_ea`) is not lost at each migration
+        nonlocal mailbox
+        if (epoch := epochs.get(population.generation)) is None:
+            return
+        inboxes[plan[epoch][index]].put((epoch, index, _encode(population.individuals[:migrants])))
+        expected = sum(1 for t in plan[epoch] if t == index)
+        while sum(1 for e, _, _ in mailbox if e == epoch) < expected:
+            mailbox.append(inboxes[index].get())
+        arrived = sorted((m for m in mailbox if m[0] == epoch), key=lambda m: m[1])
+        mailbox = [m for m in mailbox if m[0] != epoch]
+
+        size = len(population)
+        for _, source, message in arrived:
+            for individual in _decode(top_frame, message):
+                individual.age.birth = population.generation
+                population.individuals.append(individual)
+            logger.debug(f"island_model: Island {index}: {len(message[1])} migrants from island {source}")
+        population.sort()
+        population.individuals[size:] = []
+
+    try:
+        rrandom.seed(seed)
+        population = algorithm(top_frame, evaluator, max_generation=schedule[-1], on_generation=migrate, **kwargs)
+        evaluator.close()
+        results.put((index, None, _encode(population.individuals)))
+    except BaseException:
+        results.put((index, traceback.format_exc(), None))
+
+
+def island_model(
+    top_frame: type[FrameABC],
+    evaluator: EvaluatorABC,
+    *,
+    algorithm: Callable = vanilla_ea,
+    num_islands: int = 4,
+    max_generation: int = 100,
+    migration_interval: int = 10,
+    migrants: int = 1,
+    topology: str = 'ring',
+    seed: Any = None,
+    **kwargs,
+) -> list[Population]:
+    r"""Evolve independent populations in separate processes, periodically exchanging their best individuals
+
+    Each island is a separate process running `algorithm` (ie. `vanilla_ea`, `adaptive_ea`, or any function accepting
+    an `on_generation` hook). Every `migration_interval` generations, each island sends its best `migrants` individuals
+    to another island, where they replace the worst ones. With the ``'ring'`` topology island *i* sends to island
+    *i+1*; with the ``'random'`` topology the destination is chosen at random at each migration. Individuals travel as
+    compact tuples of class indexes, parameter values and edges, not as pickled graphs.
+
+    Each island uses its own random stream, spawned from `seed` (or, if `seed` is ``None``, from `rrandom`), thus
+    results are reproducible. Islands are created with the ``fork`` start method: the `evaluator` is inherited by all
+    of them and should not hold a pool of workers when `island_model` is called.
+
+    Parameters
+    ----------
+    top_frame
+        The top_frame of individuals
+    evaluator
+        The evaluator used to evaluate individuals
+    algorithm
+        The evolutionary algorithm run on each island
+    num_islands
+        The number of islands (ie. processes)
+    max_generation
+        The number of generations
+    migration_interval
+        The number of generations between two migrations
+    migrants
+        The number of individuals sent by each island at each migration
+    topology
+        Either ``'ring'`` or ``'random'``
+    seed
+        The seed of the random streams of the islands
+    kwargs
+        Extra parameters for `algorithm` (eg. `mu`, `lambda_`)
+
+    Returns
+    -------
+    list[Population]
+        The last populations of all islands
+
+    """
+    assert check_value_range(num_islands, 1)
+    assert check_value_range(max_generation, 1)
+    assert check_value_range(migration_interval, 1)
+    assert check_value_range(migrants, 0)
+    assert topology in ('ring', 'random'), f"ValueError: unknown topology: {topology!r}"
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        raise NotImplementedError("island_model: The 'fork' start method is not available on this platform")
+
+    if seed is None:
+        seed = rrandom.random_int(0, 2**31)
+    seeds = np.random.SeedSequence(seed).spawn(num_islands + 1)
+    schedule = list(range(migration_interval, max_generation, migration_interval)) + [max_generation]
+    if topology == 'ring':
+        plan = [[(i + 1) % num_islands for i in range(num_islands)] for _ in schedule[:-1]]
+    else:
+        topology_generator = np.random.default_rng(seeds[-1])
+        plan = [
+            [
+                (i + 1 + int(topology_generator.integers(max(1, num_islands - 1)))) % num_islands
+                for i in range(num_islands)
+            ]
+            for _ in schedule[:-1]
+        ]
+
+    context = multiprocessing.get_context('fork')
+    inboxes = [context.Queue() for _ in range(num_islands)]
+    results = context.Queue()
+    islands = [
+        context.Process(
+            target=_island,
+            args=(i, algorithm, top_frame, evaluator, kwargs, seeds[i], schedule, plan, migrants, inboxes, results),
+            name=f"byron_island${i}",
+            daemon=True,
+        )
+        for i in range(num_islands)
+    ]
+    logger.info(f"island_model: Starting {num_islands} islands ({topology} topology, seed: {seed!r})")
+    for island in islands:
+        island.start()
+
+    messages = dict()
+    try:
+        while len(messages) < num_islands:
+            try:
+                index, error, message = results.get(timeout=1)
+            except queue.Empty:
+                if any(island.exitcode for island in islands):
+                    raise ChildProcessError("island_model: An island terminated unexpectedly")
+                continue
+            if error:
+                raise ChildProcessError(f"island_model: Island {index} failed\n{error}")
+            messages[index] = message
+    finally:
+        for island in islands:
+            if island.is_alive() and len(messages) < num_islands:
+                island.terminate()
+            island.join()
+
+    populations = list()
+    for index in range(num_islands):
+        population = Population(top_frame, extra_parameters=kwargs.get('population_extra_parameters'))
+        population += _decode(top_frame, messages[index])
+        population.sort()
+        populations.append(population)
+    return populations
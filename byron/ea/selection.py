@@ -26,6 +26,8 @@
 # HISTORY
 # v1 / July 2023 / Squillero (GX)
 
+import numpy as np
+
 from byron.user_messages.checks import *
 from byron.classes.individual import Individual
 from byron.classes.population import Population
@@ -34,7 +36,34 @@ from byron.randy import rrandom
 
 def tournament_selection(population: Population, tournament_size: float = 2) -> Individual:
     assert check_value_range(tournament_size, min_=1)
-    candidates = [rrandom.choice(population.individuals) for _ in range(tournament_size)]
+    candidates = rrandom.choices(population.individuals, int(tournament_size))
     if rrandom.boolean(p_true=tournament_size % 1):
         candidates.append(rrandom.choice(population.individuals))
     return max(candidates, key=lambda i: i.fitness)
+
+
+def batch_tournament_selection(population: Population, n: int, tournament_size: float = 2) -> list[Individual]:
+    r"""The winners of `n` independent tournaments, drawn all at once
+
+    Each tournament has `int(tournament_size)` participants, plus one with probability `tournament_size % 1`. The
+    winner is the participant with the best rank in the population (see `Population.ranks`), or the first one drawn
+    among the best. All participants are drawn with a single call to the random generator.
+    """
+    assert check_value_range(tournament_size, min_=1)
+    assert check_value_range(n, min_=0)
+    size = int(tournament_size)
+    fraction = tournament_size % 1
+    if fraction:
+        candidates = rrandom.random_ints(n * (size + 1), 0, len(population)).reshape(n, size + 1)
+        participates = rrandom.random_floats(n) < fraction
+    else:
+        candidates = rrandom.random_ints(n * size, 0, len(population)).reshape(n, size)
+    if candidates.shape[1] > 1:
+        ranks = population.ranks[candidates]
+        if fraction:
+            # NOTE: the extra participant of a tournament may be absent
+            ranks[~participates, -1] = len(population)
+        winners = candidates[np.arange(n), ranks.argmin(axis=1)]
+    else:
+        winners = candidates[:, 0]
+    return [population[w] for w in winners.tolist()]
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# =[ HISTORY ]===============================================================
+# v1 / October 2026
+
+__all__ = ["steady_state_ea"]
+
+from typing import Optional
+
+import os
+from time import perf_counter_ns, process_time_ns
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from byron.operators import *
+from byron.sys import *
+from byron.classes.selement import *
+from byron.classes.frame import *
+from byron.classes.evaluator import *
+from byron.fitness import make_fitness
+from byron.user_messages import logger as byron_logger
+from .common import take_operators
+from .selection import *
+from .vanilla import _elapsed, _new_best
+
+
+# Consecutive breeding failures (empty offspring) before giving up
+MAX_BREEDING_FAILURES = 100
+
+
+def _breed(population: Population) -> tuple[list[Individual], list[Individual]]:
+    op = rrandom.choice(take_operators(False))
+    parents = batch_tournament_selection(population, op.num_parents, 1)
+    return op(*parents), parents
+
+
+def steady_state_ea(
+    top_frame: type[FrameABC],
+    evaluator: EvaluatorABC,
+    mu: int = 10,
+    max_evaluations: int = 1_000,
+    max_in_flight: int | None = None,
+    max_fitness: Optional = None,
+    replacement: str = 'worst',
+    population_extra_parameters: dict = None,
+) -> Population:
+    r"""An asynchronous steady-state evolutionary algorithm
+
+    The algorithm keeps `max_in_flight` evaluations running concurrently. Whenever one of them completes, the
+    offspring are inserted into the population, and a new set of offspring is bred from the current population and
+    submitted. Thus, workers never sit idle waiting for the slowest individual of a generation.
+
+    Each set of offspring is evaluated as a separate small population by `evaluator` in a dedicated thread. The
+    parallelism is ultimately handled by the evaluator: with a sequential `PythonEvaluator`, the fitness function is
+    called concurrently by different threads; with a pool-based one, evaluations are dispatched to its workers.
+
+    The `replacement` policy determines which individuals leave the population: ``'worst'`` keeps the best `mu`
+    individuals; ``'oldest'`` removes the oldest ones, but never the current best.
+
+    Parameters
+    ----------
+    top_frame
+        The top_frame of individuals
+    evaluator
+        The evaluator used to evaluate individuals
+    mu
+        The size of the population
+    max_evaluations
+        The number of offspring to be evaluated
+    max_in_flight
+        The number of concurrent evaluations (``None`` for the `max_workers` of the evaluator, or the number of CPUs)
+    max_fitness
+        Stop as soon as this fitness is reached
+    replacement
+        The replacement policy (``'worst'`` or ``'oldest'``)
+
+    Returns
+    -------
+    Population
+        The last population
+
+    """
+    assert check_value_range(mu, 1)
+    assert check_value_range(max_evaluations, 0)
+    assert max_in_flight is None or check_value_range(max_in_flight, 1)
+    assert replacement in ('worst', 'oldest'), f"ValueError: unknown replacement policy: {replacement!r}"
+    if max_in_flight is None:
+        max_in_flight = evaluator.max_workers or os.cpu_count()
+
+    start = perf_counter_ns(), process_time_ns()
+    byron_logger.info("SteadyStateEA: 🌊 [b]SteadyStateEA started[/] ┈ %s", _elapsed(start, process=True))
+
+    SElement.is_valid = SElement._is_valid_debug
+    population = Population(top_frame, extra_parameters=population_extra_parameters, memory=False)
+
+    # Initialize population
+    ops0 = take_operators(True)
+    gen0 = list()
+    while len(gen0) < mu:
+        o = rrandom.choice(ops0)
+        gen0 += o(top_frame=top_frame)
+
+    population += gen0
+    evaluator(population)
+    population.sort()
+    best = population[0]
+    _new_best(population, evaluator, algorithm="SteadyStateEA")
+
+    silent_pause = 1
+    if notebook_mode:
+        silent_pause = 5
+
+    byron_logger.info("SteadyStateEA: End of initialization ┈ %s", _elapsed(start, steps=evaluator.fitness_calls))
+
+    stopping_conditions = list()
+    if max_fitness:
+        if not isinstance(max_fitness, FitnessABC):
+            max_fitness = make_fitness(max_fitness)
+        stopping_conditions.append(lambda: best.fitness == max_fitness or best.fitness >> max_fitness)
+
+    submitted = 0
+    failures = 0
+    # offspring being evaluated, and their parents (lineages only hold weak references to parents)
+    in_flight: dict[Future, tuple[list[Individual], list[Individual]]] = dict()
+    with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="byron_ssea$") as pool:
+        while not any(s() for s in stopping_conditions):
+            # Keep the workers busy
+            while len(in_flight) < max_in_flight and submitted < max_evaluations:
+                offspring, parents = _breed(population)
+                if not offspring:
+                    failures += 1
+                    if failures < MAX_BREEDING_FAILURES:
+                        continue
+                    break
+                failures = 0
+                batch = Population(top_frame, extra_parameters=population_extra_parameters, memory=False)
+                batch += offspring
+                in_flight[pool.submit(evaluator, batch)] = offspring, parents
+                submitted += len(offspring)
+            if not in_flight:
+                if submitted < max_evaluations:
+                    byron_logger.warning(
+                        "SteadyStateEA: empty offspring (no new individuals) ┈ %s",
+                        _elapsed(start, steps=evaluator.fitness_calls),
+                    )
+                break
+
+            # Insert evaluated offspring
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            old_best = best
+            for future in done:
+                future.result()
+                population += in_flight.pop(future)[0]
+            population.sort()
+            if replacement == 'worst':
+                population.individuals[mu:] = []
+            else:
+                elders = sorted(population.individuals[1:], key=lambda i: (i.age.birth, i.id))
+                population -= elders[: len(population) - mu]
+            population.compact()
+            best = population[0]
+            if best.fitness >> old_best.fitness:
+                _new_best(population, evaluator, algorithm="SteadyStateEA")
+
+            byron_logger.hesitant_log(
+                silent_pause,
+                LOGGING_INFO,
+                f"SteadyStateEA: {submitted:,} offspring submitted (𝐻: {population.entropy:.4f}) ┈ %s",
+                _elapsed(start, steps=evaluator.fitness_calls),
+            )
+
+        for future in in_flight:
+            future.cancel()
+
+    byron_logger.info("SteadyStateEA: 🌊 [b]SteadyStateEA completed[/] ┈ %s", _elapsed(start, process=True))
+    byron_logger.info(
+        f"SteadyStateEA: 🏆 {population[0].describe(include_fitness=True, include_structure=False, include_age=True, include_lineage=True)}",
+    )
+
+    return population
@@ -27,7 +27,7 @@
 
 __all__ = ["vanilla_ea"]
 
-from typing import Optional
+from typing import Callable, Optional
 
 from time import perf_counter_ns, process_time_ns
 from datetime import timedelta
@@ -63,9 +63,9 @@ def _elapsed(start, *, process: bool = False, steps: int = 0):
     return ' / '.join(data)
 
 
-def _new_best(population: Population, evaluator: EvaluatorABC):
+def _new_best(population: Population, evaluator: EvaluatorABC, *, algorithm: str = "VanillaEA"):
     byron_logger.info(
-        f"VanillaEA: 🍀 {population[0].describe(include_fitness=True, include_structure=False, include_age=True, include_lineage=False)}"
+        f"{algorithm}: 🍀 {population[0].describe(include_fitness=True, include_structure=False, include_age=True, include_lineage=False)}"
     )
 
 
@@ -77,6 +77,8 @@ def vanilla_ea(
     max_generation: int = 100,
     max_fitness: Optional = None,
     population_extra_parameters: dict = None,
+    population: Population | None = None,
+    on_generation: Callable[[Population], None] | None = None,
 ) -> Population:
     r"""A simple evolutionary algorithm
 
@@ -90,6 +92,12 @@ def vanilla_ea(
         The size of the population
     lambda_
         The size the offspring
+    max_generation
+        Stop when the population reaches this generation
+    population
+        An initialized population to keep evolving (eg. to run a few generations at a time)
+    on_generation
+        Called with the population at the end of each generation, after the survivors have been selected
 
     Returns
     -------
@@ -101,17 +109,18 @@ def vanilla_ea(
     byron_logger.info("VanillaEA: 🍦 [b]VanillaEA started[/] ┈ %s", _elapsed(start, process=True))
 
     SElement.is_valid = SElement._is_valid_debug
-    population = Population(top_frame, extra_parameters=population_extra_parameters, memory=False)
-
-    # Initialize population
-    # ops0 = [op for op in get_operators() if op.num_parents is None]
-    ops0 = take_operators(True)
-    gen0 = list()
-    while len(gen0) < mu:
-        o = rrandom.choice(ops0)
-        gen0 += o(top_frame=top_frame)
-
-    population += gen0
+    if population is None:
+        population = Population(top_frame, extra_parameters=population_extra_parameters, memory=False)
+
+        # Initialize population
+        # ops0 = [op for op in get_operators() if op.num_parents is None]
+        ops0 = take_operators(True)
+        gen0 = list()
+        while len(gen0) < mu:
+            o = rrandom.choice(ops0)
+            gen0 += o(top_frame=top_frame)
+
+        population += gen0
     evaluator(population)
     population.sort()
     best = population[0]
@@ -135,13 +144,10 @@ def vanilla_ea(
         # ops = [op for op in get_operators() if op.num_parents is not None]
         ops = take_operators(False)
         new_individuals = list()
-        for step in range(lambda_):
-            op = rrandom.choice(ops)
-            parents = list()
-            for _ in range(op.num_parents):
-                parent = tournament_selection(population, 1)
-                parents.append(parent)
-            new_individuals += op(*parents)
+        selected_ops = rrandom.choices(ops, lambda_)
+        parents = iter(batch_tournament_selection(population, sum(op.num_parents for op in selected_ops), 1))
+        for op in selected_ops:
+            new_individuals += op(*(next(parents) for _ in range(op.num_parents)))
 
         if not new_individuals:
             byron_logger.warning(
@@ -154,6 +160,9 @@ def vanilla_ea(
         # population.freeze_individual()
         population.sort()
         population.individuals[mu:] = []
+        if on_generation is not None:
+            on_generation(population)
+        population.compact()
         best = population[0]
         if best.fitness >> old_best.fitness:
             _new_best(population, evaluator)
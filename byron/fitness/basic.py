@@ -40,6 +40,8 @@ from byron.user_messages import *
 class Float(FitnessABC, float):
     """A single numeric value -- Larger is better."""
 
+    TOTAL_ORDER = True
+
     def __new__(cls, *args, **kw):
         syntax_warning_hint(
             "'Float' fitness values suffer from Floating Point Arithmetic issues and limitations (eg. .1+.1+.1 != .3) — consider using 'Scalar'"
@@ -49,20 +51,39 @@ class Float(FitnessABC, float):
     def _decorate(self):
         return "ℝ" + str(float(self))
 
+    def sort_key(self) -> float:
+        return float(self)
+
+    def objectives(self) -> tuple[tuple[float, float, float]]:
+        return ((float(self), 0.0, 0.0),)
+
 
 class Integer(FitnessABC, int):
     """A single numeric value -- Larger is better."""
 
+    TOTAL_ORDER = True
+
     def __new__(cls, *args, **kw):
         return int.__new__(cls, *args, **kw)
 
     def _decorate(self):
         return str(int(self))
 
+    def sort_key(self) -> int:
+        return int(self)
+
+    def objectives(self) -> tuple[tuple[float, float, float]] | None:
+        # NOTE: larger integers would lose precision as floats
+        if abs(int(self)) > 2**53:
+            return None
+        return ((float(self), 0.0, 0.0),)
+
 
 class Scalar(FitnessABC, float):
     """A single, floating-point value with approximate equality -- Larger is better."""
 
+    TOTAL_ORDER = True
+
     def __new__(cls, *args, **kw):
         return float.__new__(cls, *args, **kw)
 
@@ -75,6 +96,12 @@ class Scalar(FitnessABC, float):
     def _decorate(self) -> str:
         return format(self, "g")
 
+    def sort_key(self) -> float:
+        return float(self)
+
+    def objectives(self) -> tuple[tuple[float, float, float]]:
+        return ((float(self), self._rel_tol, self._abs_tol),)
+
     def is_distinguishable(self, other: FitnessABC) -> bool:
         assert self.check_comparable(other)
         return not isclose(float(self), float(other), rel_tol=self._rel_tol, abs_tol=self._abs_tol)
@@ -98,7 +125,11 @@ class Scalar(FitnessABC, float):
 
 
 class Vector(FitnessABC):
-    """A vector of fitness values"""
+    """A vector of fitness values (compared lexicographically, thus totally ordered if its elements are)"""
+
+    # NOTE: no sort_key, as the tolerance of the elements would make the lexicographic order of keys inconsistent
+    # NOTE: vectors *may* be totally ordered, whether they are depends on the elements (see `in_total_order`)
+    TOTAL_ORDER = True
 
     def __init__(self, values: Sequence[FitnessABC]) -> None:
         self._values = tuple(values)
@@ -118,6 +149,17 @@ class Vector(FitnessABC):
         self.check_comparable(other)
         return list(self) > list(other)
 
+    def in_total_order(self) -> bool:
+        return self.is_totally_ordered() and all(v.in_total_order() for v in self)
+
+    def objectives(self) -> tuple[tuple[float, float, float], ...] | None:
+        objectives = list()
+        for v in self:
+            if not v.has_objectives() or (o := v.objectives()) is None:
+                return None
+            objectives.extend(o)
+        return tuple(objectives)
+
     # def is_dominant(self, other: 'Vector') -> bool:
     #    self.check_comparable(other)
     #    return all(v1 >> v2 for v1, v2 in zip(self, other))
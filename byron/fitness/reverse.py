@@ -40,6 +40,21 @@ def reverse_fitness(fitness_class: type[FitnessABC]) -> type[FitnessABC]:
     assert check_valid_type(fitness_class, FitnessABC, subclass=True)
 
     class T(fitness_class):
+        TOTAL_ORDER = fitness_class.is_totally_ordered()
+
+        if fitness_class.has_sort_key():
+
+            def sort_key(self):
+                return -super().sort_key()
+
+        if fitness_class.has_objectives():
+
+            def objectives(self):
+                objectives = super().objectives()
+                if objectives is None:
+                    return None
+                return tuple((-v, r, a) for v, r, a in objectives)
+
         def is_fitter(self, other: FitnessABC) -> bool:
             assert (
                 self.__class__ == other.__class__
@@ -50,6 +65,9 @@ def reverse_fitness(fitness_class: type[FitnessABC]) -> type[FitnessABC]:
             assert (
                 self.__class__ == other.__class__
             ), f"TypeError: different types of fitness: '{self.__class__}' and '{other.__class__}'"
+            if fitness_class.is_dominant is FitnessABC.is_dominant:
+                # NOTE: the default `is_dominant` calls `is_fitter`, which is already reversed
+                return self.is_fitter(other)
             return super(T, other).is_dominant(self)
 
         def _decorate(self) -> str:
@@ -226,7 +226,7 @@ def bunch(
         @property
         def successors(self):
             n_macros = rrandom.random_int(T.SIZE[0], T.SIZE[1])
-            return [rrandom.choice(T.POOL) for _ in range(n_macros)]
+            return rrandom.choices(T.POOL, n_macros)
 
     T.add_node_check(partial(_check_out_degree, min_=size[0], max_=size[1]))
     if max_instances:
@@ -35,6 +35,7 @@ from byron.user_messages import *
 from byron.classes.macro import Macro
 from byron.classes.parameter import ParameterABC
 from byron.classes.node_reference import NodeReference
+from byron.tools.template import compile_template
 
 
 @cache
@@ -55,6 +56,12 @@ def _macro(
 
     M.add_node_check(_check_parameters)
 
+    # parse format strings once and for all
+    compile_template(text)
+    for _, p in extra_parameters:
+        if isinstance(p, str):
+            compile_template(p)
+
     return M
 
 
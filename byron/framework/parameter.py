@@ -32,6 +32,8 @@ from functools import cache
 from numbers import Number
 from typing import Any, Hashable, SupportsInt
 
+import numpy as np
+
 from byron.user_messages import *
 from byron.classes.parameter import *
 from byron.randy import rrandom
@@ -204,9 +206,12 @@ def _array_parameter(symbols: tuple[str], length: int) -> type[ParameterABC]:
 
         def mutate(self, strength: float = 1.0) -> None:
             if strength == 1:
-                new_value = [rrandom.choice(symbols) for _ in range(length)]
+                new_value = rrandom.choices(symbols, length)
             else:
-                new_value = [rrandom.choice(symbols) if rrandom.boolean(strength) else old for old in self._value]
+                new_value = list(self._value)
+                mutated = np.flatnonzero(rrandom.random_floats(length) < strength).tolist()
+                for i, symbol in zip(mutated, rrandom.choices(symbols, len(mutated))):
+                    new_value[i] = symbol
             self.value = "".join(new_value)
 
     T._patch_info(name="Array[" + "".join(str(a) for a in symbols) + f"ｘ{length}]")
@@ -63,24 +63,16 @@ def _global_reference(
             self._target_frame = target_frame
 
         def get_potential_targets(self, add_none=True):
-            tree = make_digraph(
-                tuple(self._node_reference.graph.nodes),
-                tuple((u, v) for u, v, k in self._node_reference.graph.edges(data="_type") if k == FRAMEWORK),
-            )
-            for node, path in nx.single_source_dijkstra_path(tree, NODE_ZERO).items():
-                tree.nodes[node]['_path'] = tuple(
-                    self._node_reference.graph.nodes[n]['_selement'].__class__ for n in path
-                )
+            tree = get_framework_tree(self._node_reference.graph)
+            paths = get_parent_frame_dictionary(self._node_reference.graph)
 
             if first_macro:
-                valid_frames = tuple(n for n in tree.nodes if tree.nodes[n]['_path'][-1] == target_frame)
+                valid_frames = tuple(n for n in tree.nodes if paths[n][-1] == target_frame)
                 targets = [
                     next(n for n in nx.dfs_preorder_nodes(tree, p) if tree.out_degree(n) == 0) for p in valid_frames
                 ]
             else:
-                targets = list(
-                    n for n in tree.nodes if target_frame in tree.nodes[n]['_path'] and tree.out_degree(n) == 0
-                )
+                targets = list(n for n in tree.nodes if target_frame in paths[n] and tree.out_degree(n) == 0)
 
             if not add_none:
                 pass
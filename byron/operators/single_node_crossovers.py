@@ -73,6 +73,11 @@ def _generic_node_crossover(parent1: Individual, parent2: Individual, *, choosy:
     node2 = rrandom.choice(common_selements[target][parent2])
     P1 = deepcopy(parent1.genome)
     P2 = deepcopy(parent2.genome)
+    if any(n in P1 for n in P2 if n != NODE_ZERO):
+        # NOTE: clones share node labels, but the two genomes must not overlap in the composition
+        translation = {n: Node() for n in P2 if n != NODE_ZERO}
+        P2 = nx.relabel_nodes(P2, translation)
+        node2 = translation[node2]
     # P2.remove_node(NODE_ZERO)
     new_genome = nx.compose(P1, P2)
     node1_fanin = new_genome.in_edges(node1, data=True, keys=True)
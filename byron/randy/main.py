@@ -23,7 +23,32 @@ from byron.user_messages import *
 from byron.global_symbols import *
 from byron.classes.node import NODE_ZERO
 
-__all__ = ["Randy"]
+__all__ = ["Randy", "WeightedSampler"]
+
+
+class WeightedSampler:
+    """Elements with their probabilities, prepared for repeated draws (see `Randy.weighted_choice`)."""
+
+    __slots__ = ['_values', '_cumulative']
+
+    def __init__(self, seq: Sequence[Any], p: Sequence[float]) -> None:
+        assert len(seq) == len(p), "ValueError: different number of elements in seq and weight"
+        assert len(seq) > 0, "ValueError: no elements"
+        self._values = tuple(seq)
+        self._cumulative = np.cumsum(p, dtype=np.float64)
+        assert math.isclose(self._cumulative[-1], 1), "ValueError: weights sum not 1"
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def values(self) -> tuple:
+        return self._values
+
+    def index(self, r: float | np.ndarray) -> int | np.ndarray:
+        """The index of the first element whose cumulative probability is not smaller than `r`, in O(log n)."""
+        # NOTE: rounding errors may leave the last cumulative probability just below 1
+        return np.minimum(np.searchsorted(self._cumulative, r), len(self._values) - 1)
 
 
 class Randy:
@@ -157,11 +182,43 @@ class Randy:
         val = self.random_float(a - 0.5, b - 0.5, **kwargs)
         return round(val)
 
+    def random_floats(
+        self,
+        n: int,
+        a: float | None = 0,
+        b: float | None = 1,
+        *,
+        loc: float | None = None,
+        scale: float | None = None,
+        sigma: float | None = None,
+    ) -> np.ndarray:
+        """`n` values as `random_float`, drawn with a single call to the generator (same as `n` calls)."""
+        self._calls += 1
+        assert self._check_saved_state()
+        assert Randy._check_parameters(a, b, loc=loc, scale=scale, sigma=sigma)
+        if loc is None:
+            val = self._generator.random(n) * (b - a) + a
+        else:
+            val = truncnorm.ppf(
+                self._generator.random(n), **Randy.get_truncnorm_parameters(a, b, loc=loc, scale=scale, sigma=sigma)
+            )
+        assert self._save_state()
+        return val
+
+    def random_ints(self, n: int, a, b, **kwargs) -> np.ndarray:
+        """`n` values as `random_int`, drawn with a single call to the generator (same as `n` calls)."""
+        val = self.random_floats(n, a - 0.5, b - 0.5, **kwargs)
+        return np.round(val).astype(np.int64)
+
     def choice(self, seq: Sequence[Any], loc: int | None = None, sigma: float | None = None) -> Any:
         """Returns a random element from seq by perturbing index loc with a given strength."""
         index = self.random_int(0, len(seq), loc=loc, sigma=sigma)
         return seq[index]
 
+    def choices(self, seq: Sequence[Any], n: int, loc: int | None = None, sigma: float | None = None) -> list[Any]:
+        """Returns `n` random elements from seq as `choice`, drawn with a single call to the generator."""
+        return [seq[i] for i in self.random_ints(n, 0, len(seq), loc=loc, sigma=sigma).tolist()]
+
     def boolean(self, p_true: float | None = None, p_false: float | None = None) -> bool:
         """Returns a boolean value with the given probability."""
         assert (
@@ -182,9 +239,15 @@ class Randy:
         self._generator.shuffle(seq)
         assert self._save_state()
 
-    def weighted_choice(self, seq: Sequence[Any], p: Sequence[float]) -> Any:
-        """Returns a random element from seq using the probabilities in p."""
-        assert len(seq) == len(p), "ValueError: different number of elements in seq and weight"
-        assert math.isclose(sum(p), 1), "ValueError: weights sum not 1"
+    def weighted_choice(self, seq: Sequence[Any] | WeightedSampler, p: Sequence[float] | None = None) -> Any:
+        """Returns a random element from seq using the probabilities in p, or from a prepared `WeightedSampler`."""
+        sampler = seq if isinstance(seq, WeightedSampler) else WeightedSampler(seq, p)
         r = self.random_float()
-        return next(val for val, cp in ((v, sum(p[0 : i + 1])) for i, v in enumerate(seq)) if cp >= r)
+        return sampler.values[int(sampler.index(r))]
+
+    def weighted_choices(
+        self, seq: Sequence[Any] | WeightedSampler, n: int, p: Sequence[float] | None = None
+    ) -> list[Any]:
+        """Returns `n` random elements from seq using the probabilities in p, or from a prepared `WeightedSampler`."""
+        sampler = seq if isinstance(seq, WeightedSampler) else WeightedSampler(seq, p)
+        return [sampler.values[i] for i in sampler.index(self.random_floats(n)).tolist()]
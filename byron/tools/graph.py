@@ -27,12 +27,14 @@
 
 __all__ = [
     '_get_first_macro',
+    'clone_genome',
     'discard_useless_components',
     'fasten_subtree_parameters',
     'get_all_frames',
     'get_all_macros',
     'get_all_parameters',
     'get_dfs_subtree',
+    'get_framework_tree',
     'get_node_color_dict',
     'get_parent_frame_dictionary',
     'get_predecessor',
@@ -46,6 +48,7 @@ __all__ = [
 from collections.abc import Sequence
 from functools import lru_cache
 from collections import deque
+from copy import copy
 
 import networkx as nx
 
@@ -53,6 +56,7 @@ from byron.global_symbols import *
 from byron.classes.node import *
 from byron.user_messages import *
 from byron.classes.node_reference import NodeReference
+from byron.classes.genome import Genome
 from byron.classes.parameter import ParameterABC, ParameterStructuralABC
 
 # =[PUBLIC FUNCTIONS]===================================================================================================
@@ -64,6 +68,8 @@ def get_successors(ref: NodeReference) -> tuple[int]:
 
 
 def get_predecessor(ref: NodeReference) -> int:
+    if isinstance(ref.graph, Genome):
+        return ref.graph.parents.get(ref.node, 0)
     return next((u for u, v, k in ref.graph.in_edges(ref.node, data="_type") if k == FRAMEWORK), 0)
 
 
@@ -192,7 +198,7 @@ def _get_node_list(G: nx.classes.MultiDiGraph, *, root: int, type_: str | None)
     if root is None:
         return tuple(n for n in G.nodes if type_ is None or G.nodes[n]["_type"] == type_)
     else:
-        tree = make_digraph(tuple(G.nodes), tuple((u, v) for u, v, k in G.edges(data="_type") if k == FRAMEWORK))
+        tree = get_framework_tree(G)
         return tuple(n for n in nx.dfs_preorder_nodes(tree, root) if type_ is None or G.nodes[n]["_type"] == type_)
 
 
@@ -205,6 +211,26 @@ def fasten_subtree_parameters(node_reference: NodeReference):
         p.fasten(NodeReference(node_reference.graph, n))
 
 
+def clone_genome(G: nx.MultiDiGraph) -> nx.MultiDiGraph:
+    r"""A structurally shared copy of a genome
+
+    Node labels, edge keys, and SElement instances (macros and frames, which are never modified) are shared with `G`,
+    while node and edge attribute dictionaries are new. Parameters are copied shallowly (their values are immutable),
+    and structural parameters are fastened to the new graph, keeping their (already unique) link keys.
+    """
+    H = G.__class__()
+    H.graph.update(G.graph)
+    H.add_nodes_from(
+        (n, {k: copy(v) if isinstance(v, ParameterABC) else v for k, v in d.items()}) for n, d in G.nodes(data=True)
+    )
+    H.add_edges_from((u, v, k, dict(d)) for u, v, k, d in G.edges(keys=True, data=True))
+    for n, d in H.nodes(data=True):
+        for p in d.values():
+            if isinstance(p, ParameterStructuralABC):
+                p.fasten(NodeReference(H, n), rekey=False)
+    return H
+
+
 def discard_useless_components(G: nx.MultiDiGraph) -> None:
     """Removes unconnected and unreached components"""
     H = nx.Graph()
@@ -218,23 +244,34 @@ def discard_useless_components(G: nx.MultiDiGraph) -> None:
 
 
 def get_structure_tree(G: nx.MultiDiGraph) -> nx.DiGraph | None:
-    tree = make_digraph(tuple(G.nodes), tuple((u, v) for u, v, k in G.edges(data="_type") if k == FRAMEWORK))
+    if isinstance(G, Genome):
+        return G.structure_tree if G.valid_structure else None
+    tree = get_framework_tree(G)
     if not nx.is_branching(tree) or not nx.is_weakly_connected(tree):
         return None
     return tree
 
 
+def get_framework_tree(G: nx.MultiDiGraph) -> nx.DiGraph:
+    r"""The DiGraph with all nodes of `G` and only the edges of `kind=FRAMEWORK`
+
+    The result is cached (in the `Genome` itself, if possible), thus it must be treated as read-only.
+    """
+    if isinstance(G, Genome):
+        return G.structure_tree
+    return make_digraph(tuple(G.nodes), tuple((u, v) for u, v, k in G.edges(data="_type") if k == FRAMEWORK))
+
+
 def get_parent_frame_dictionary(genome: nx.MultiDiGraph) -> dict:
-    @lru_cache(1024)
-    def get_parent_frame_dictionary_cached(G, nodes_list) -> dict:
-        tree = make_digraph(tuple(G.nodes), tuple((u, v) for u, v, k in G.edges(data="_type") if k == FRAMEWORK))
-        assert nx.is_branching(tree) and nx.is_weakly_connected(tree), f"{PARANOIA_SYSTEM_ERROR}: Not a valid genome"
-        parent_frames = dict()
-        for node, path in nx.single_source_dijkstra_path(tree, NODE_ZERO).items():
-            parent_frames[node] = tuple(G.nodes[n]['_selement'].__class__ for n in path)
-        return parent_frames
-
-    return get_parent_frame_dictionary_cached(genome, tuple(genome.nodes))
+    if isinstance(genome, Genome):
+        assert genome.valid_structure, f"{PARANOIA_SYSTEM_ERROR}: Not a valid genome"
+        return genome.frame_paths
+    tree = get_framework_tree(genome)
+    assert nx.is_branching(tree) and nx.is_weakly_connected(tree), f"{PARANOIA_SYSTEM_ERROR}: Not a valid genome"
+    parent_frames = dict()
+    for node, path in nx.single_source_dijkstra_path(tree, NODE_ZERO).items():
+        parent_frames[node] = tuple(genome.nodes[n]['_selement'].__class__ for n in path)
+    return parent_frames
 
 
 @lru_cache(1024)
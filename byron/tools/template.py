@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# =[ HISTORY ]===============================================================
+# v1 / October 2026
+
+__all__ = ["Template", "compile_template"]
+
+import re
+from functools import cache
+from string import Formatter
+from collections.abc import Mapping
+
+_SAFE_NAME = re.compile(r"[a-z_][a-z_0-9]*", re.IGNORECASE)
+_ACCESSOR = re.compile(r"\.([^.\[]+)|\[([^\]]+)\]")
+_CONVERSIONS = {'r': repr, 's': str, 'a': ascii}
+
+
+class Template:
+    r"""A format string parsed once and rendered many times.
+
+    A `Template` renders exactly as ``text.format(**mapping)``, but the text is parsed only when the template is
+    created, and only the needed fields are fetched from the mapping at rendering time. Format strings that cannot be
+    handled (eg. with positional fields, or malformed) are simply passed to `str.format`.
+    """
+
+    __slots__ = ['text', '_chunks', '_references']
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        try:
+            self._chunks = tuple(Template._compile(text))
+        except ValueError:
+            self._chunks = None
+        if self._chunks is None:
+            self._references = None
+        else:
+            references = set()
+            for _, field in self._chunks:
+                if field is not None:
+                    name, accessors, _, spec = field
+                    references.add((name, accessors))
+                    if isinstance(spec, Template):
+                        references |= spec.references
+            self._references = frozenset(references)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.text!r}>"
+
+    @property
+    def fields(self) -> frozenset[str] | None:
+        r"""The names fetched from the mapping (``None`` if the template is passed to `str.format`)"""
+        if self._references is None:
+            return None
+        return frozenset(n for n, _ in self._references)
+
+    @property
+    def references(self) -> frozenset[tuple[str, tuple]] | None:
+        r"""Pairs `(name, accessors)`, where accessors are `(is_attribute, key)` (``None`` if not known)"""
+        return self._references
+
+    def render(self, mapping: Mapping) -> str:
+        r"""Same as ``text.format(**mapping)``"""
+        if self._chunks is None:
+            return self.text.format(**mapping)
+        output = list()
+        for literal, field in self._chunks:
+            output.append(literal)
+            if field is None:
+                continue
+            name, accessors, conversion, spec = field
+            if name not in mapping:
+                raise KeyError(name)
+            value = mapping[name]
+            for is_attribute, key in accessors:
+                value = getattr(value, key) if is_attribute else value[key]
+            if conversion is not None:
+                value = conversion(value)
+            if isinstance(spec, Template):
+                spec = spec.render(mapping)
+            output.append(format(value, spec))
+        return ''.join(output)
+
+    @staticmethod
+    def _compile(text: str):
+        for literal, field_name, format_spec, conversion in Formatter().parse(text):
+            if field_name is None:
+                yield literal, None
+                continue
+            name = re.match(r"[^.\[]*", field_name).group()
+            if not _SAFE_NAME.fullmatch(name):
+                # positional fields and weird names: let str.format handle (or complain)
+                raise ValueError(field_name)
+            accessors = list()
+            position = len(name)
+            while position < len(field_name):
+                if not (match := _ACCESSOR.match(field_name, position)):
+                    raise ValueError(field_name)
+                if match.group(1) is not None:
+                    accessors.append((True, match.group(1)))
+                else:
+                    key = match.group(2)
+                    accessors.append((False, int(key) if key.isdigit() else key))
+                position = match.end()
+            if conversion is not None and conversion not in _CONVERSIONS:
+                raise ValueError(conversion)
+            if '{' in format_spec:
+                format_spec = compile_template(format_spec)
+                if format_spec.references is None:
+                    raise ValueError(format_spec.text)
+            yield literal, (name, tuple(accessors), _CONVERSIONS.get(conversion), format_spec)
+
+
+@cache
+def compile_template(text: str) -> Template:
+    r"""The (cached) `Template` for a format string"""
+    return Template(text)
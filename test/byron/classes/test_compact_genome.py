@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+# SPDX-License-Identifier: Apache-2.0
+
+
+import byron
+from byron.classes.compact_genome import CompactGenome
+
+
+def _individual():
+    macros = [
+        byron.f.macro('int {v}', v=byron.f.integer_parameter(0, 2**40)),
+        byron.f.macro('float {v}', v=byron.f.float_parameter(-1, 1)),
+        byron.f.macro('array {v}', v=byron.f.array_parameter('01-', 8)),
+        byron.f.macro('choice {v}', v=byron.f.choice_parameter('ABCDEFG')),
+        byron.f.macro('jmp {ref}', ref=byron.f.local_reference(backward=True, loop=False, forward=True)),
+    ]
+    bar = byron.f.macro('bar {ref}', ref=byron.f.global_reference('bunch2', first_macro=True))
+    bunch1 = byron.f.bunch(macros + [bar], size=20, name='bunch1')
+    bunch2 = byron.f.bunch(macros, size=20, name='bunch2')
+    byron.rrandom.seed(42)
+    generator = next(op for op in byron.sys.get_operators() if op.num_parents is None)
+    return generator(byron.f.sequence([bunch1, bunch2]))[0]
+
+
+def test_round_trip():
+    individual = _individual()
+    G = individual.genome
+    compact = CompactGenome(G)
+    assert len(compact) == len(G)
+    assert compact.nodes == tuple(G.nodes)
+    H = compact.to_graph()
+    assert list(H.nodes) == list(G.nodes)
+    assert list(H.edges(keys=True, data=True)) == list(G.edges(keys=True, data=True))
+    for n in G:
+        assert list(H.nodes[n]) == list(G.nodes[n])
+        assert H.nodes[n]['_selement'] is G.nodes[n]['_selement']
+        for k, p in G.nodes[n].items():
+            if isinstance(p, byron.classes.ParameterABC):
+                assert H.nodes[n][k] is not p and H.nodes[n][k] == p
+    assert list(compact.structure_tree.edges) == list(byron.tools.graph.get_structure_tree(G).edges)
+
+
+def test_compact_individual():
+    individual = _individual()
+    reference = individual.dump().split('\n', 1)[1]
+    nodes = individual.nodes
+    individual.compact()
+    assert individual.compacted
+    assert individual.nodes == nodes
+    clone = individual.clone
+    assert individual.compacted
+    assert clone.dump().split('\n', 1)[1] == reference
+    assert clone.run_paranoia_checks()
+    # read-only accesses do not rebuild the genome
+    assert individual.dump().split('\n', 1)[1] == reference
+    assert individual.compacted
+    # the genome is rebuilt as soon as it may be modified
+    assert individual.genome is not None
+    assert not individual.compacted
+    assert individual.run_paranoia_checks()
+
+
+def test_compact_message():
+    individual = _individual()
+    message = individual.as_message
+    individual.compact()
+    assert individual.as_message == message
+    assert individual.compacted
+
+
+def test_compact_population():
+    from byron.classes.population import Population
+
+    individual = _individual()
+    population = Population(individual.top_frame)
+    population += [individual, individual.clone]
+    individual._fitness = byron.fitness.Scalar(1)
+    population.compact()
+    assert population[0].compacted and not population[1].compacted
+    population.entropy
+    assert population[0].compacted
+
+
+def test_global_reference():
+    subroutine = byron.f.sequence([byron.f.macro('sub'), byron.f.macro('ret')], name='subroutine')
+    call = byron.f.macro('call {ref}', ref=byron.f.global_reference(subroutine, creative_zeal=1))
+    byron.rrandom.seed(42)
+    generator = next(op for op in byron.sys.get_operators() if op.num_parents is None)
+    individual = generator(byron.f.sequence([byron.f.bunch([call], size=3)]))[0]
+    reference = individual.dump()
+
+    compact = CompactGenome(individual.genome)
+    individual.compact()
+    assert individual.dump() == reference
+    H = compact.to_graph()
+    references = [p for n in H for p in H.nodes[n].values() if isinstance(p, byron.classes.ParameterStructuralABC)]
+    assert references
+    for p in references:
+        assert p._target_frame == subroutine
+        p.mutate(1)
@@ -9,7 +9,14 @@
 # Copyright 2023-24 Giovanni Squillero and Alberto Tonda
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+import subprocess
+import sys
+import time
+
 import pytest
+
+import byron
 from byron.classes.evaluator import EvaluatorABC, PythonEvaluator
 from byron.classes.fitness import FitnessABC
 from byron.fitness import Scalar
@@ -98,6 +105,361 @@ def test_fitness_calls_increment_with_fixture(mock_population):
     assert evaluator.fitness_calls == initial_calls + len(mock_population.individuals)
 
 
+@byron.fitness_function
+def length_fitness(phenotype: str) -> FitnessABC:
+    return len(phenotype)
+
+
+@pytest.mark.filterwarnings("ignore:::byron")
+@pytest.mark.parametrize("backend", ['thread_pool', 'joblib'])
+def test_persistent_pool(backend):
+    macro = byron.f.macro('{v}', v=byron.f.integer_parameter(0, 1000))
+    frame = byron.f.sequence([macro])
+    byron.rrandom.seed(42)
+    reference = byron.ea.vanilla_ea(frame, PythonEvaluator(length_fitness), mu=5, max_generation=3)
+    byron.rrandom.seed(42)
+    with PythonEvaluator(length_fitness, backend=backend, max_workers=2) as evaluator:
+        pool = evaluator.pool
+        population = byron.ea.vanilla_ea(frame, evaluator, mu=5, max_generation=3)
+        assert evaluator.pool is pool
+    assert evaluator._pool is None
+    assert all(r[1].fitness == i[1].fitness for r, i in zip(reference, population))
+
+
+class PhenotypeIndividual:
+    _counter = 0
+
+    def __init__(self, phenotype):
+        PhenotypeIndividual._counter += 1
+        self.id = PhenotypeIndividual._counter
+        self.phenotype = phenotype
+        self.fitness = None
+
+    @property
+    def finalized(self):
+        return self.fitness is not None
+
+
+class PhenotypePopulation:
+    def __init__(self, phenotypes):
+        self.individuals = [PhenotypeIndividual(p) for p in phenotypes]
+
+    @property
+    def not_finalized_individuals(self):
+        return tuple((i, I) for i, I in enumerate(self.individuals) if not I.finalized)
+
+    def dump_individual(self, i):
+        return self.individuals[i].phenotype
+
+
+@byron.fitness_function
+def sleepy_fitness(phenotype: str):
+    time.sleep(float(phenotype))
+    return float(phenotype)
+
+
+def test_python_evaluate_as_completed():
+    population = PhenotypePopulation(['0.6', '0', '0.3'])
+    evaluator = PythonEvaluator(sleepy_fitness, backend='thread_pool', max_workers=3)
+    assert [I.phenotype for I in evaluator.evaluate_as_completed(population)] == ['0', '0.3', '0.6']
+    assert all(I.fitness == byron.fitness.Scalar(float(I.phenotype)) for I in population.individuals)
+    assert evaluator.fitness_calls == 3
+    evaluator.close()
+
+
+class SlowDumpPopulation(PhenotypePopulation):
+    def __init__(self, phenotypes):
+        super().__init__(phenotypes)
+        self.dumped = list()
+
+    def dump_individual(self, i):
+        time.sleep(0.1)
+        if self.individuals[i].phenotype == 'error':
+            raise RuntimeError("dump failed")
+        self.dumped.append(time.monotonic())
+        return super().dump_individual(i)
+
+
+evaluation_times = list()
+
+
+@byron.fitness_function
+def logged_fitness(phenotype: str):
+    evaluation_times.append(time.monotonic())
+    return float(len(phenotype))
+
+
+def test_dump_overlaps_evaluation():
+    evaluation_times.clear()
+    population = SlowDumpPopulation(['a', 'bb', 'a', 'ccc', 'bb', 'a'])
+    evaluator = PythonEvaluator(logged_fitness, backend='thread_pool', max_workers=2, cache_size=10)
+    evaluator(population)
+    assert [I.fitness for I in population.individuals] == [Scalar(len(I.phenotype)) for I in population.individuals]
+    assert evaluator.fitness_calls == 3
+    assert min(evaluation_times) < max(population.dumped)
+    evaluator.close()
+
+    population = SlowDumpPopulation(['a', 'error', 'bb'])
+    evaluator = PythonEvaluator(logged_fitness, backend='thread_pool', max_workers=2)
+    with pytest.raises(RuntimeError):
+        evaluator(population)
+    evaluator.close()
+
+
+in_flight = list()
+
+
+class CountingPopulation(PhenotypePopulation):
+    def dump_individual(self, i):
+        in_flight.append(i)
+        return super().dump_individual(i)
+
+
+@byron.fitness_function
+def counting_fitness(phenotype: str):
+    time.sleep(0.01)
+    in_flight.pop()
+    return float(phenotype)
+
+
+def test_bounded_in_flight():
+    in_flight.clear()
+    population = CountingPopulation([str(n) for n in range(40)])
+    evaluator = PythonEvaluator(counting_fitness, backend='thread_pool', max_workers=2)
+    peak = 0
+    for _ in evaluator.evaluate_as_completed(population):
+        peak = max(peak, len(in_flight))
+    assert all(I.finalized for I in population.individuals)
+    # dumped but not yet evaluated
+    assert peak <= 2 * 2
+    evaluator.close()
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="requires a POSIX shell")
+def test_script_evaluate_as_completed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open('sleepy.sh', 'w') as script:
+        script.write('#!/bin/sh\nsleep $(cat "$1")\ncat "$1"\n')
+    os.chmod('sleepy.sh', 0o755)
+    population = PhenotypePopulation(['0.6', '0', '0.3'])
+    evaluator = byron.evaluator.ParallelScriptEvaluator(str(tmp_path / 'sleepy.sh'), 'phenotype.txt', max_workers=3)
+    assert [I.phenotype for I in evaluator.evaluate_as_completed(population)] == ['0', '0.3', '0.6']
+    assert all(I.fitness == byron.fitness.make_fitness(float(I.phenotype)) for I in population.individuals)
+
+
+WORKER = r"""
+import os, sys, time
+while header := sys.stdin.buffer.readline():
+    phenotype = sys.stdin.buffer.read(int(header)).decode('utf-8')
+    if phenotype == 'crash':
+        sys.exit(1)
+    elif phenotype == 'sleep':
+        time.sleep(10)
+    reply = f"{len(phenotype)} {os.getpid()}".encode('utf-8')
+    sys.stdout.buffer.write(f"{len(reply)}\n".encode('ascii') + reply)
+    sys.stdout.buffer.flush()
+"""
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="requires POSIX pipes")
+def test_persistent_worker_evaluator(tmp_path):
+    with open(tmp_path / 'worker.py', 'w') as script:
+        script.write(WORKER)
+    evaluator = byron.evaluator.PersistentWorkerEvaluator(
+        sys.executable, [str(tmp_path / 'worker.py')], max_workers=2, timeout=1, default_result='-1 -1'
+    )
+
+    population = PhenotypePopulation(['a', 'bb', 'ccc', 'dddd', 'é'])
+    evaluator(population)
+    assert [float(list(I.fitness)[0]) for I in population.individuals] == [1, 2, 3, 4, 1]
+    pids = {float(list(I.fitness)[1]) for I in population.individuals}
+    assert len(pids) <= 2
+
+    population = PhenotypePopulation(['crash', 'sleep', 'ee'])
+    evaluator(population)
+    assert [float(list(I.fitness)[0]) for I in population.individuals] == [-1, -1, 2]
+
+    population = PhenotypePopulation(['a', 'bb', 'ccc'])
+    evaluator(population)
+    assert [float(list(I.fitness)[0]) for I in population.individuals] == [1, 2, 3]
+    assert all(w.alive for w in evaluator.workers)
+    evaluator.close()
+    assert evaluator._workers is None
+
+
+MAKEFILE = """\
+run: length.txt
+\tcat length.txt
+
+length.txt: phenotype.txt
+\twc -c < phenotype.txt > length.txt
+"""
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="requires make and symlinks")
+def test_makefile_sandboxes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open('Makefile', 'w') as makefile:
+        makefile.write(MAKEFILE)
+    os.mkdir('shm')
+    evaluator = byron.evaluator.MakefileEvaluator('phenotype.txt', sandbox_root=str(tmp_path / 'shm'), max_workers=2)
+
+    for phenotypes in (['a', 'bb', 'ccc', 'dddd'], ['eeeee', 'f']):
+        population = PhenotypePopulation(phenotypes)
+        evaluator(population)
+        assert all(I.fitness == byron.fitness.make_fitness(float(len(I.phenotype))) for I in population.individuals)
+    assert 1 <= len(evaluator._sandboxes) <= 2
+    for sandbox in os.listdir('shm'):
+        assert os.listdir(tmp_path / 'shm' / sandbox) == ['Makefile']
+    evaluator.close()
+    assert not os.listdir('shm')
+
+
+BUILD_MAKEFILE = """\
+run: length.txt
+\tcat length.txt
+
+length.txt: phenotype.txt
+\twc -c < phenotype.txt > length.txt
+\techo built >> {log}
+"""
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="requires make and symlinks")
+def test_makefile_build_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open('Makefile', 'w') as makefile:
+        makefile.write(BUILD_MAKEFILE.format(log=tmp_path / 'builds.log'))
+    evaluator = byron.evaluator.MakefileEvaluator(
+        'phenotype.txt', build_target='length.txt', build_products=['length.txt'], max_workers=1
+    )
+
+    for phenotypes, builds in ((['a', 'bb', 'a'], 2), (['bb', 'ccc'], 3)):
+        population = PhenotypePopulation(phenotypes)
+        evaluator(population)
+        assert all(I.fitness == byron.fitness.make_fitness(float(len(I.phenotype))) for I in population.individuals)
+        with open('builds.log') as log:
+            assert len(log.readlines()) == builds
+    assert len(os.listdir('byron_build_cache')) == 3
+    evaluator.close()
+
+
+EXECUTABLE_MAKEFILE = """\
+run: length
+\t./length || echo -1
+
+length: phenotype.txt
+\techo "#!/bin/sh" > length
+\techo "echo $$(wc -c < phenotype.txt)" >> length
+\tchmod +x length
+"""
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="requires make and a POSIX shell")
+def test_makefile_build_cache_executable(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open('Makefile', 'w') as makefile:
+        makefile.write(EXECUTABLE_MAKEFILE)
+    evaluator = byron.evaluator.MakefileEvaluator(
+        'phenotype.txt', build_target='length', build_products=['length'], max_workers=1
+    )
+
+    # the second and the third evaluations run the executable taken from the cache
+    population = PhenotypePopulation(['bb', 'bb', 'bb'])
+    evaluator(population)
+    assert all(I.fitness == byron.fitness.make_fitness(2.0) for I in population.individuals)
+    evaluator.close()
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="requires a POSIX shell")
+@pytest.mark.parametrize("chunk_size", [None, 1, 2])
+def test_chunked_script_evaluator(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.chdir(tmp_path)
+    with open('length.sh', 'w') as script:
+        script.write('#!/bin/sh\necho $# >> calls.log\nfor f in "$@"; do wc -c < "$f"; done\n')
+    os.chmod('length.sh', 0o755)
+    evaluator = byron.evaluator.ScriptEvaluator('./length.sh', chunk_size=chunk_size, max_workers=2)
+
+    population = PhenotypePopulation(['a', 'bb', 'ccc', 'dddd', 'eeeee'])
+    evaluator(population)
+    assert all(I.fitness == byron.fitness.make_fitness(float(len(I.phenotype))) for I in population.individuals)
+    with open('calls.log') as log:
+        calls = [int(n) for n in log.readlines()]
+    assert sorted(calls) == sorted(
+        [chunk_size or 5] * (5 // (chunk_size or 5)) + [5 % (chunk_size or 5)] * bool(5 % (chunk_size or 5))
+    )
+    assert sorted(os.listdir()) == ['calls.log', 'length.sh']
+
+
+STDIN_READER = r"""
+import sys
+data = sys.stdin.buffer.read()
+if sys.argv[1] == 'length':
+    while data:
+        header, data = data.split(b'\n', 1)
+        print(len(data[: int(header)].decode('utf-8')), flush=True)
+        data = data[int(header) :]
+else:
+    separator = b'\0' if sys.argv[1] == 'nul' else sys.argv[1].encode('utf-8')
+    for record in data.split(separator)[:-1]:
+        print(len(record.decode('utf-8')), flush=True)
+"""
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="requires POSIX pipes")
+@pytest.mark.parametrize("separator", ['\0', '\n---\n', None])
+def test_script_evaluators_stdin(tmp_path, monkeypatch, separator):
+    monkeypatch.chdir(tmp_path)
+    with open('reader.py', 'w') as script:
+        script.write(STDIN_READER)
+    args = ['reader.py', {'\0': 'nul', None: 'length'}.get(separator, separator)]
+    phenotypes = ['a', 'b\nb', 'c\0c' if separator != '\0' else 'ccc', 'dddd', 'é']
+
+    population = PhenotypePopulation(phenotypes)
+    evaluator = byron.evaluator.ScriptEvaluator(sys.executable, args, stdin=True, record_separator=separator)
+    evaluator(population)
+    assert [I.fitness for I in population.individuals] == [
+        byron.fitness.make_fitness(float(len(p))) for p in phenotypes
+    ]
+
+    population = PhenotypePopulation(phenotypes)
+    evaluator = byron.evaluator.ScriptEvaluator(
+        sys.executable, args, stdin=True, record_separator=separator, chunk_size=2
+    )
+    evaluator(population)
+    assert [I.fitness for I in population.individuals] == [
+        byron.fitness.make_fitness(float(len(p))) for p in phenotypes
+    ]
+
+    population = PhenotypePopulation(phenotypes)
+    evaluator = byron.evaluator.ParallelScriptEvaluator(
+        sys.executable, None, flags=args, stdin=True, record_separator=separator, max_workers=2
+    )
+    evaluator(population)
+    assert [I.fitness for I in population.individuals] == [
+        byron.fitness.make_fitness(float(len(p))) for p in phenotypes
+    ]
+    assert sorted(os.listdir()) == ['reader.py']
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="requires POSIX pipes")
+def test_script_evaluator_stdin_failure(tmp_path):
+    evaluator = byron.evaluator.ScriptEvaluator(sys.executable, ['-c', 'import sys; sys.exit(3)'], stdin=True)
+    with pytest.raises(subprocess.CalledProcessError):
+        evaluator(PhenotypePopulation(['a' * 2**20]))
+    evaluator = byron.evaluator.ScriptEvaluator(
+        sys.executable, ['-c', 'import time; time.sleep(10)'], stdin=True, timeout=0.5
+    )
+    with pytest.raises(subprocess.TimeoutExpired):
+        evaluator(PhenotypePopulation(['a']))
+
+
+def test_sequential_has_no_pool():
+    evaluator = PythonEvaluator(length_fitness)
+    assert evaluator.pool is None
+    evaluator.close()
+
+
 # todo ask about the fitness implementation
 # # Second part:) Mock fitness function not doing well
 # def mock_fitness_function(phenotype: str) -> FitnessABC:
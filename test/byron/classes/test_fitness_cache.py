@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import byron
+from byron.classes.fitness_cache import FitnessCache
+from byron.fitness import Scalar
+
+
+def test_lru_eviction():
+    cache = FitnessCache(2)
+    cache.put(FitnessCache.key('a'), Scalar(1))
+    cache.put(FitnessCache.key('b'), Scalar(2))
+    assert cache.get(FitnessCache.key('a')) == Scalar(1)
+    cache.put(FitnessCache.key('c'), Scalar(3))
+    assert len(cache) == 2
+    assert FitnessCache.key('a') in cache
+    assert FitnessCache.key('b') not in cache
+    assert cache.get(FitnessCache.key('b')) is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_key():
+    assert FitnessCache.key('0110') == FitnessCache.key('0110')
+    assert FitnessCache.key('0110') != FitnessCache.key('0111')
+
+
+@byron.fitness_function
+def onemax(genotype: str):
+    return sum(b == '1' for b in genotype)
+
+
+@pytest.mark.filterwarnings("ignore:::byron")
+def test_cached_evaluator():
+    macro = byron.f.macro('{v}', v=byron.f.array_parameter('01', 2))
+    frame = byron.f.sequence([macro])
+
+    byron.rrandom.seed(42)
+    reference = byron.evaluator.PythonEvaluator(onemax, strip_phenotypes=True)
+    reference_population = byron.ea.vanilla_ea(frame, reference, mu=10, max_generation=5)
+
+    byron.rrandom.seed(42)
+    cached = byron.evaluator.PythonEvaluator(onemax, strip_phenotypes=True, cache_size=100)
+    cached_population = byron.ea.vanilla_ea(frame, cached, mu=10, max_generation=5)
+
+    assert all(r[1].fitness == c[1].fitness for r, c in zip(reference_population, cached_population))
+    assert cached.fitness_calls <= 4
+    assert cached.fitness_calls == cached.cache.misses
+    assert cached.cache.hits > 0
+    assert cached.fitness_calls < reference.fitness_calls
+
+
+def test_header_is_ignored():
+    from byron.classes.readymade_macros import MacroZero
+
+    header = MacroZero.TEXT.format(_comment=';')
+    assert FitnessCache.key(header + '\n0110') == FitnessCache.key('0110')
+
+
+@byron.fitness_function
+def zeromax(genotype: str):
+    return sum(b == '0' for b in genotype)
+
+
+@pytest.mark.filterwarnings("ignore:::byron")
+def test_persistent_cache(tmp_path):
+    macro = byron.f.macro('{v}', v=byron.f.array_parameter('01', 2))
+    frame = byron.f.sequence([macro])
+    filename = str(tmp_path / 'fitness.db')
+
+    byron.rrandom.seed(42)
+    first = byron.evaluator.PythonEvaluator(onemax, strip_phenotypes=True, persistent_cache=filename)
+    first_population = byron.ea.vanilla_ea(frame, first, mu=10, max_generation=5)
+    first.database.close()
+    assert first.fitness_calls > 0
+
+    byron.rrandom.seed(42)
+    second = byron.evaluator.PythonEvaluator(onemax, strip_phenotypes=True, persistent_cache=filename)
+    second_population = byron.ea.vanilla_ea(frame, second, mu=10, max_generation=5)
+    second.database.close()
+    assert second.fitness_calls == 0
+    assert all(f[1].fitness == s[1].fitness for f, s in zip(first_population, second_population))
+
+    # different evaluator, different identity
+    byron.rrandom.seed(42)
+    other = byron.evaluator.PythonEvaluator(zeromax, strip_phenotypes=True, persistent_cache=filename)
+    assert other.identity != first.identity
+    byron.ea.vanilla_ea(frame, other, mu=10, max_generation=5)
+    other.database.close()
+    assert other.fitness_calls > 0
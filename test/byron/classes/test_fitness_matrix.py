@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+import byron
+from byron.classes.fitness_matrix import FitnessMatrix
+from byron.classes.population import Population
+from byron.fitness import Scalar, Integer, Float, Lexicographic, Vector, reverse_fitness
+
+
+def _random_values(r):
+    return [r.choice([0.0, 0.1, 0.2, 0.3, 1.0, -1.0, math.inf, -math.inf, math.nan]) for _ in range(40)]
+
+
+@pytest.mark.filterwarnings("ignore:::byron")
+@pytest.mark.parametrize(
+    'make_fitness',
+    [
+        lambda v: Scalar(v[0], abs_tol=0.15),
+        lambda v: Scalar(v[0], rel_tol=0.5),
+        lambda v: Float(v[0]),
+        lambda v: Integer(int(v[0] * 10) if math.isfinite(v[0]) else 7),
+        lambda v: reverse_fitness(Scalar)(v[0], abs_tol=0.15),
+        lambda v: Lexicographic([v[0], v[1]]),
+        lambda v: Vector(
+            [Scalar(v[0], abs_tol=0.15), reverse_fitness(Integer)(int(v[1] * 10) if math.isfinite(v[1]) else 3)]
+        ),
+    ],
+)
+def test_same_as_fitness(make_fitness):
+    r = random.Random(42)
+    values = list(zip(_random_values(r), _random_values(r)))
+    fitness = [make_fitness(v) for v in values]
+    matrix = FitnessMatrix.from_fitness(fitness)
+    assert len(matrix) == len(fitness)
+    a, b = np.meshgrid(np.arange(len(fitness)), np.arange(len(fitness)), indexing='ij')
+    assert matrix.is_fitter(a, b).tolist() == [[f1 > f2 for f2 in fitness] for f1 in fitness]
+    assert matrix.dominance().tolist() == [[f1 >> f2 for f2 in fitness] for f1 in fitness]
+
+
+def test_not_available():
+    class Custom(Scalar):
+        def is_fitter(self, other):
+            return float(self) < float(other)
+
+    assert FitnessMatrix.from_fitness([]) is None
+    assert FitnessMatrix.from_fitness([Custom(1), Custom(2)]) is None
+    assert FitnessMatrix.from_fitness([Scalar(1), Integer(2)]) is None
+    assert FitnessMatrix.from_fitness([Scalar(1), Scalar(2, abs_tol=1)]) is None
+    assert FitnessMatrix.from_fitness([Integer(1), Integer(2**60)]) is None
+    assert FitnessMatrix.from_fitness([Lexicographic([1, 2]), Lexicographic([1])]) is None
+    assert not reverse_fitness(Custom).has_objectives()
+
+
+def test_fronts():
+    r = random.Random(42)
+    fitness = [
+        Vector([Scalar(r.randint(0, 6) / 2 + r.random() / 10, abs_tol=0.2), Scalar(r.randint(0, 3))]) for _ in range(50)
+    ]
+    fronts = FitnessMatrix.from_fitness(fitness).fronts()
+    assert sorted(int(i) for f in fronts for i in f) == list(range(50))
+    for i, front in enumerate(fronts):
+        for j in front:
+            assert not any(fitness[k] >> fitness[j] for f in fronts[i:] for k in f)
+
+    # tolerances may break transitivity
+    cycle = [Vector([Scalar(a, abs_tol=0.15), Scalar(b)]) for a, b in [(0, 1), (0.1, 0), (0.2, -1)]]
+    assert cycle[0] >> cycle[1] and cycle[1] >> cycle[2] and cycle[2] >> cycle[0]
+    assert [f.tolist() for f in FitnessMatrix.from_fitness(cycle).fronts()] == [[0, 1, 2]]
+
+
+def test_population_matrix():
+    frame = byron.f.sequence([byron.f.macro('x')])
+    generator = next(op for op in byron.sys.get_operators() if op.num_parents is None)
+    population = Population(frame)
+    population += [generator(frame)[0] for _ in range(5)]
+    assert population.fitness_matrix is None
+    for v, i in population:
+        i._fitness = Scalar(v)
+    assert population.fitness_matrix.values[:, 0].tolist() == [0, 1, 2, 3, 4]
+    population.sort()
+    assert population.fitness_matrix.values[:, 0].tolist() == [4, 3, 2, 1, 0]
+    population.individuals[3:] = []
+    assert population.fitness_matrix.values[:, 0].tolist() == [4, 3, 2]
+    population += [generator(frame)[0]]
+    assert population.fitness_matrix is None
+    population[-1]._fitness = Scalar(10)
+    assert population.fitness_matrix.values[:, 0].tolist() == [4, 3, 2, 10]
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+# SPDX-License-Identifier: Apache-2.0
+
+
+import networkx as nx
+
+import byron
+from byron.global_symbols import FRAMEWORK, LINK
+from byron.classes.genome import Genome
+from byron.classes.node import NODE_ZERO
+from byron.classes.node_reference import NodeReference
+from byron.tools.graph import get_predecessor, get_structure_tree
+
+
+def test_framework_version():
+    G = Genome()
+    G.add_edge(NODE_ZERO, 1, _type=FRAMEWORK)
+    G.add_edge(1, 2, _type=FRAMEWORK)
+    G.add_edge(1, 3, _type=FRAMEWORK)
+    tree = G.structure_tree
+    version = G.framework_version
+    assert G.valid_structure and G.dfs_nodes == (0, 1, 2, 3)
+    assert G.parents == {1: 0, 2: 1, 3: 1}
+
+    # links and attributes do not touch the structure
+    G.add_edge(2, 3, key=42, _type=LINK)
+    G.remove_edge(2, 3, 42)
+    G.nodes[2]['foo'] = 'bar'
+    assert G.framework_version == version
+    assert G.structure_tree is tree
+
+    G.remove_edge(1, 3)
+    assert G.framework_version > version
+    assert G.structure_tree is not tree
+    assert not G.valid_structure and get_structure_tree(G) is None
+    G.add_edges_from([(2, 3, {'_type': FRAMEWORK})])
+    assert G.valid_structure and G.dfs_nodes == (0, 1, 2, 3)
+    assert get_predecessor(NodeReference(G, 3)) == 2
+
+
+def test_individual_genome():
+    macro = byron.f.macro('jmp {ref}', ref=byron.f.local_reference(backward=True, loop=False, forward=True))
+    byron.rrandom.seed(42)
+    generator = next(op for op in byron.sys.get_operators() if op.num_parents is None)
+    individual = generator(byron.f.bunch([macro], size=10))[0]
+    assert isinstance(individual.genome, Genome)
+    assert individual.structure_tree is individual.structure_tree
+    assert individual.nodes == tuple(nx.dfs_preorder_nodes(individual.structure_tree))
+    clone = individual.clone
+    assert isinstance(clone.genome, Genome)
+    assert isinstance(individual.canonic_representation.genome, Genome)
+    # local references only change links
+    version = clone.genome.framework_version
+    for p in clone.parameters:
+        p.mutate(1)
+    assert clone.genome.framework_version == version
@@ -97,3 +97,31 @@ def test_relabel_to_canonic_form_with_sample_graph(sample_graph):
     for i, node in enumerate(new_G.nodes):
         # The nodes should be labeled starting from 0
         assert node == Node(i), f"Node should be labeled as Node({i})"
+
+
+def test_translated_labels():
+    node = Node(42)
+    assert repr(node) == 'n42'
+    with Node.translated_labels({node: Node(3)}):
+        assert repr(node) == str(node) == f'{node}' == 'n3'
+        assert f'{node:x}' == '3'
+        assert repr(Node(7)) == 'n7'
+    assert f'{node} {node:x}' == 'n42 2a'
+
+
+def test_canonic_dump():
+    import byron
+    from byron.global_symbols import DEFAULT_EXTRA_PARAMETERS, DEFAULT_OPTIONS
+
+    jump = byron.f.macro('jmp {ref} {ref:x}', ref=byron.f.local_reference(backward=True, loop=False, forward=True))
+    value = byron.f.macro('int {v}', v=byron.f.integer_parameter(0, 10))
+    body = byron.f.bunch([jump, value], size=10)
+    extra_parameters = DEFAULT_EXTRA_PARAMETERS | DEFAULT_OPTIONS | {'$dump_node_info': True}
+
+    byron.rrandom.seed(42)
+    generator = next(op for op in byron.sys.get_operators() if op.num_parents is None)
+    for individual in generator(body):
+        # skip the header, as it contains a timestamp
+        canonic = individual.canonic_representation.dump(extra_parameters).split('\n', 1)[1]
+        assert individual.dump(extra_parameters, canonic=True).split('\n', 1)[1] == canonic
+        assert individual.dump(extra_parameters).split('\n', 1)[1] != canonic
@@ -9,11 +9,18 @@
 # Copyright 2023-24 Giovanni Squillero and Alberto Tonda
 # SPDX-License-Identifier: Apache-2.0
 
+import io
+import random
+
 import pytest
+
+import byron
+from byron.global_symbols import DEFAULT_EXTRA_PARAMETERS, DEFAULT_OPTIONS
 from byron.classes.population import Population
 from byron.classes.individual import Individual
 from byron.classes.selement import SElement
 from byron.classes.fitness import FitnessABC
+from byron.classes.node import Node
 
 
 class MockFitness(FitnessABC):
@@ -145,5 +152,191 @@ def test_string_representation(mock_population):
 # #     raise ByronError(PARANOIA_TYPE_ERROR)
 
 
+def test_dump_individual_to(tmp_path):
+    macro = byron.f.macro('{v}', v=byron.f.integer_parameter(0, 1000))
+    frame = byron.f.bunch([macro], size=50)
+    byron.rrandom.seed(42)
+    generator = next(op for op in byron.sys.get_operators() if op.num_parents is None)
+    population = Population(frame)
+    population += generator(frame)
+
+    # skip the header, as it contains a timestamp
+    stream = io.StringIO()
+    population.dump_individual_to(0, stream)
+    assert stream.getvalue().split('\n', 1)[1] == population.dump_individual(0).split('\n', 1)[1]
+    with open(tmp_path / 'phenotype.txt', 'w') as dump:
+        population[0].dump_to(dump)
+    with open(tmp_path / 'phenotype.txt') as dump:
+        assert dump.read().split('\n', 1)[1] == population[0].dump().split('\n', 1)[1]
+
+
+def test_dump_cache():
+    value = byron.f.macro('{v}', v=byron.f.integer_parameter(0, 1000))
+    jump = byron.f.macro('jmp {ref}', ref=byron.f.local_reference(backward=True, loop=False, forward=True))
+    degree = byron.f.macro('{_node.out_degree}')
+    frame = byron.f.bunch([value, jump, degree], size=30)
+    byron.rrandom.seed(42)
+    generator = next(op for op in byron.sys.get_operators() if op.num_parents is None)
+    individual = generator(frame)[0]
+
+    uncached = DEFAULT_EXTRA_PARAMETERS | DEFAULT_OPTIONS | {'_uncacheable': []}
+    reference = individual.dump(uncached, canonic=True)
+    assert individual.dump(canonic=True) == reference
+    assert 0 < len(individual._dump_cache) < len(individual.genome)
+    assert individual.dump(canonic=True) == reference
+
+    clone = individual.clone
+    assert clone._dump_cache is individual._dump_cache
+    parameter = next(p for p in clone.parameters if isinstance(p.value, int) and not isinstance(p.value, Node))
+    parameter.value = (parameter.value + 1) % 1000
+    assert clone.dump(canonic=True) == clone.dump(uncached, canonic=True) != reference
+    assert individual.dump(canonic=True) == reference
+
+
+def test_clone():
+    value = byron.f.macro('{v}', v=byron.f.integer_parameter(0, 1000))
+    jump = byron.f.macro('jmp {ref}', ref=byron.f.local_reference(backward=True, loop=False, forward=True))
+    frame = byron.f.bunch([value, jump], size=30)
+    byron.rrandom.seed(42)
+    generator = next(op for op in byron.sys.get_operators() if op.num_parents is None)
+    individual = generator(frame)[0]
+    reference = individual.dump().split('\n', 1)[1]
+
+    clone = individual.clone
+    assert clone.id != individual.id and clone.lineage.parents == (individual,)
+    assert clone.dump().split('\n', 1)[1] == reference
+    # labels and selements are shared, parameters are not
+    assert list(clone.genome) == list(individual.genome)
+    assert all(clone.genome.nodes[n]['_selement'] is individual.genome.nodes[n]['_selement'] for n in clone.genome)
+    assert not set(map(id, clone.parameters)) & set(map(id, individual.parameters))
+    assert all(p.graph is clone.genome for p in clone.parameters if hasattr(p, 'graph'))
+    for p in clone.parameters:
+        p.mutate(1)
+    assert individual.dump().split('\n', 1)[1] == reference
+    assert clone.valid and individual.valid
+
+    # crossover between an individual and its clone (the two genomes share all labels)
+    crossover = next(op for op in byron.sys.get_operators() if op.__name__ == 'node_crossover_choosy')
+    for _ in range(10):
+        for offspring in crossover(individual, clone):
+            assert offspring.valid and offspring.run_paranoia_checks()
+            assert len(offspring.genome) <= len(individual.genome) + len(clone.genome)
+
+
+def test_clone_global_reference():
+    subroutine = byron.f.sequence([byron.f.macro('sub'), byron.f.macro('ret')], name='subroutine')
+    call = byron.f.macro('call {ref}', ref=byron.f.global_reference(subroutine, creative_zeal=1))
+    frame = byron.f.sequence([byron.f.bunch([call], size=3)])
+    byron.rrandom.seed(42)
+    generator = next(op for op in byron.sys.get_operators() if op.num_parents is None)
+    individual = generator(frame)[0]
+
+    clone = individual.clone
+    references = [p for p in clone.parameters if isinstance(p, byron.classes.ParameterStructuralABC)]
+    assert references
+    for p in references:
+        assert p._target_frame == subroutine
+        p.mutate(1)
+    assert 'call' in clone.dump()
+
+
+class ParetoFitness(FitnessABC):
+    def __init__(self, *values):
+        self.values = values
+
+    def is_fitter(self, other):
+        return self.values > other.values
+
+    def is_dominant(self, other):
+        return self.values != other.values and all(a >= b for a, b in zip(self.values, other.values))
+
+    def is_distinguishable(self, other):
+        return self.values != other.values
+
+
+def _reference_sort(individuals):
+    # the original O(F·n²) algorithm
+    sorted_ = list()
+    individuals = set(individuals)
+    while individuals:
+        pareto = set(
+            i1 for i1 in individuals if all(i1.fitness == i2.fitness or i1.fitness >> i2.fitness for i2 in individuals)
+        )
+        individuals -= pareto
+        sorted_ += sorted(pareto, key=lambda i: (i.fitness, -i.id))
+    return sorted_
+
+
+@pytest.mark.parametrize(
+    'make_fitness',
+    [
+        lambda r: byron.fitness.Scalar(r.randint(0, 20) / 10, abs_tol=0.15),
+        lambda r: byron.fitness.Integer(r.randint(0, 20)),
+        lambda r: byron.fitness.reverse_fitness(byron.fitness.Scalar)(r.randint(0, 20)),
+        lambda r: byron.fitness.Lexicographic([r.randint(0, 3), r.randint(0, 3) / 2]),
+        lambda r: MockFitness(r.randint(0, 20)),
+    ],
+)
+def test_sort(make_fitness):
+    r = random.Random(42)
+    population = Population(MockSElement)
+    population._individuals = [MockIndividual(make_fitness(r)) for _ in range(100)]
+    reference = _reference_sort(population.individuals)
+    population.sort()
+    assert population.individuals == reference
+
+
+def test_sort_partial_order():
+    r = random.Random(42)
+    population = Population(MockSElement)
+    population._individuals = [MockIndividual(ParetoFitness(r.randint(0, 9), r.randint(0, 9))) for _ in range(100)]
+    assert not ParetoFitness.is_totally_ordered()
+    population.sort()
+    ranked = population.individuals
+    assert len(ranked) == 100
+    # fronts are ranked (ie. each individual is dominated by one in the previous front)
+    front = [i for i in ranked if not any(j.fitness >> i.fitness for j in ranked)]
+    assert ranked[: len(front)] == sorted(front, key=lambda i: (i.fitness, -i.id))
+    for i in ranked[len(front) :]:
+        assert not any(i.fitness >> j.fitness for j in front)
+
+
+class DominanceFitness(ParetoFitness):
+    def is_fitter(self, other):
+        return self.is_dominant(other)
+
+
+def test_sort_vector_partial_order():
+    r = random.Random(42)
+    population = Population(MockSElement)
+    population._individuals = [
+        MockIndividual(byron.fitness.Vector([DominanceFitness(r.randint(0, 9), r.randint(0, 9))])) for _ in range(50)
+    ]
+    assert not population.individuals[0].fitness.in_total_order()
+    assert byron.fitness.Vector([byron.fitness.Scalar(1), byron.fitness.Integer(2)]).in_total_order()
+    population.sort()
+    ranks = population.ranks
+    for i, r1 in zip(population.individuals, ranks):
+        assert not any(j.fitness >> i.fitness for j, r2 in zip(population.individuals, ranks) if r2 >= r1)
+
+
+def test_ranks_after_truncation(monkeypatch):
+    r = random.Random(42)
+    population = Population(MockSElement)
+    population.individuals.extend(MockIndividual(ParetoFitness(r.randint(0, 9), r.randint(0, 9))) for _ in range(100))
+    population.sort()
+    ranks = population.ranks.copy()
+
+    # removing the last individuals does not require new fronts
+    with monkeypatch.context() as m:
+        m.setattr(Population, '_fronts', lambda self: pytest.fail("fronts recomputed"))
+        population.individuals[50:] = []
+        assert list(population.ranks) == list(ranks[:50])
+        population.individuals.pop()
+        assert list(population.ranks) == list(ranks[:49])
+    population.individuals.insert(0, population.individuals.pop())
+    assert list(population.ranks) != list(ranks[:49])
+
+
 if __name__ == "__main__":
     pytest.main()
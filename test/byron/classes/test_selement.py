@@ -11,7 +11,7 @@
 
 import pytest
 import logging
-from byron.classes.selement import SElement
+from byron.classes.selement import SElement, SElementMeta
 
 
 class TestSElement:
@@ -49,6 +49,16 @@ class TestSElement:
         element = SElement()
         assert element.is_valid(None) is True
 
+    def test_get_class(self):
+        class Foo(SElement):
+            pass
+
+        assert SElementMeta.get_class(Foo.BYRON_CLASS_ID) is Foo
+        old_id = Foo.BYRON_CLASS_ID
+        Foo.baptize('test_get_class')
+        assert SElementMeta.get_class('test_get_class') is Foo
+        assert SElementMeta.get_class(old_id) is None
+
 
 @pytest.fixture
 def cleanup_node_checks():
@@ -86,3 +86,18 @@ def test_valuebag_iter():
     vb = ValueBag({"key1": "value1", "key2": "value2"})
     keys = [k for k in vb]
     assert "key1" in keys and "key2" in keys
+
+
+def test_valuebag_layered():
+    parent = ValueBag({"key1": "value1", "key2": "value2", "_hidden": 42, "$flag": True})
+    vb = ValueBag.layered(parent, {"key2": "other", "key3": "value3"})
+    assert vb["key1"] == "value1" and vb.key2 == "other" and vb["$flag"] is True
+    assert vb["$missing_flag"] is False
+    assert "key1" in vb and "key3" in vb and "key4" not in vb
+    assert vb.get("_hidden") == 42 and vb.get("key4", 0) == 0
+    assert set(vb.keys()) == {"key1", "key2", "key3", "_hidden"}
+    assert dict(vb._items()) == {"key1": "value1", "key2": "other", "key3": "value3", "_hidden": 42, "$flag": True}
+    assert vb == ValueBag(dict(vb._items()))
+    assert parent["key2"] == "value2"
+    with pytest.raises(NotImplementedError):
+        vb["key1"] = "new_value"
@@ -40,3 +40,23 @@ def test_shared():
         i3.mutate()
         assert i1.value == i2.value
         assert i1.value != i3.value
+
+
+def test_array_mutate():
+    array = byron.f.array_parameter("01X", 256)
+    p = array()
+    byron.rrandom.seed(42)
+    p.mutate(1)
+    assert array().is_correct(p.value)
+    original = p.value
+    p.mutate(0)
+    assert p.value == original
+    p.mutate(0.5)
+    assert array().is_correct(p.value) and 0 < sum(a != b for a, b in zip(original, p.value)) < 256
+    mutated = p.value
+
+    byron.rrandom.seed(42)
+    p.mutate(1)
+    p.mutate(0)
+    p.mutate(0.5)
+    assert p.value == mutated
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+import byron
+from byron.classes.population import Population
+from byron.ea.selection import batch_tournament_selection
+from byron.fitness import Integer
+
+
+@pytest.fixture
+def population():
+    frame = byron.f.sequence([byron.f.macro('x')])
+    generator = next(op for op in byron.sys.get_operators() if op.num_parents is None)
+    population = Population(frame)
+    population += [generator(frame)[0] for _ in range(20)]
+    for n, i in population:
+        i._fitness = Integer(n // 2)
+    return population
+
+
+@pytest.mark.parametrize('tournament_size', [1, 2, 3.5])
+def test_batch_tournament_selection(population, tournament_size):
+    byron.rrandom.seed(42)
+    winners = batch_tournament_selection(population, 100, tournament_size)
+    byron.rrandom.seed(42)
+    assert batch_tournament_selection(population, 100, tournament_size) == winners
+
+    # same draws, one tournament at a time
+    byron.rrandom.seed(42)
+    size = int(tournament_size) + (tournament_size % 1 > 0)
+    candidates = byron.rrandom.random_ints(100 * size, 0, len(population)).reshape(100, size).tolist()
+    if tournament_size % 1:
+        for c, participates in zip(candidates, byron.rrandom.random_floats(100) < tournament_size % 1):
+            if not participates:
+                c.pop()
+    assert winners == [max((population[c] for c in row), key=lambda i: i.fitness) for row in candidates]
+
+
+def test_tournament_pressure(population):
+    byron.rrandom.seed(42)
+    fitness = {
+        size: np.mean([int(i.fitness) for i in batch_tournament_selection(population, 2000, size)])
+        for size in (1, 1.5, 2, 4)
+    }
+    assert fitness[1] < fitness[1.5] < fitness[2] < fitness[4]
+    assert batch_tournament_selection(population, 0) == []
@@ -90,6 +90,8 @@ def test_simple():
     assert rev_approximate(13) >= rev_approximate(17)
     assert not rev_approximate(13) < rev_approximate(17)
     assert not rev_approximate(13) <= rev_approximate(17)
+    assert rev_approximate(13) >> rev_approximate(17)
+    assert not rev_approximate(17) >> rev_approximate(13)
     #
     if byron.paranoia_mode:
         with pytest.raises(AssertionError):
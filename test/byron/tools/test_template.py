@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from byron.classes.value_bag import ValueBag
+from byron.tools.template import compile_template
+
+
+class Thing:
+    name = 'thing'
+    width = 6
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '',
+        'just text {{escaped}}',
+        '{a} and {b!r} and {a!s:>5}',
+        '{a:{width}} {thing.name:^{thing.width}} {items[1]} {table[key]}',
+        '0x{n:04X} {f:.3f}',
+    ],
+)
+def test_template(text):
+    values = dict(a='A', b='B', width=4, thing=Thing, items=[10, 20], table={'key': 'value'}, n=255, f=1 / 3)
+    template = compile_template(text)
+    assert template is compile_template(text)
+    assert template.render(values) == text.format(**values)
+    assert template.render(ValueBag(values)) == text.format(**ValueBag(values))
+    assert template.fields <= values.keys()
+
+
+@pytest.mark.parametrize("text", ['{', '{0}', '{} {}', '{$flag}'])
+def test_template_fallback(text):
+    template = compile_template(text)
+    assert template.fields is None
+    with pytest.raises(Exception) as expected:
+        text.format(**ValueBag({'$flag': True}))
+    with pytest.raises(expected.type):
+        template.render(ValueBag({'$flag': True}))
+
+
+def test_template_missing_field():
+    with pytest.raises(KeyError):
+        compile_template('{missing}').render(ValueBag())
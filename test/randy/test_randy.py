@@ -73,3 +73,54 @@ def test_randy_shuffle():
     byron.rrandom.shuffle(base)
     assert base != list(range(1000))
     assert set(base) == set(list(range(1000)))
+
+
+def test_randy_bulk():
+    seed = random.randint(0, 1_000_000)
+    byron.rrandom.seed(seed)
+    v1 = byron.rrandom.random_ints(BATCH_SIZE, 3, 7)
+    f1 = byron.rrandom.random_floats(BATCH_SIZE, -1, 1)
+    byron.rrandom.seed(seed)
+    assert (byron.rrandom.random_ints(BATCH_SIZE, 3, 7) == v1).all()
+    assert (byron.rrandom.random_floats(BATCH_SIZE, -1, 1) == f1).all()
+    assert set(v1.tolist()) == {3, 4, 5, 6}
+    assert ((-1 <= f1) & (f1 < 1)).all()
+
+
+def test_randy_weighted_choice():
+    seq = ['apple', 'banana', 'cherry', 'durian']
+    p = [0.1, 0.2, 0.3, 0.4]
+    byron.rrandom.seed(42)
+    values = [byron.rrandom.weighted_choice(seq, p) for _ in range(BATCH_SIZE)]
+    byron.rrandom.seed(42)
+    reference = list()
+    for _ in range(BATCH_SIZE):
+        r = byron.rrandom.random_float()
+        reference.append(next(v for i, v in enumerate(seq) if sum(p[0 : i + 1]) >= r))
+    assert values == reference
+
+    sampler = byron.randy.WeightedSampler(seq, p)
+    byron.rrandom.seed(42)
+    assert [byron.rrandom.weighted_choice(sampler) for _ in range(BATCH_SIZE)] == values
+    byron.rrandom.seed(42)
+    choices = byron.rrandom.weighted_choices(sampler, BATCH_SIZE)
+    byron.rrandom.seed(42)
+    assert byron.rrandom.weighted_choices(seq, BATCH_SIZE, p) == choices
+    assert [choices.count(v) for v in seq] == sorted(choices.count(v) for v in seq)
+    assert byron.rrandom.weighted_choices(seq, 10, [0, 0, 1, 0]) == ['cherry'] * 10
+
+
+def test_randy_bulk_same_as_single():
+    for kwargs in [dict(), dict(loc=3.0, sigma=0.3), dict(loc=1.0, scale=2.0)]:
+        byron.rrandom.seed(42)
+        values = [byron.rrandom.random_float(0, 10, **kwargs) for _ in range(BATCH_SIZE)]
+        byron.rrandom.seed(42)
+        assert byron.rrandom.random_floats(BATCH_SIZE, 0, 10, **kwargs).tolist() == values
+        byron.rrandom.seed(42)
+        values = [byron.rrandom.random_int(0, 10, **kwargs) for _ in range(BATCH_SIZE)]
+        byron.rrandom.seed(42)
+        assert byron.rrandom.random_ints(BATCH_SIZE, 0, 10, **kwargs).tolist() == values
+    byron.rrandom.seed(42)
+    values = [byron.rrandom.choice('ABCDEF', loc=2, sigma=0.5) for _ in range(BATCH_SIZE)]
+    byron.rrandom.seed(42)
+    assert byron.rrandom.choices('ABCDEF', BATCH_SIZE, loc=2, sigma=0.5) == values
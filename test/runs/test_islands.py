@@ -0,0 +1,81 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+# SPDX-License-Identifier: Apache-2.0
+
+
+import pytest
+import byron as byron
+from byron.ea.islands import _encode, _decode
+
+
+@byron.fitness_function
+def fitness(genotype: str):
+    """Vanilla 1-max"""
+    return sum(b == '1' for b in genotype)
+
+
+@pytest.mark.filterwarnings("ignore:::byron")
+def test_genome_serialization():
+    word = byron.f.macro('{w} {r}', w=byron.f.array_parameter('01', 8), r=byron.f.local_reference(backward=True))
+    frame = byron.f.sequence([byron.f.macro('start:'), byron.f.bunch([word], size=(2, 6))])
+    evaluator = byron.evaluator.PythonEvaluator(fitness)
+    byron.rrandom.seed(42)
+    population = byron.ea.vanilla_ea(frame, evaluator, mu=5, max_generation=2)
+
+    clones = _decode(frame, _encode(population.individuals))
+    for original, clone in zip(population.individuals, clones):
+        assert population.dump_individual(original) == population.dump_individual(clone)
+        assert original.fitness == clone.fitness
+
+
+@pytest.mark.filterwarnings("ignore:::byron")
+@pytest.mark.parametrize("topology", ['ring', 'random'])
+def test_island_model(topology):
+    macro = byron.f.macro('{v}', v=byron.f.array_parameter('01', 20))
+    frame = byron.f.sequence([macro])
+    evaluator = byron.evaluator.PythonEvaluator(fitness, strip_phenotypes=True)
+
+    reference = byron.ea.island_model(
+        frame, evaluator, num_islands=3, max_generation=6, migration_interval=2, topology=topology, seed=42, mu=5
+    )
+    assert len(reference) == 3
+    assert all(len(p) == 5 for p in reference)
+
+    other = byron.ea.island_model(
+        frame, evaluator, num_islands=3, max_generation=6, migration_interval=2, topology=topology, seed=42, mu=5
+    )
+    for r, o in zip(reference, other):
+        assert [i.fitness for i in r.individuals] == [i.fitness for i in o.individuals]
+
+
+@pytest.mark.filterwarnings("ignore:::byron")
+def test_island_model_adaptive():
+    macro = byron.f.macro('{v}', v=byron.f.array_parameter('01', 20))
+    frame = byron.f.sequence([macro])
+    evaluator = byron.evaluator.PythonEvaluator(fitness, strip_phenotypes=True)
+
+    populations = byron.ea.island_model(
+        frame, evaluator, algorithm=byron.ea.adaptive_ea, num_islands=2, max_generation=6, migration_interval=2, mu=5
+    )
+    assert all(len(p) == 5 for p in populations)
+
+
+def test_on_generation():
+    macro = byron.f.macro('{v}', v=byron.f.array_parameter('01', 20))
+    frame = byron.f.sequence([macro])
+    evaluator = byron.evaluator.PythonEvaluator(fitness)
+
+    generations = list()
+    byron.rrandom.seed(42)
+    byron.ea.vanilla_ea(
+        frame, evaluator, mu=5, max_generation=4, on_generation=lambda p: generations.append(p.generation)
+    )
+    assert generations == [1, 2, 3, 4]
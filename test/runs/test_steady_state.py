@@ -0,0 +1,60 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+# SPDX-License-Identifier: Apache-2.0
+
+
+import time
+
+import pytest
+import byron as byron
+
+
+@byron.fitness_function
+def fitness(genotype: str):
+    """Vanilla 1-max"""
+    return sum(b == '1' for b in genotype)
+
+
+@byron.fitness_function
+def slow_fitness(genotype: str):
+    """1-max taking its time"""
+    time.sleep(0.001 * genotype.count('1'))
+    return sum(b == '1' for b in genotype)
+
+
+@pytest.mark.filterwarnings("ignore:::byron")
+@pytest.mark.parametrize("replacement", ['worst', 'oldest'])
+def test_steady_state(replacement):
+    macro = byron.f.macro('{v}', v=byron.f.array_parameter('01', 20))
+    frame = byron.f.sequence([macro])
+
+    evaluator = byron.evaluator.PythonEvaluator(fitness, strip_phenotypes=True)
+    byron.rrandom.seed(42)
+    population = byron.ea.steady_state_ea(frame, evaluator, mu=10, max_evaluations=100, max_in_flight=1)
+    assert len(population) == 10
+    assert 100 <= evaluator.fitness_calls - 10 <= 101
+    assert population.individuals == sorted(population.individuals, key=lambda i: i.fitness, reverse=True)
+
+
+@pytest.mark.filterwarnings("ignore:::byron")
+def test_steady_state_in_flight():
+    macro = byron.f.macro('{v}', v=byron.f.array_parameter('01', 20))
+    frame = byron.f.sequence([macro])
+
+    evaluator = byron.evaluator.PythonEvaluator(slow_fitness, strip_phenotypes=True, backend='thread_pool')
+    population = byron.ea.steady_state_ea(frame, evaluator, mu=10, max_evaluations=200, max_in_flight=4)
+    assert len(population) == 10
+    assert all(i.finalized for _, i in population)
+    evaluator.close()
+
+    evaluator = byron.evaluator.PythonEvaluator(fitness, strip_phenotypes=True)
+    population = byron.ea.steady_state_ea(frame, evaluator, mu=10, max_evaluations=1_000, max_fitness=20)
+    assert population[0].fitness == byron.fitness.make_fitness(20)
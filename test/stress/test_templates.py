@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+##################################@|###|##################################@#
+#   _____                          |   |                                   #
+#  |  __ \--.--.----.-----.-----.  |===|  This file is part of Byron       #
+#  |  __ <  |  |   _|  _  |     |  |___|  Evolutionary optimizer & fuzzer  #
+#  |____/ ___  |__| |_____|__|__|   ).(   v0.8a1 "Don Juan"                #
+#        |_____|                    \|/                                    #
+#################################### ' #####################################
+# Copyright 2023-24 Giovanni Squillero and Alberto Tonda
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import byron
+from byron.global_symbols import *
+from byron.classes.node_reference import NodeReference
+from byron.classes.node_view import NodeView
+from byron.classes.value_bag import ValueBag
+
+
+@pytest.mark.avoidable
+def test_precompiled_templates():
+    instruction = byron.f.macro(
+        'add r{a}, r{b}, #{c:#x}',
+        a=byron.f.integer_parameter(0, 16),
+        b=byron.f.integer_parameter(0, 16),
+        c=byron.f.integer_parameter(0, 256),
+    )
+    frame = byron.f.bunch([instruction], size=10_000)
+    generator = next(op for op in byron.sys.get_operators() if op.num_parents is None)
+    individual = generator(frame)[0]
+
+    G = individual.genome
+    bags = [
+        (
+            G.nodes[n]['_selement'],
+            ValueBag(DEFAULT_EXTRA_PARAMETERS | {'_node': NodeView(NodeReference(G, n))} | G.nodes[n]),
+        )
+        for n in G
+        if G.nodes[n]['_type'] == MACRO_NODE and n != 0
+    ]
+    assert len(bags) == 10_000
+
+    formatted = [m.text.format(**b) for m, b in bags]
+    rendered = [m.dump(b) for m, b in bags]
+    assert rendered == formatted